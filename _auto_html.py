@@ -1,264 +1,182 @@
+"""
+Generates `seamless/html/_elements.py`, the classes of the HTML elements, from
+the `ELEMENTS` table.
+
+    python _auto_html.py
+"""
 import pathlib
 
 HERE = pathlib.Path(__file__).parent
-HTML_FILES = HERE / "seamless/html"
-
-# with open(HERE / "__init__.py", "w") as f:
-#     items = []
-#     for file in HERE.iterdir():
-#         if file.name.startswith("_") or file.suffix != ".py":
-#             continue
-
-#         capitalized = file.stem.capitalize()
-#         items.append(capitalized)
-#         print(f"from .{file.stem} import {capitalized}", file=f)
-
-#     all = "\n".join(f'\t"{item}",' for item in items)
-#     print(f"\n__all__ = [\n{all}\n]", file=f)
-
-
-html_map = {
-    "A": "HTMLAnchorElement",
-    "Area": "HTMLAreaElement",
-    "Audio": "HTMLAudioElement",
-    "Br": "HTMLBRElement",
-    "Base": "HTMLBaseElement",
-    "Body": "HTMLBodyElement",
-    "Button": "HTMLButtonElement",
-    "Canvas": "HTMLCanvasElement",
-    "Caption": "HTMLTableCaptionElement",
-    "Col": "HTMLTableColElement",
-    "ColGroup": "HTMLTableColElement",
-    "Data": "HTMLDataElement",
-    "DataList": "HTMLDataListElement",
-    "Del": "HTMLModElement",
-    "Details": "HTMLDetailsElement",
-    "Dialog": "HTMLDialogElement",
-    "Div": "HTMLDivElement",
-    "Embed": "HTMLEmbedElement",
-    "FieldSet": "HTMLFieldSetElement",
-    "Form": "HTMLFormElement",
-    "H1": "HTMLHeadingElement",
-    "H2": "HTMLHeadingElement",
-    "H3": "HTMLHeadingElement",
-    "H4": "HTMLHeadingElement",
-    "H5": "HTMLHeadingElement",
-    "H6": "HTMLHeadingElement",
-    "Hr": "HTMLHRElement",
-    "Head": "HTMLHeadElement",
-    "Heading": "HTMLHeadingElement",
-    "Html": "HTMLHtmlElement",
-    "IFrame": "HTMLIFrameElement",
-    "Image": "HTMLImageElement",
-    "Input": "HTMLInputElement",
-    "Ins": "HTMLModElement",
-    "Li": "HTMLListItemElement",
-    "Label": "HTMLLabelElement",
-    "Legend": "HTMLLegendElement",
-    "Link": "HTMLLinkElement",
-    "Map": "HTMLMapElement",
-    "Meter": "HTMLMeterElement",
-    "Object": "HTMLObjectElement",
-    "Ol": "HTMLOrderedListElement",
-    "OptGroup": "HTMLOptGroupElement",
-    "Option": "HTMLOptionElement",
-    "Output": "HTMLOutputElement",
-    "P": "HTMLParagraphElement",
-    "Param": "HTMLParamElement",
-    "Picture": "HTMLPictureElement",
-    "Pre": "HTMLPreElement",
-    "Progress": "HTMLProgressElement",
-    "Q": "HTMLQuoteElement",
-    "Script": "HTMLScriptElement",
-    "Select": "HTMLSelectElement",
-    "Slot": "HTMLSlotElement",
-    "Source": "HTMLSourceElement",
-    "Span": "HTMLSpanElement",
-    "Style": "HTMLStyleElement",
-    "Table": "HTMLTableElement",
-    "TBody": "HTMLTableSectionElement",
-    "Td": "HTMLTableDataCellElement",
-    "TFoot": "HTMLTableSectionElement",
-    "Th": "HTMLTableHeaderCellElement",
-    "THead": "HTMLTableSectionElement",
-    "Tr": "HTMLTableRowElement",
-    "Template": "HTMLTemplateElement",
-    "TextArea": "HTMLTextAreaElement",
-    "Time": "HTMLTimeElement",
-    "Title": "HTMLTitleElement",
-    "Track": "HTMLTrackElement",
-    "Ul": "HTMLUnorderedListElement",
-    "Video": "HTMLVideoElement",
-}
-
-html_classes = [
-    "A",
-    "Abbr",
-    "Address",
-    "Area",
-    "Article",
-    "Aside",
-    "Audio",
-    "B",
-    "Base",
-    "Bdi",
-    "Bdo",
-    "BlockQuote",
-    "Body",
-    "Br",
-    "Button",
-    "Canvas",
-    "Caption",
-    "Cite",
-    "Code",
-    "Col",
-    "ColGroup",
-    "Data",
-    "DataList",
-    "Dd",
-    "Del",
-    "Details",
-    "Dfn",
-    "Dialog",
-    "Div",
-    "Dl",
-    "Dt",
-    "Em",
-    "Embed",
-    "FieldSet",
-    "FigCaption",
-    "Figure",
-    "Footer",
-    "Form",
-    "H1",
-    "H2",
-    "H3",
-    "H4",
-    "H5",
-    "H6",
-    "Head",
-    "Header",
-    "HGroup",
-    "Hr",
-    "Html",
-    "I",
-    "IFrame",
-    "Img",
-    "Input",
-    "Ins",
-    "Kbd",
-    "Label",
-    "Legend",
-    "Li",
-    "Link",
-    "Main",
-    "Map",
-    "Mark",
-    "Menu",
-    "Meta",
-    "Meter",
-    "Nav",
-    "NoScript",
-    "Object",
-    "Ol",
-    "OptGroup",
-    "Option",
-    "Output",
-    "P",
-    "Param",
-    "Picture",
-    "Pre",
-    "Progress",
-    "Q",
-    "Rp",
-    "Rt",
-    "Ruby",
-    "S",
-    "Samp",
-    "Script",
-    "Search",
-    "Section",
-    "Select",
-    "Slot",
-    "Small",
-    "Source",
-    "Span",
-    "Strong",
-    "Style",
-    "Sub",
-    "Summary",
-    "Sup",
-    "Svg",
-    "Table",
-    "TBody",
-    "Td",
-    "Template",
-    "TextArea",
-    "TFoot",
-    "Th",
-    "THead",
-    "Time",
-    "Title",
-    "Tr",
-    "Track",
-    "U",
-    "Ul",
-    "Var",
-    "Video",
-    "Wbr",
+ELEMENTS_FILE = HERE / "seamless/html/_elements.py"
+
+# The class name, tag name, props `TypedDict` and whether the element is void
+# (has no closing tag) of every element. `Meta` and `Fragment` are defined by
+# hand in their own modules.
+ELEMENTS = [
+    ("A", "a", "HTMLAnchorElement", False),
+    ("Abbr", "abbr", "HTMLElementProps", False),
+    ("Address", "address", "HTMLElementProps", False),
+    ("Area", "area", "HTMLAreaElement", True),
+    ("Article", "article", "HTMLElementProps", False),
+    ("Aside", "aside", "HTMLElementProps", False),
+    ("Audio", "audio", "HTMLAudioElement", False),
+    ("B", "b", "HTMLElementProps", False),
+    ("Base", "base", "HTMLBaseElement", True),
+    ("Bdi", "bdi", "HTMLElementProps", False),
+    ("Bdo", "bdo", "HTMLElementProps", False),
+    ("BlockQuote", "blockquote", "HTMLElementProps", False),
+    ("Body", "body", "HTMLBodyElement", False),
+    ("Br", "br", "HTMLBRElement", True),
+    ("Button", "button", "HTMLButtonElement", False),
+    ("Canvas", "canvas", "HTMLCanvasElement", False),
+    ("Caption", "caption", "HTMLTableCaptionElement", False),
+    ("Cite", "cite", "HTMLElementProps", False),
+    ("Code", "code", "HTMLElementProps", False),
+    ("Col", "col", "HTMLTableColElement", True),
+    ("ColGroup", "colgroup", "HTMLTableColElement", False),
+    ("Data", "data", "HTMLDataElement", False),
+    ("DataList", "datalist", "HTMLDataListElement", False),
+    ("Dd", "dd", "HTMLElementProps", False),
+    ("Del", "del", "HTMLModElement", False),
+    ("Details", "details", "HTMLDetailsElement", False),
+    ("Dfn", "dfn", "HTMLElementProps", False),
+    ("Dialog", "dialog", "HTMLDialogElement", False),
+    ("Div", "div", "HTMLDivElement", False),
+    ("Dl", "dl", "HTMLElementProps", False),
+    ("Dt", "dt", "HTMLElementProps", False),
+    ("Em", "em", "HTMLElementProps", False),
+    ("Embed", "embed", "HTMLEmbedElement", True),
+    ("FieldSet", "fieldset", "HTMLFieldSetElement", False),
+    ("FigCaption", "figcaption", "HTMLElementProps", False),
+    ("Figure", "figure", "HTMLElementProps", False),
+    ("Footer", "footer", "HTMLElementProps", False),
+    ("Form", "form", "HTMLFormElement", False),
+    ("H1", "h1", "HTMLHeadingElement", False),
+    ("H2", "h2", "HTMLHeadingElement", False),
+    ("H3", "h3", "HTMLHeadingElement", False),
+    ("H4", "h4", "HTMLHeadingElement", False),
+    ("H5", "h5", "HTMLHeadingElement", False),
+    ("H6", "h6", "HTMLHeadingElement", False),
+    ("Head", "head", "HTMLHeadElement", False),
+    ("Header", "header", "HTMLElementProps", False),
+    ("HGroup", "hgroup", "HTMLElementProps", False),
+    ("Hr", "hr", "HTMLHRElement", True),
+    ("Html", "html", "HTMLHtmlElement", False),
+    ("I", "i", "HTMLElementProps", False),
+    ("IFrame", "iframe", "HTMLIFrameElement", False),
+    ("Img", "img", "HTMLElementProps", True),
+    ("Input", "input", "HTMLInputElement", True),
+    ("Ins", "ins", "HTMLModElement", False),
+    ("Kbd", "kbd", "HTMLElementProps", False),
+    ("Label", "label", "HTMLLabelElement", False),
+    ("Legend", "legend", "HTMLLegendElement", False),
+    ("Li", "li", "HTMLListItemElement", False),
+    ("Link", "link", "HTMLLinkElement", True),
+    ("Main", "main", "HTMLElementProps", False),
+    ("Map", "map", "HTMLMapElement", False),
+    ("Mark", "mark", "HTMLElementProps", False),
+    ("Menu", "menu", "HTMLElementProps", False),
+    ("Meter", "meter", "HTMLMeterElement", False),
+    ("Nav", "nav", "HTMLElementProps", False),
+    ("NoScript", "noscript", "HTMLElementProps", False),
+    ("Object", "object", "HTMLObjectElement", False),
+    ("Ol", "ol", "HTMLOrderedListElement", False),
+    ("OptGroup", "optgroup", "HTMLOptGroupElement", False),
+    ("Option", "option", "HTMLOptionElement", False),
+    ("Output", "output", "HTMLOutputElement", False),
+    ("P", "p", "HTMLParagraphElement", False),
+    ("Param", "param", "HTMLParamElement", True),
+    ("Picture", "picture", "HTMLPictureElement", False),
+    ("Pre", "pre", "HTMLPreElement", False),
+    ("Progress", "progress", "HTMLProgressElement", False),
+    ("Q", "q", "HTMLQuoteElement", False),
+    ("Rp", "rp", "HTMLElementProps", False),
+    ("Rt", "rt", "HTMLElementProps", False),
+    ("Ruby", "ruby", "HTMLElementProps", False),
+    ("S", "s", "HTMLElementProps", False),
+    ("Samp", "samp", "HTMLElementProps", False),
+    ("Script", "script", "HTMLScriptElement", False),
+    ("Search", "search", "HTMLElementProps", False),
+    ("Section", "section", "HTMLElementProps", False),
+    ("Select", "select", "HTMLSelectElement", False),
+    ("Slot", "slot", "HTMLSlotElement", False),
+    ("Small", "small", "HTMLElementProps", False),
+    ("Source", "source", "HTMLSourceElement", True),
+    ("Span", "span", "HTMLSpanElement", False),
+    ("Strong", "strong", "HTMLElementProps", False),
+    ("Style", "style", "HTMLStyleElement", False),
+    ("Sub", "sub", "HTMLElementProps", False),
+    ("Summary", "summary", "HTMLElementProps", False),
+    ("Sup", "sup", "HTMLElementProps", False),
+    ("Svg", "svg", "HTMLElementProps", False),
+    ("Table", "table", "HTMLTableElement", False),
+    ("TBody", "tbody", "HTMLTableSectionElement", False),
+    ("Td", "td", "HTMLTableDataCellElement", False),
+    ("Template", "template", "HTMLTemplateElement", False),
+    ("TextArea", "textarea", "HTMLTextAreaElement", False),
+    ("TFoot", "tfoot", "HTMLTableSectionElement", False),
+    ("Th", "th", "HTMLTableHeaderCellElement", False),
+    ("THead", "thead", "HTMLTableSectionElement", False),
+    ("Time", "time", "HTMLTimeElement", False),
+    ("Title", "title", "HTMLTitleElement", False),
+    ("Tr", "tr", "HTMLTableRowElement", False),
+    ("Track", "track", "HTMLTrackElement", True),
+    ("U", "u", "HTMLElementProps", False),
+    ("Ul", "ul", "HTMLUnorderedListElement", False),
+    ("Var", "var", "HTMLElementProps", False),
+    ("Video", "video", "HTMLVideoElement", False),
+    ("Wbr", "wbr", "HTMLElementProps", True),
 ]
 
-inline_html_classes = [
-    "Area",
-    "Base",
-    "Br",
-    "Col",
-    "Embed",
-    "Hr",
-    "Img",
-    "Input",
-    "Link",
-    "Meta",
-    "Param",
-    "Source",
-    "Track",
-    "Wbr",
-]
+header = '''"""
+The HTML elements, generated by `_auto_html.py` - do not edit by hand.
 
-html_map = {key: html_map.get(key, "HTMLElementProps") for key in html_classes}
+The elements have no `__init__` of their own, so constructing one calls
+`Element.__init__` directly. The typed signatures are for type checkers only.
+"""
+from typing import TYPE_CHECKING, Unpack
 
-template = """from typing import TYPE_CHECKING, Unpack
 from ..element import Element
 
 if TYPE_CHECKING:
-    from ..types.html import {props_class_name}
     from ..types import ChildType
+    from ..types.html import (
+{props_imports}
+    )
+
+'''
+
+template = '''
 
 class {class_name}(Element):
-    def __init__(self, *children: "ChildType", **kwargs: Unpack["{props_class_name}"]):
-        super().__init__(*children, **kwargs)
+    __slots__ = ()
 
-    tag_name = "{class_name_lower}"{inline}
-"""
+    tag_name = "{tag_name}"{inline}
 
-inline_string = "\n    inline = True"
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["{props_class_name}"]): ...
+'''
 
-lower_keys = {key.lower(): key for key in html_map}
+inline_string = "\n    inline = True"
 
-for cls, props in html_map.items():
-    class_name = cls
-    class_name_lower = class_name.lower()
-    props_class_name = props
-    filename = f"{class_name_lower}.py"
-    inline = inline_string if class_name in inline_html_classes else ""
 
-    if class_name == "Meta":
-        continue
+def main():
+    props_classes = sorted({props for _, _, props, _ in ELEMENTS})
+    all_names = "\n".join(f'    "{class_name}",' for class_name, *_ in ELEMENTS)
 
-    if class_name == "Del":
-        filename = "del_.py"
+    with open(ELEMENTS_FILE, "w") as f:
+        f.write(header.format(props_imports="\n".join(f"        {props}," for props in props_classes)))
+        f.write(f"__all__ = [\n{all_names}\n]\n")
+        for class_name, tag_name, props_class_name, void in ELEMENTS:
+            f.write(
+                template.format(
+                    class_name=class_name,
+                    tag_name=tag_name,
+                    props_class_name=props_class_name,
+                    inline=inline_string if void else "",
+                )
+            )
 
-    with open(HTML_FILES / filename, "w") as f:
-        f.write(template.format(class_name=class_name, class_name_lower=class_name_lower, props_class_name=props_class_name, inline=inline))
 
-    
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Payloads per second sent to 10k sockets in a room, rendering and emitting the
+component for each socket versus broadcasting it, rendered and encoded once.
+
+The sockets are connected to the socket.io manager only, and the engine.io
+packets are counted instead of being written to a transport.
+
+    python -m benchmarks.bench_broadcast
+"""
+import asyncio
+
+from seamless import Component, Div, Span
+from seamless.middlewares import ASGIMiddleware
+from seamless.rendering.json import to_dict
+
+from .common import compare
+
+SOCKETS = 10_000
+
+
+class StatusBoard(Component):
+    def render(self):
+        return Div(
+            *[
+                Div(Span(f"Service {index}"), Span("OK", class_name="ok"), class_name="row")
+                for index in range(20)
+            ],
+            class_name="status-board",
+        )
+
+
+async def app(scope, receive, send): ...
+
+
+def main():
+    middleware = ASGIMiddleware(app)
+    server = middleware.server
+    sent = 0
+
+    async def send_eio_packet(eio_sid, packet):
+        nonlocal sent
+        sent += 1
+
+    server._send_eio_packet = send_eio_packet
+
+    loop = asyncio.new_event_loop()
+
+    async def connect():
+        sids = [await server.manager.connect(f"eio-{index}", "/") for index in range(SOCKETS)]
+        for sid in sids:
+            await middleware.join(sid, "status")
+        return sids
+
+    sids = loop.run_until_complete(connect())
+
+    async def per_socket():
+        for sid in sids:
+            await server.emit("broadcast", ("status", to_dict(StatusBoard())), to=sid)
+
+    async def broadcast():
+        await middleware.broadcast("status", StatusBoard())
+
+    try:
+        results = compare(
+            {
+                "per socket": lambda: loop.run_until_complete(per_socket()),
+                "broadcast": lambda: loop.run_until_complete(broadcast()),
+            },
+            repeat=3,
+        )
+    finally:
+        loop.close()
+
+    print(f"Payloads per second, {SOCKETS} sockets ({sent} packets sent)")
+    baseline = results["per socket"]
+    for name, seconds in results.items():
+        print(f"  {name:<10}  {SOCKETS / seconds:10.0f}/s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Construction time and memory of elements, the generated classes that call
+`Element.__init__` directly and have `__slots__`, versus the per-module classes
+that forwarded their arguments to it from their own `__init__`.
+
+    python -m benchmarks.bench_elements
+"""
+import tracemalloc
+
+from seamless import Div
+from seamless.internal import to_iter
+
+from .common import compare, report
+
+COUNT = 100_000
+
+
+class DictElement:
+    """`Element` without `__slots__`."""
+
+    def __init__(self, *args, children=None, **kwargs):
+        self.children = tuple(to_iter(children or args))
+        self.props = kwargs
+
+
+class ForwardingDiv(DictElement):
+    def __init__(self, *children, **kwargs):
+        super().__init__(*children, **kwargs)
+
+    tag_name = "div"
+
+
+def construct(cls):
+    return [cls("Hello", class_name="greeting") for _ in range(COUNT)]
+
+
+def allocated(cls) -> float:
+    """
+    Returns the memory taken by the constructed elements, in megabytes.
+    """
+    tracemalloc.start()
+    elements = construct(cls)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del elements
+    return size / 1e6
+
+
+def main():
+    report(
+        f"Constructing {COUNT:,} elements",
+        compare(
+            {
+                "forwarding": lambda: construct(ForwardingDiv),
+                "generated": lambda: construct(Div),
+            },
+            repeat=10,
+        ),
+    )
+    report(
+        f"Memory of {COUNT:,} elements",
+        {"forwarding": allocated(ForwardingDiv), "generated": allocated(Div)},
+        unit="MB",
+    )
+
+
+if __name__ == "__main__":
+    main()
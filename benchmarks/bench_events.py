@@ -0,0 +1,92 @@
+"""
+Events per second dispatched through the `event` route of the socket router,
+inspecting the handler on every event versus invocation plans created when the
+action is registered.
+
+    python -m benchmarks.bench_events
+"""
+import asyncio
+from inspect import iscoroutinefunction, signature
+
+from seamless import Component, Div
+from seamless.context.database import DB
+from seamless.context.executor import inline
+from seamless.context.request import WSRequest, request_context
+from seamless.context.ws_router import event
+from seamless.core import SocketID
+from seamless.internal import _obj, validation_model
+from seamless.types.events import MouseEvent
+
+from .common import compare
+
+EVENTS = 5000
+SOCKET_ID = "benchmark-socket"
+
+
+class Counter(Component):
+    def __init__(self):
+        self.count = 0
+
+    def render(self):
+        return Div(self.count)
+
+    # Inline, so the benchmark measures the invocation and not the thread pool.
+    @inline
+    def increment(self, event: MouseEvent, socket_id: SocketID):
+        self.count += 1
+
+
+async def inspecting_event(handler, data, scope):
+    data = list(data)
+    for index, param in enumerate(signature(handler).parameters.values()):
+        if param.annotation is SocketID:
+            data.insert(index, scope)
+
+    validation = validation_model(handler)
+    if validation is None:
+        args = [_obj(arg) if isinstance(arg, dict) else arg for arg in data]
+        result = handler(*args)
+    else:
+        model, parameters = validation
+        arguments = model(**dict(zip(parameters, data)))
+        result = handler(**{name: getattr(arguments, name) for name in parameters})
+
+    if iscoroutinefunction(handler):
+        return await result
+    return result
+
+
+def main():
+    with request_context(WSRequest(SOCKET_ID)):
+        action = DB.add_event(Counter().increment)
+    mouse_event = {"type": "click", "clientX": 10, "clientY": 20}
+
+    async def inspecting():
+        for _ in range(EVENTS):
+            await inspecting_event(action.callback, (mouse_event,), SOCKET_ID)
+
+    async def planned():
+        for _ in range(EVENTS):
+            await event(SOCKET_ID, action.id, mouse_event)
+
+    loop = asyncio.new_event_loop()
+    try:
+        results = compare(
+            {
+                "inspecting": lambda: loop.run_until_complete(inspecting()),
+                "planned": lambda: loop.run_until_complete(planned()),
+            },
+            repeat=10,
+        )
+    finally:
+        loop.close()
+        DB.release_actions(SOCKET_ID)
+
+    print(f"Events per second, {EVENTS} events")
+    baseline = results["inspecting"]
+    for name, seconds in results.items():
+        print(f"  {name:<10}  {EVENTS / seconds:10.0f}/s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Size of the HTML of a page with many event handlers, with a listener script in
+the `seamless:init` attribute of every element versus the declarative
+`seamless:events` attribute. If node is installed, also the time it takes the
+browser side to compile the listener scripts versus to parse the attributes.
+
+    python -m benchmarks.bench_events_markup
+"""
+import json
+import re
+import shutil
+import subprocess
+from html import escape, unescape
+
+from seamless import Button, Component, Div, Input, render
+from seamless.context.request import HTTPRequest, request_context
+from seamless.types.events import InputEvent, MouseEvent
+
+from .common import report
+
+ROWS = 1000
+BINDING = re.compile(r'seamless:events="([^"]+)"')
+
+
+class Row(Component):
+    def __init__(self, index: int):
+        self.index = index
+
+    def render(self):
+        return Div(
+            Input(value=str(self.index), on_input=self.input),
+            Button("Remove", on_click=self.remove),
+        )
+
+    def input(self, event: InputEvent):
+        ...
+
+    def remove(self, event: MouseEvent):
+        ...
+
+
+def init_listener(event_name: str, action_id: str) -> str:
+    # The listener script that was rendered for every event handler.
+    return f"""this.addEventListener('{event_name}', (event) => {{
+            const outEvent = seamless.instance.eventObjectTransformer(
+              event, 
+              seamless.instance.serializeEventObject(event)
+            );
+          seamless.instance.sendEvent("{action_id}", outEvent);
+        }});"""
+
+
+def as_init_scripts(html: str) -> tuple[str, list[str]]:
+    scripts = []
+
+    def replace(match: re.Match) -> str:
+        script = "".join(
+            init_listener(*entry.split(":", 1))
+            for entry in unescape(match.group(1)).split(",")
+        )
+        scripts.append(script)
+        return f'seamless:init="{escape(script)}"'
+
+    return BINDING.sub(replace, html), scripts
+
+
+NODE_SCRIPT = """
+const { scripts, bindings } = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const time = (func) => {
+  let best = Infinity;
+  for (let i = 0; i < 20; i++) {
+    const start = process.hrtime.bigint();
+    func();
+    best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e9);
+  }
+  return best;
+};
+const parse = (value) =>
+  value.split(",").map((entry) => {
+    const [binding, policy] = entry.split("|");
+    const separator = binding.indexOf(":");
+    return [binding.slice(0, separator), binding.slice(separator + 1), policy];
+  });
+console.log(JSON.stringify({
+  "seamless:init": time(() => scripts.forEach((script) => new Function("seamless", script))),
+  "seamless:events": time(() => bindings.forEach(parse)),
+}));
+"""
+
+
+def main():
+    request = HTTPRequest({"method": "GET", "path": "/", "query_string": "", "headers": []})
+    with request_context(request):
+        html = render(Div(*[Row(index=index) for index in range(ROWS)]))
+
+    init_html, scripts = as_init_scripts(html)
+    bindings = [unescape(value) for value in BINDING.findall(html)]
+
+    report(
+        f"HTML size, {ROWS} rows with 2 event handlers each",
+        {"seamless:init": len(init_html.encode()), "seamless:events": len(html.encode())},
+        unit="B",
+    )
+
+    node = shutil.which("node")
+    if node is None:
+        print("node is not installed, skipping the browser side")
+        return
+
+    output = subprocess.run(
+        [node, "-e", NODE_SCRIPT],
+        input=json.dumps({"scripts": scripts, "bindings": bindings}),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    report(f"Attaching the listeners of {len(bindings)} elements", json.loads(output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Cold start time of `import seamless`, measured with `python -X importtime` in a
+fresh interpreter, importing the HTML elements on first use versus importing
+all of them and their prop types up front, as `import seamless` used to.
+
+    python -m benchmarks.bench_import
+"""
+import re
+import subprocess
+import sys
+
+from .common import report
+
+REPEAT = 10
+
+EAGER = "import seamless, seamless.types.html; from seamless.html import *"
+LAZY = "import seamless; seamless.Div"
+
+
+def import_time(code: str) -> float:
+    """
+    Returns the best cumulative import time of the modules `code` imports, in
+    seconds.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        total = sum(
+            int(cumulative)
+            for cumulative, name in re.findall(r"\|\s*(\d+) \| ( *\S+)$", output, re.M)
+            # Top level imports only, their cumulative time includes the nested ones.
+            if not name.startswith(" ")
+        )
+        best = min(best, total / 1e6)
+    return best
+
+
+def main():
+    report(
+        f"Import time, best of {REPEAT}",
+        {"eager": import_time(EAGER), "lazy": import_time(LAZY)},
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Bytes sent to the socket to update a dashboard in which one value changed,
+sending its whole tree versus the patches from the tree sent before.
+
+    python -m benchmarks.bench_live
+"""
+import json
+
+from seamless import Component, Div, Span
+from seamless.rendering.diff import diff
+from seamless.rendering.json import to_dict
+
+from .common import compare, report
+
+CARDS = 500
+
+
+class Dashboard(Component):
+    def __init__(self, values: list[int]):
+        self.values = values
+
+    def render(self):
+        return Div(
+            *[
+                Div(Span(f"Metric {index}", class_name="label"), Span(value), class_name="card")
+                for index, value in enumerate(self.values)
+            ],
+            class_name="dashboard",
+        )
+
+
+def main():
+    values = list(range(CARDS))
+    old = to_dict(Dashboard(values=values))
+    values[CARDS // 2] += 1
+    new = to_dict(Dashboard(values=values))
+
+    report(
+        f"Update size, {CARDS} cards with one changed value",
+        {
+            "whole tree": len(json.dumps(new)),
+            "patches": len(json.dumps(diff(old, new))),
+        },
+        unit="B",
+    )
+    report(
+        "Update time, rendering and encoding",
+        compare(
+            {
+                "whole tree": lambda: json.dumps(to_dict(Dashboard(values=values))),
+                "patches": lambda: json.dumps(diff(old, to_dict(Dashboard(values=values)))),
+            },
+            repeat=10,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
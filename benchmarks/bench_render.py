@@ -0,0 +1,107 @@
+"""
+Render time of deep and wide trees, recursive rendering versus the
+explicit-stack engine shared by the HTML and JSON back ends.
+
+    python -m benchmarks.bench_render
+"""
+import sys
+
+from seamless import Component, Div, Span
+from seamless.element import Element
+from seamless.rendering.html import _render
+from seamless.rendering.json import to_dict
+from seamless.rendering.props import render_props
+
+from .common import compare, measure, report
+
+
+def recursive_render(element) -> str:
+    if isinstance(element, Component):
+        element = recursive_render(element.render())
+
+    if not isinstance(element, Element):
+        return str(element) if element is not None else ""
+
+    tag_name = getattr(element, "tag_name", None)
+    props = {k: v for k, v in element.props_dict().items() if v not in [None, False]}
+    open_tag = f"{tag_name} {render_props(props)}".strip()
+
+    if element.inline:
+        return f"<{open_tag}>"
+
+    children = "".join([recursive_render(child) for child in element.children])
+    if not tag_name:
+        return children
+
+    return f"<{open_tag}>{children}</{tag_name}>"
+
+
+def recursive_to_dict(element):
+    if isinstance(element, Component):
+        element = recursive_to_dict(element.render())
+
+    if not isinstance(element, Element):
+        return element
+
+    return {
+        "type": element.tag_name,
+        "children": list(map(recursive_to_dict, element.children)),
+        "props": element.props_dict(),
+    }
+
+
+class Wrapper(Component):
+    def render(self):
+        return Div(*self.children, class_name="wrapper")
+
+
+def deep_tree(depth: int):
+    tree = Span("leaf")
+    for i in range(depth):
+        tree = Wrapper(tree) if i % 2 else Div(tree, id=f"level-{i}")
+    return tree
+
+
+def wide_tree(rows: int, columns: int):
+    return Div(
+        *[
+            Wrapper(*[Span(f"{row}:{column}") for column in range(columns)])
+            for row in range(rows)
+        ]
+    )
+
+
+def main():
+    trees = {
+        "deep (depth 200)": deep_tree(200),
+        "wide (1000x10)": wide_tree(1000, 10),
+    }
+
+    for name, tree in trees.items():
+        report(
+            f"HTML, {name}",
+            compare(
+                {
+                    "recursive": lambda: recursive_render(tree),
+                    "engine": lambda: _render(tree),
+                }
+            ),
+        )
+        report(
+            f"JSON, {name}",
+            compare(
+                {
+                    "recursive": lambda: recursive_to_dict(tree),
+                    "engine": lambda: to_dict(tree),
+                }
+            ),
+        )
+
+    depth = sys.getrecursionlimit() * 10
+    tree = deep_tree(depth)
+    print(f"depth {depth}: HTML {measure(lambda: _render(tree), repeat=1):.4f}s, "
+          f"JSON {measure(lambda: to_dict(tree), repeat=1):.4f}s")
+
+
+if __name__ == "__main__":
+    main()
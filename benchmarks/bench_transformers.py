@@ -0,0 +1,66 @@
+"""
+Prop transformation cost per element, scanning every transformer versus the
+compiled dispatch.
+
+    python -m benchmarks.bench_transformers
+"""
+from seamless import Div, JS
+from seamless.rendering.props import transform_props
+from seamless.rendering.transformers import TRANSFORMERS
+from seamless.styling import StyleObject
+import seamless.extra  # registers the state transformer
+
+from .common import compare, report
+
+ELEMENTS = 10_000
+
+
+def scan_transform_props(props):
+    props_copy = props.copy()
+
+    for matcher, transformer in TRANSFORMERS:
+        if isinstance(matcher, str):
+            key = matcher
+            if key in props_copy:
+                value = props_copy[key]
+                if callable(transformer):
+                    transformer(key, value, props_copy)
+                else:
+                    props_copy[transformer] = value
+        elif callable(matcher):
+            for key, value in list(props_copy.items()):
+                if matcher(key, value):
+                    transformer(key, value, props_copy)
+
+    return {key: value for key, value in props_copy.items() if value is not None}
+
+
+def make_elements():
+    style = StyleObject(color="red", margin="4px")
+    return [
+        Div(
+            id=f"row-{i}",
+            class_name="row",
+            style=style,
+            tab_index=i,
+            title="row",
+            on_click=JS("seamless.navigateTo('/')") if i % 4 == 0 else None,
+        )
+        for i in range(ELEMENTS)
+    ]
+
+
+def main():
+    elements = make_elements()
+
+    results = compare(
+        {
+            "scan": lambda: [scan_transform_props(e.props) for e in elements],
+            "compiled": lambda: [transform_props(e.props) for e in elements],
+        }
+    )
+    report(f"transform_props over {ELEMENTS} elements", results)
+
+
+if __name__ == "__main__":
+    main()
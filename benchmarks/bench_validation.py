@@ -0,0 +1,68 @@
+"""
+Render time of a page with many event handlers, creating the invocation plan and
+validation model of every handler when it is registered versus caching them per
+function.
+
+    python -m benchmarks.bench_validation
+"""
+from seamless import Button, Component, Div, Input, render
+from seamless import internal
+from seamless.context import database
+from seamless.context.request import HTTPRequest, request_context
+from seamless.types.events import InputEvent, MouseEvent
+
+from .common import compare, report
+
+
+class Row(Component):
+    def __init__(self, index: int):
+        self.index = index
+
+    def render(self):
+        return Div(
+            Input(value=str(self.index), on_input=self.input),
+            Button("Remove", on_click=self.remove),
+        )
+
+    def input(self, event: InputEvent):
+        ...
+
+    def remove(self, event: MouseEvent):
+        ...
+
+
+def uncached_validation_model(func, *, bound=None):
+    function = getattr(func, "__func__", func)
+    return internal._create_validation_model(function, function is not func)
+
+
+def page(rows: int):
+    return Div(*[Row(index=index) for index in range(rows)])
+
+
+def main():
+    request = HTTPRequest({"method": "GET", "path": "/", "query_string": "", "headers": []})
+    cached_validation_model = database.validation_model
+    cached_invocation_plan = database.invocation_plan
+
+    def uncached():
+        database.validation_model = uncached_validation_model
+        database.invocation_plan = database._InvocationPlan
+        try:
+            render(page(200))
+        finally:
+            database.validation_model = cached_validation_model
+            database.invocation_plan = cached_invocation_plan
+
+    with request_context(request):
+        report(
+            "Render, 200 rows with 2 event handlers each",
+            compare(
+                {"per registration": uncached, "cached": lambda: render(page(200))},
+                repeat=10,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
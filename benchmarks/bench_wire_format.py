@@ -0,0 +1,108 @@
+"""
+Payload size and encoding time of a component sent over the socket, in the JSON
+format of `to_dict` versus the compact format of `to_compact`. If node is
+installed, also the time it takes the client to parse and decode the payload.
+
+    python -m benchmarks.bench_wire_format
+"""
+import json
+import shutil
+import subprocess
+
+from seamless import Component, Span, Table, TBody, Td, Th, THead, Tr
+from seamless.rendering.json import to_compact, to_dict
+
+from .common import compare, report
+
+ROWS = 1000
+
+
+class Report(Component):
+    def render(self):
+        return Table(
+            THead(Tr(*[Th(name, class_name="header") for name in ("ID", "Name", "Status")])),
+            TBody(
+                *[
+                    Tr(
+                        Td(str(index), class_name="cell id"),
+                        Td(f"Item {index}", class_name="cell name"),
+                        Td(Span("Active", class_name="badge"), class_name="cell status"),
+                        id=f"row-{index}",
+                    )
+                    for index in range(ROWS)
+                ]
+            ),
+            class_name="report",
+        )
+
+
+NODE_SCRIPT = """
+const { json, compact } = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const time = (func) => {
+  let best = Infinity;
+  for (let i = 0; i < 20; i++) {
+    const start = process.hrtime.bigint();
+    func();
+    best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e9);
+  }
+  return best;
+};
+const isPrimitive = (value) => value === null || typeof value !== "object";
+const decodeCompact = ([strings, root]) => {
+  const decode = (node) => {
+    if (isPrimitive(node)) return node;
+    const [tag, compactProps, ...children] = node;
+    const props = {};
+    for (let i = 0; i < compactProps.length; i += 2) {
+      props[strings[compactProps[i]]] = compactProps[i + 1];
+    }
+    return { type: strings[tag], props, children: children.map(decode) };
+  };
+  return decode(root);
+};
+console.log(JSON.stringify({
+  json: time(() => JSON.parse(json)),
+  compact: time(() => JSON.parse(compact)),
+  "compact, decoded": time(() => decodeCompact(JSON.parse(compact))),
+}));
+"""
+
+
+def main():
+    payloads = {
+        "json": json.dumps(to_dict(Report())),
+        "compact": json.dumps(to_compact(Report())),
+    }
+    report(
+        f"Payload size, a table of {ROWS} rows",
+        {name: len(payload.encode()) for name, payload in payloads.items()},
+        unit="B",
+    )
+    report(
+        "Encoding, including json.dumps",
+        compare(
+            {
+                "json": lambda: json.dumps(to_dict(Report())),
+                "compact": lambda: json.dumps(to_compact(Report())),
+            },
+            repeat=10,
+        ),
+    )
+
+    node = shutil.which("node")
+    if node is None:
+        print("node is not installed, skipping the client side")
+        return
+
+    output = subprocess.run(
+        [node, "-e", NODE_SCRIPT],
+        input=json.dumps(payloads),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    report("Parsing on the client", json.loads(output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from time import perf_counter
+from typing import Callable
+
+
+def measure(func: Callable[[], object], *, repeat=5, number=1) -> float:
+    """
+    Returns the best time, in seconds, of `repeat` runs of calling `func` `number` times.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def compare(funcs: dict[str, Callable[[], object]], *, repeat=20) -> dict[str, float]:
+    """
+    Like `measure` for several functions, interleaving their runs so that noise
+    affects all of them alike.
+    """
+    best = {name: float("inf") for name in funcs}
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            start = perf_counter()
+            func()
+            best[name] = min(best[name], perf_counter() - start)
+    return best
+
+
+def report(title: str, results: dict[str, float], *, unit="s"):
+    print(title)
+    width = max(map(len, results))
+    baseline = next(iter(results.values()))
+    for name, value in results.items():
+        print(f"  {name:<{width}}  {value:10.4f}{unit}  x{baseline / value:.2f}")
@@ -1,6 +1,6 @@
 import io from "socket.io-client";
-import { SeamlessOptions, OutEvent } from "./types";
-export { SeamlessOptions };
+import { SeamlessOptions, OutEvent, BatchEventsOptions } from "./types";
+export { SeamlessOptions, BatchEventsOptions };
 
 export type Primitive = string | number | boolean | null;
 
@@ -10,10 +10,94 @@ export interface SeamlessElement {
   children: Array<SeamlessElement | Primitive> | null;
 }
 
+/**
+ * An element in the compact wire format, `[tag, props, ...children]`. The tag
+ * and the prop names are indices in the string table of the component.
+ */
+export type CompactNode = [number, any[], ...Array<CompactNode | Primitive>];
+
+/**
+ * A component in the compact wire format, its string table and root node.
+ */
+export type CompactComponent = [string[], CompactNode | Primitive];
+
 const SEAMLESS_ELEMENT = "seamless:element";
 const SEAMLESS_INIT = "seamless:init";
+const SEAMLESS_EVENTS = "seamless:events";
 const SEAMLESS_EMPTY = "seamless:empty";
 
+/**
+ * A change to the tree of a live component, addressed by the path of child
+ * indices from its root element.
+ */
+export type Patch =
+  | ["replace", number[], SeamlessElement | Primitive]
+  | ["props", number[], Record<string, any>, string[]]
+  | ["append", number[], Array<SeamlessElement | Primitive>]
+  | ["truncate", number[], number]
+  | ["reorder", number[], Array<number | SeamlessElement>];
+
+export interface EventBinding {
+  actionId: string;
+  policy: "debounce" | "throttle" | "latest" | null;
+  wait: number;
+  timer: ReturnType<typeof setTimeout> | null;
+  last: number;
+  busy: boolean;
+  pending: any;
+}
+
+type Component = SeamlessElement | CompactComponent | Primitive;
+
+interface CachedComponentResponse {
+  etag: string | null;
+  max_age: number | null;
+  component?: Component;
+}
+
+interface CachedComponent {
+  etag: string | null;
+  expiresAt: number;
+  component: Component;
+}
+
+const NON_BUBBLING_EVENTS = new Set([
+  "abort",
+  "blur",
+  "canplay",
+  "canplaythrough",
+  "durationchange",
+  "emptied",
+  "ended",
+  "error",
+  "focus",
+  "invalid",
+  "load",
+  "loadeddata",
+  "loadedmetadata",
+  "loadstart",
+  "mouseenter",
+  "mouseleave",
+  "pause",
+  "play",
+  "playing",
+  "pointerenter",
+  "pointerleave",
+  "progress",
+  "ratechange",
+  "resize",
+  "scroll",
+  "scrollend",
+  "seeked",
+  "seeking",
+  "stalled",
+  "suspend",
+  "timeupdate",
+  "toggle",
+  "volumechange",
+  "waiting",
+]);
+
 class Seamless {
   protected readonly socket;
   private readonly eventObjectTransformer: (
@@ -21,14 +105,55 @@ class Seamless {
     outEvent: any
   ) => any;
   private readonly context: Record<any, any> = {};
+  private readonly batchOptions: Required<BatchEventsOptions> | null;
+  private eventsBuffer: Array<[string, any]> = [];
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private readonly eventBindings = new WeakMap<
+    Element,
+    Map<string, EventBinding>
+  >();
+  private readonly delegatedEvents = new Set<string>();
+  // Maps keep their insertion order, the least recently used component first.
+  private readonly componentsCache = new Map<string, CachedComponent>();
+  private readonly componentsCacheSize: number;
+  private readonly componentRequests = new Map<string, Promise<Component>>();
+  private readonly broadcastHandlers = new Map<
+    string,
+    Set<(component: Component) => void>
+  >();
 
   constructor(config?: SeamlessOptions) {
+    const { auth, ...socketOptions } = config?.socketOptions ?? {};
+    const format = config?.wireFormat ?? "compact";
     this.socket = io({
       reconnectionDelayMax: 10000,
-      ...config?.socketOptions,
+      ...socketOptions,
+      auth:
+        typeof auth === "function"
+          ? (cb) => auth((data) => cb({ format, ...data }))
+          : { format, ...auth },
     });
     this.eventObjectTransformer =
       config?.eventObjectTransformer || ((_, outEvent) => outEvent);
+    this.batchOptions = config?.batchEvents
+      ? {
+          window: 16,
+          maxSize: 32,
+          ...(config.batchEvents === true ? {} : config.batchEvents),
+        }
+      : null;
+    this.componentsCacheSize = config?.componentsCacheSize ?? 32;
+
+    if (this.batchOptions) {
+      window.addEventListener("pagehide", () => this.flushEvents());
+    }
+
+    this.socket.on("patch", (updates: Array<[string, Patch[]]>) => {
+      updates.forEach(([liveId, patches]) => this.applyPatches(liveId, patches));
+    });
+    this.socket.on("broadcast", (room: string, component: Component) => {
+      this.broadcastHandlers.get(room)?.forEach((handler) => handler(component));
+    });
 
     this.context.instance = this;
     this.init();
@@ -44,6 +169,9 @@ class Seamless {
 
   processElements(elements: HTMLElement[]) {
     elements.forEach((element) => {
+      if (element.hasAttribute(SEAMLESS_EVENTS)) {
+        this.attachEvents(element);
+      }
       if (element.hasAttribute(SEAMLESS_INIT)) {
         this.attachInit(element);
       }
@@ -58,14 +186,26 @@ class Seamless {
     });
   }
 
-  render(component: SeamlessElement, parentElement: any): void;
-  render(component: SeamlessElement, parentElement: HTMLElement): void {
-    this.toDOMElement(component, parentElement);
+  render(
+    component: SeamlessElement | CompactComponent | Primitive,
+    parentElement: any
+  ): void;
+  render(
+    component: SeamlessElement | CompactComponent | Primitive,
+    parentElement: HTMLElement
+  ): void {
+    if (this.isCompact(component)) {
+      const [strings, root] = component;
+      this.toDOMElement(root, parentElement, strings);
+    } else {
+      this.toDOMElement(component, parentElement);
+    }
   }
 
   private toDOMElement(
-    element: SeamlessElement | Primitive,
-    parentElement?: HTMLElement
+    element: SeamlessElement | CompactNode | Primitive,
+    parentElement?: HTMLElement,
+    strings?: string[]
   ): HTMLElement | Text {
     if (this.isPrimitive(element)) {
       const primitiveNode = document.createTextNode(element?.toString() || "");
@@ -75,17 +215,35 @@ class Seamless {
       return primitiveNode;
     }
 
-    const domElement = document.createElement(element.type);
-    Object.entries(element.props).forEach(([key, value]) => {
-      domElement.setAttribute(key, value);
-    });
+    let domElement: HTMLElement;
+    if (Array.isArray(element)) {
+      // A compact node, decoded without building the element object.
+      const [tag, props] = element;
+      domElement = document.createElement(strings![tag]);
+      for (let i = 0; i < props.length; i += 2) {
+        domElement.setAttribute(strings![props[i]], props[i + 1]);
+      }
 
-    if (parentElement) {
-      parentElement.appendChild(domElement);
-    }
+      if (parentElement) {
+        parentElement.appendChild(domElement);
+      }
 
-    if (Array.isArray(element.children)) {
-      element.children.map((child) => this.toDOMElement(child, domElement));
+      for (let i = 2; i < element.length; i++) {
+        this.toDOMElement(element[i] as CompactNode | Primitive, domElement, strings);
+      }
+    } else {
+      domElement = document.createElement(element.type);
+      Object.entries(element.props).forEach(([key, value]) => {
+        domElement.setAttribute(key, value);
+      });
+
+      if (parentElement) {
+        parentElement.appendChild(domElement);
+      }
+
+      if (Array.isArray(element.children)) {
+        element.children.map((child) => this.toDOMElement(child, domElement));
+      }
     }
 
     if (domElement.hasAttribute(SEAMLESS_ELEMENT)) {
@@ -95,6 +253,95 @@ class Seamless {
     return domElement;
   }
 
+  /**
+   * Applies the changes the server sent to the tree of a live component.
+   */
+  applyPatches(liveId: string, patches: Patch[]) {
+    let root = document.querySelector<HTMLElement>(
+      `[seamless\\:live="${CSS.escape(liveId)}"]`
+    );
+    if (!root) {
+      return;
+    }
+
+    for (const patch of patches) {
+      const node = patch[1].reduce<Node>(
+        (node, index) => node.childNodes[index],
+        root
+      );
+
+      switch (patch[0]) {
+        case "replace": {
+          const replacement = this.toDOMElement(patch[2]);
+          (node as ChildNode).replaceWith(replacement);
+          if (node === root) {
+            root = replacement as HTMLElement;
+          }
+          break;
+        }
+        case "props": {
+          const element = node as HTMLElement;
+          Object.entries(patch[2]).forEach(([key, value]) => {
+            element.setAttribute(key, value);
+          });
+          patch[3].forEach((key) => element.removeAttribute(key));
+          if (SEAMLESS_EVENTS in patch[2]) {
+            this.attachEvents(element);
+          } else if (patch[3].includes(SEAMLESS_EVENTS)) {
+            this.eventBindings.delete(element);
+          }
+          break;
+        }
+        case "append":
+          patch[2].forEach((child) =>
+            this.toDOMElement(child, node as HTMLElement)
+          );
+          break;
+        case "truncate":
+          while (node.childNodes.length > patch[2]) {
+            node.removeChild(node.lastChild!);
+          }
+          break;
+        case "reorder":
+          this.reorderChildren(node as HTMLElement, patch[2]);
+          break;
+      }
+    }
+  }
+
+  /**
+   * Rearranges the children of a keyed list, moving the existing children that
+   * are kept instead of creating them again.
+   */
+  protected reorderChildren(
+    element: HTMLElement,
+    order: Array<number | SeamlessElement>
+  ) {
+    const existing = Array.from(element.childNodes);
+    const kept = new Set<number>();
+    const children = order.map((item) => {
+      if (typeof item === "number") {
+        kept.add(item);
+        return existing[item];
+      }
+      return this.toDOMElement(item);
+    });
+
+    existing.forEach((child, index) => {
+      if (!kept.has(index)) {
+        element.removeChild(child);
+      }
+    });
+
+    // Only children that are not already in place are moved.
+    children.forEach((child, index) => {
+      const current = element.childNodes[index];
+      if (current !== child) {
+        element.insertBefore(child, current ?? null);
+      }
+    });
+  }
+
   protected attachInit(element: HTMLElement) {
     const initCode = element.getAttribute(SEAMLESS_INIT);
     if (initCode) {
@@ -103,6 +350,126 @@ class Seamless {
     }
   }
 
+  /**
+   * Binds the events in the `seamless:events` attribute of the element,
+   * `event:actionId` entries separated by commas. The events are handled by a
+   * single listener per event type at the document root.
+   */
+  protected attachEvents(element: HTMLElement) {
+    const bindings = this.parseEvents(element.getAttribute(SEAMLESS_EVENTS)!);
+    this.eventBindings.set(element, bindings);
+    bindings.forEach((_, eventName) => this.delegateEvent(eventName));
+  }
+
+  protected delegateEvent(eventName: string) {
+    if (this.delegatedEvents.has(eventName)) {
+      return;
+    }
+
+    this.delegatedEvents.add(eventName);
+    // Events that do not bubble only reach the root in the capture phase.
+    document.addEventListener(eventName, this.handleEvent, {
+      capture: NON_BUBBLING_EVENTS.has(eventName),
+    });
+  }
+
+  parseEvents(value: string) {
+    const bindings = new Map<string, EventBinding>();
+    value.split(",").forEach((entry) => {
+      const [binding, policy] = entry.split("|");
+      // Action IDs may contain colons, so only the first one is a separator.
+      const separator = binding.indexOf(":");
+      const [policyName, wait] = policy?.split(":") ?? [null, "0"];
+      bindings.set(binding.slice(0, separator), {
+        actionId: binding.slice(separator + 1),
+        policy: policyName as EventBinding["policy"],
+        wait: Number(wait),
+        timer: null,
+        last: 0,
+        busy: false,
+        pending: null,
+      });
+    });
+    return bindings;
+  }
+
+  private readonly handleEvent = (event: Event) => {
+    const target = event.target as Element | null;
+    if (NON_BUBBLING_EVENTS.has(event.type)) {
+      // The event only happened on the target, not on its ancestors.
+      const binding = target && this.eventBindings.get(target)?.get(event.type);
+      if (binding) {
+        this.dispatchBinding(binding, event);
+      }
+      return;
+    }
+
+    // Dispatch to the target and its ancestors, in the order they would have
+    // received the event.
+    for (
+      let element = target;
+      element && !event.cancelBubble;
+      element = element.parentElement
+    ) {
+      const binding = this.eventBindings.get(element)?.get(event.type);
+      if (binding) {
+        this.dispatchBinding(binding, event);
+      }
+    }
+  };
+
+  dispatchBinding(binding: EventBinding, event: Event) {
+    const outEvent = this.eventObjectTransformer(
+      event,
+      this.serializeEventObject(event)
+    );
+
+    switch (binding.policy) {
+      case "debounce":
+        if (binding.timer !== null) {
+          clearTimeout(binding.timer);
+        }
+        binding.timer = setTimeout(() => {
+          binding.timer = null;
+          this.sendEvent(binding.actionId, outEvent);
+        }, binding.wait);
+        break;
+      case "throttle":
+        binding.pending = outEvent;
+        if (binding.timer === null) {
+          binding.timer = setTimeout(() => {
+            binding.timer = null;
+            binding.last = Date.now();
+            this.sendEvent(binding.actionId, binding.pending);
+          }, Math.max(0, binding.last + binding.wait - Date.now()));
+        }
+        break;
+      case "latest":
+        if (binding.busy) {
+          binding.pending = outEvent;
+        } else {
+          this.sendLatest(binding, outEvent);
+        }
+        break;
+      default:
+        this.sendEvent(binding.actionId, outEvent);
+    }
+  }
+
+  private sendLatest(binding: EventBinding, outEvent: any) {
+    binding.busy = true;
+    this.socket
+      .timeout(10000)
+      .emit("event", binding.actionId, outEvent, () => {
+        binding.busy = false;
+        if (binding.pending !== null) {
+          const next = binding.pending;
+          binding.pending = null;
+          this.sendLatest(binding, next);
+        }
+      });
+  }
+
   protected initEmpty(element: HTMLElement) {
     while (element.firstChild) {
       element.parentElement?.insertBefore(element.firstChild, element);
@@ -110,6 +477,37 @@ class Seamless {
     element.parentElement?.removeChild(element);
   }
 
+  protected isCompact(value: any): value is CompactComponent {
+    return Array.isArray(value);
+  }
+
+  /**
+   * Converts a component in the compact wire format to elements.
+   */
+  decodeComponent(
+    component: SeamlessElement | CompactComponent | Primitive
+  ): SeamlessElement | Primitive {
+    if (!this.isCompact(component)) {
+      return component;
+    }
+
+    const [strings, root] = component;
+    const decode = (node: CompactNode | Primitive): SeamlessElement | Primitive => {
+      if (this.isPrimitive(node)) {
+        return node;
+      }
+
+      const [tag, compactProps, ...children] = node;
+      const props: Record<string, any> = {};
+      for (let i = 0; i < compactProps.length; i += 2) {
+        props[strings[compactProps[i]]] = compactProps[i + 1];
+      }
+      return { type: strings[tag], props, children: children.map(decode) };
+    };
+
+    return decode(root);
+  }
+
   protected isPrimitive(value: any): value is Primitive {
     return (
       typeof value === "string" ||
@@ -120,13 +518,118 @@ class Seamless {
   }
 
   async getComponent(name: string, props: Record<string, any>) {
-    return await this.sendWaitResponse<SeamlessElement | Primitive>(
+    return await this.sendWaitResponse<
+      SeamlessElement | CompactComponent | Primitive
+    >(
       "component",
       name,
       props
     );
   }
 
+  /**
+   * Like `getComponent`, for components that are cached on the server. The
+   * component is kept for the `max_age` the server sent, and revalidated by its
+   * ETag after that, so it is only downloaded again if it changed.
+   *
+   * Fetched components are kept in a least-recently-used cache of
+   * `componentsCacheSize` components, see `peekComponent`.
+   */
+  fetchComponent(
+    name: string,
+    props: Record<string, any> = {}
+  ): Promise<Component> {
+    const key = `${name}:${JSON.stringify(props)}`;
+    const cached = this.componentsCache.get(key);
+    if (cached && cached.expiresAt > Date.now()) {
+      this.touchComponent(key, cached);
+      return Promise.resolve(cached.component);
+    }
+
+    // Concurrent fetches of the same component, like a prefetch followed by a
+    // navigation, share a single request.
+    let request = this.componentRequests.get(key);
+    if (!request) {
+      request = this.requestComponent(key, name, props, cached).finally(() =>
+        this.componentRequests.delete(key)
+      );
+      this.componentRequests.set(key, request);
+    }
+    return request;
+  }
+
+  /**
+   * Fetches a component in the background, so it is cached when it is needed.
+   */
+  prefetchComponent(name: string, props: Record<string, any> = {}) {
+    this.fetchComponent(name, props).catch(() => {});
+  }
+
+  /**
+   * Returns the cached component, even if it should be revalidated, to render
+   * it while it is fetched again.
+   */
+  peekComponent(
+    name: string,
+    props: Record<string, any> = {}
+  ): Component | undefined {
+    const key = `${name}:${JSON.stringify(props)}`;
+    const cached = this.componentsCache.get(key);
+    if (cached) {
+      this.touchComponent(key, cached);
+    }
+    return cached?.component;
+  }
+
+  private async requestComponent(
+    key: string,
+    name: string,
+    props: Record<string, any>,
+    cached: CachedComponent | undefined
+  ) {
+    const response = await this.sendWaitResponse<CachedComponentResponse>(
+      "cached_component",
+      name,
+      props,
+      cached?.etag ?? null
+    );
+
+    const component =
+      "component" in response ? response.component! : cached!.component;
+    // Components that are not cached on the server have no ETag, and are kept
+    // only to be rendered while they are fetched again.
+    this.touchComponent(key, {
+      etag: response.etag,
+      expiresAt: Date.now() + (response.max_age ?? 0) * 1000,
+      component,
+    });
+    return component;
+  }
+
+  private touchComponent(key: string, cached: CachedComponent) {
+    this.componentsCache.delete(key);
+    this.componentsCache.set(key, cached);
+    if (this.componentsCache.size > this.componentsCacheSize) {
+      this.componentsCache.delete(this.componentsCache.keys().next().value!);
+    }
+  }
+
+  /**
+   * Calls `handler` with the components the server broadcasts to `room`,
+   * which can be passed to `render`. The socket joins rooms on the server.
+   *
+   * @returns A function that removes the handler
+   */
+  onBroadcast(room: string, handler: (component: Component) => void) {
+    let handlers = this.broadcastHandlers.get(room);
+    if (!handlers) {
+      handlers = new Set();
+      this.broadcastHandlers.set(room, handlers);
+    }
+    handlers.add(handler);
+    return () => handlers!.delete(handler);
+  }
+
   registerEventListener(
     seamlessId: string,
     event: string,
@@ -139,6 +642,46 @@ class Seamless {
     this.socket.emit(event, ...args);
   }
 
+  /**
+   * Sends an event to the action with the given ID, batched with other events
+   * when `batchEvents` is enabled.
+   */
+  sendEvent(actionId: string, outEvent: any) {
+    if (!this.batchOptions) {
+      this.socket.emit("event", actionId, outEvent);
+      return;
+    }
+
+    this.eventsBuffer.push([actionId, outEvent]);
+    if (this.eventsBuffer.length >= this.batchOptions.maxSize) {
+      this.flushEvents();
+    } else if (this.flushTimer === null) {
+      this.flushTimer = setTimeout(
+        () => this.flushEvents(),
+        this.batchOptions.window
+      );
+    }
+  }
+
+  flushEvents() {
+    if (this.flushTimer !== null) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+
+    if (this.eventsBuffer.length === 0) {
+      return;
+    }
+
+    const events = this.eventsBuffer;
+    this.eventsBuffer = [];
+    if (events.length === 1) {
+      this.socket.emit("event", ...events[0]);
+    } else {
+      this.socket.emit("events", events);
+    }
+  }
+
   sendCustomEvent(event: string, data: any) {
     this.socket.emit("custom", event, data);
   }
@@ -11,6 +11,37 @@ export interface SeamlessOptions {
    * @returns The object that will be sent to the server
    */
   eventObjectTransformer?: (originalEvent: Event, outEvent: any) => any;
+  /**
+   * Buffer the events that are sent to the server and send them in batches,
+   * as a single `events` message.
+   * Pass `true` to use the default window and size.
+   */
+  batchEvents?: boolean | BatchEventsOptions;
+  /**
+   * The format the server sends components in, requested when connecting.
+   * `compact` sends elements as arrays, with a string table for the tag names
+   * and prop names.
+   * @default "compact"
+   */
+  wireFormat?: "json" | "compact";
+  /**
+   * The number of fetched components to keep, like the pages of a router
+   * @default 32
+   */
+  componentsCacheSize?: number;
+}
+
+export interface BatchEventsOptions {
+  /**
+   * The number of milliseconds to buffer events for before sending them
+   * @default 16
+   */
+  window?: number;
+  /**
+   * The number of events that are sent as soon as they are buffered
+   * @default 32
+   */
+  maxSize?: number;
 }
 
 export interface OutEvent<T = any> {
@@ -1,6 +1,7 @@
 import React from 'react';
 
 import Seamless, {
+    type CompactComponent,
     type SeamlessElement,
     type Primitive,
     type SeamlessOptions
@@ -21,26 +22,23 @@ export function createContext(config?: SeamlessOptions): React.Context<SeamlessR
 }
 
 class SeamlessReact extends Seamless {
-    render(element: SeamlessElement | Primitive, parentElement?: ReactElement): ReactElement {
+    render(
+        component: SeamlessElement | CompactComponent | Primitive,
+        parentElement?: ReactElement
+    ): ReactElement {
+        let element = this.decodeComponent(component);
         if (this.isPrimitive(element)) {
             return React.createElement(React.Fragment, null, element);
         }
 
-        if ('seamless:id' in element.props) {
-            const events: string[] = element.props['seamless:events']?.split(',') || [];
-            events.forEach((event) => {
-                event = capitalizeFirstLetter(event);
-                element.props[`on${event}`] = (e: Event) => {
-                    this.emit(
-                        'dom_event',
-                        `${element.props['seamless:id']}:${event}`,
-                        {
-                            seamlessId: element.props['seamless:id'],
-                            event: this.serializeEventObject(e),
-                        }
-                    );
+        if ('seamless:events' in element.props) {
+            const { 'seamless:events': events, ...props } = element.props;
+            this.parseEvents(events).forEach((binding, event) => {
+                props[`on${capitalizeFirstLetter(event)}`] = (e: React.SyntheticEvent) => {
+                    this.dispatchBinding(binding, e.nativeEvent);
                 };
             });
+            element = { ...element, props };
         }
 
         const children = (
@@ -1,9 +1,27 @@
+from typing import TYPE_CHECKING
+
 from .components import Component
-from .html import *
+from . import html as _html
 from .rendering.html import render
 from .core import JS
 
-__version__ = "0.8.6"
+if TYPE_CHECKING:
+    from .html import *
+
+
+def __getattr__(name: str):
+    # The HTML elements are imported on first use, see `seamless.html`.
+    if name in _html.__all__:
+        value = globals()[name] = getattr(_html, name)
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_html.__all__])
+
+__version__ = "0.9.0"
 __all__ = [
     "Component",
     "A",
@@ -1,4 +1,14 @@
 from .base import Component
 from .page import Page
+from .memo import memo, RenderCache
+from .fetch_cache import fetch_cache, invalidate_fetch_cache, FetchCache
 
-__all__ = ["Component", "Page"]
+__all__ = [
+    "Component",
+    "Page",
+    "memo",
+    "RenderCache",
+    "fetch_cache",
+    "invalidate_fetch_cache",
+    "FetchCache",
+]
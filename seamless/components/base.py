@@ -1,26 +1,60 @@
 from abc import abstractmethod
+from functools import wraps
+from inspect import isfunction, signature
 from typing import TYPE_CHECKING, ClassVar
 
 
 if TYPE_CHECKING:
     from seamless.types import RenderResult, ChildType
+    from .memo import RenderCache
+    from .fetch_cache import FetchCache
 
 
 class Component:
     children: tuple["ChildType", ...]
     __seamless_name__: ClassVar[str] = "Component"
+    __seamless_memo__: ClassVar["RenderCache | None"] = None
+    __seamless_fetch_cache__: ClassVar["FetchCache | None"] = None
+    __seamless_live__: ClassVar[bool] = False
+    __seamless_key__: "str | int | None" = None
 
-    def __init__(self, *children: "ChildType") -> None:
+    def __init__(self, *children: "ChildType", key: "str | int | None" = None) -> None:
         if type(self) is Component:
             raise TypeError("Cannot instantiate Component directly")
         
         self.children = children
+        if key is not None:
+            self.__seamless_key__ = key
 
     @abstractmethod
     def render(self) -> "RenderResult":
         raise NotImplementedError(f"{type(self).__name__}.render() is not implemented")
 
-    def __init_subclass__(cls, *, name: str | None = None, **kwargs) -> None:
+    def __init_subclass__(
+        cls,
+        *,
+        name: str | None = None,
+        memo: "bool | RenderCache" = False,
+        fetch_cache: "bool | FetchCache" = False,
+        live: bool = False,
+        prewarm: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            name: The name the component is registered with. Defaults to the class name.
+            memo: Whether to cache the rendered subtrees of the component, keyed by
+            its children and constructor arguments. Pass a `RenderCache` to control
+            its size and expiry.
+            fetch_cache: Whether to cache the payloads of the component fetched over
+            the socket, keyed by their props. Pass a `FetchCache` to control its size
+            and expiry.
+            live: Whether instances of the component can be marked dirty by their
+            event handlers, with `mark_dirty`, to update them in the browser.
+            prewarm: Whether to create the validation models of the public methods
+            of the component now, instead of when they are first rendered as event
+            handlers.
+        """
         super().__init_subclass__(**kwargs)
 
         if cls is not Component:
@@ -29,17 +63,72 @@ class Component:
             cls.__seamless_name__ = name or cls.__name__
             COMPONENTS_REPOSITORY.add_component(cls, cls.__seamless_name__)
 
-        if cls.__init__ is Component.__init__:
-            return
+        if cls.__init__ is not Component.__init__:
+            original_init = cls.__init__
+            accepts_key = "key" in signature(original_init).parameters
 
-        original_init = cls.__init__
+            def __init__(self, *args, children=None, key=None, **kwargs):
+                Component.__init__(
+                    self, *(getattr(self, "children", children) or args), key=key
+                )
+                if accepts_key:
+                    kwargs["key"] = key
+                original_init(self, **kwargs)
 
-        def __init__(self, *args, children=None, **kwargs):
-            Component.__init__(self, *(getattr(self, "children", children) or args))
-            original_init(self, **kwargs)
+            cls.__init__ = __init__
 
-        cls.__init__ = __init__
+        if memo:
+            from .memo import RenderCache, memoize_component
+
+            memoize_component(cls, memo if isinstance(memo, RenderCache) else RenderCache())
+
+        if fetch_cache:
+            from .fetch_cache import FetchCache
+
+            cls.__seamless_fetch_cache__ = (
+                fetch_cache if isinstance(fetch_cache, FetchCache) else FetchCache()
+            )
+
+        if live or cls.__seamless_live__:
+            if cls.__seamless_memo__ is not None:
+                raise TypeError("Live components cannot be memoized")
+
+            cls.__seamless_live__ = True
+            if "render" in vars(cls):
+                _make_live(cls)
+
+        if prewarm:
+            from ..internal import validation_model
+
+            for attribute, value in vars(cls).items():
+                if attribute.startswith("_") or attribute == "render":
+                    continue
+
+                if isinstance(value, (staticmethod, classmethod)):
+                    validation_model(value.__func__, bound=isinstance(value, classmethod))
+                elif isfunction(value):
+                    validation_model(value, bound=True)
 
     def __call__(self, *children: "ChildType"):
         self.children = children
         return self
+
+
+def _make_live(cls: type[Component]):
+    from ..context.live import live_id
+    from ..element import Element
+    from ..errors import RenderError
+    from ..internal import SEAMLESS_LIVE_ATTRIBUTE
+
+    original_render = cls.render
+
+    @wraps(original_render)
+    def render(self):
+        element = original_render(self)
+        if not isinstance(element, Element) or element.tag_name == "seamless:empty":
+            raise RenderError(f"{cls.__name__} is live, so it must render a single element")
+
+        element.props[SEAMLESS_LIVE_ATTRIBUTE] = live_id(self)
+        return element
+
+    cls.render = render
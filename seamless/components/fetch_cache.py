@@ -0,0 +1,117 @@
+from hashlib import sha1
+from json import dumps
+from typing import TYPE_CHECKING, Any, Callable, overload
+
+from ..rendering.context import track_actions
+from .memo import RenderCache
+
+if TYPE_CHECKING:
+    from .base import Component
+    from .memo import ComponentType
+
+
+class FetchCache(RenderCache):
+    """
+    A cache of the payloads of a component sent by the `component` route of the
+    socket, keyed by the props the component was fetched with.
+
+    Every payload has an ETag, so a client that already has the payload can
+    revalidate it without downloading it again.
+
+    Args:
+        maxsize: The maximal number of cached props.
+        ttl: The number of seconds a payload stays cached, or `None` to keep it
+        until it is evicted or invalidated. Clients may also keep the payload
+        for this long without asking the server.
+    """
+
+    def fetch(
+        self, props: dict, wire_format: str, render: Callable[[], Any]
+    ) -> tuple[str | None, Any]:
+        """
+        Returns the ETag and payload of the component in `wire_format`, calling
+        `render` on a miss.
+
+        Payloads that register server-side actions are not cached, since those
+        are bound to the socket they were rendered for, and have no ETag.
+        """
+        key = props_key(props)
+        payloads = self.get(key)
+        if payloads is not None and wire_format in payloads:
+            return payloads[wire_format]
+
+        with track_actions() as tracker:
+            payload = render()
+
+        if tracker.actions:
+            return None, payload
+
+        entry = (_etag(payload), payload)
+        if payloads is None:
+            self.set(key, {wire_format: entry})
+        else:
+            payloads[wire_format] = entry
+
+        return entry
+
+    def invalidate(self, props: dict | None = None):
+        """
+        Removes the payloads fetched with `props`, or all of them.
+        """
+        if props is None:
+            self.clear()
+        else:
+            self.delete(props_key(props))
+
+
+def props_key(props: dict) -> str:
+    """
+    Returns a hash of the props that does not depend on their order.
+    """
+    canonical = dumps(props, sort_keys=True, separators=(",", ":"), default=str)
+    return sha1(canonical.encode()).hexdigest()
+
+
+def _etag(payload: Any) -> str:
+    return sha1(dumps(payload, separators=(",", ":")).encode()).hexdigest()[:16]
+
+
+@overload
+def fetch_cache(cls: "ComponentType", /) -> "ComponentType": ...
+@overload
+def fetch_cache(
+    *, maxsize: int = 128, ttl: float | None = None
+) -> "Callable[[ComponentType], ComponentType]": ...
+
+
+def fetch_cache(cls=None, /, *, maxsize=128, ttl=None):
+    """
+    A class decorator that caches the payloads of a component fetched over the
+    socket, like the pages of a `Router`, keyed by their props.
+
+    Example:
+        >>> @fetch_cache(ttl=60)
+        ... class About(Component):
+        ...     def render(self):
+        ...         return Div("About us")
+    """
+
+    def decorator(cls):
+        cls.__seamless_fetch_cache__ = FetchCache(maxsize=maxsize, ttl=ttl)
+        return cls
+
+    if cls is not None:
+        return decorator(cls)
+
+    return decorator
+
+
+def invalidate_fetch_cache(component: "type[Component]", **props):
+    """
+    Removes the cached payloads of a component fetched with `props`, or all of
+    its payloads if no props are given, so they are rendered again on the next
+    fetch.
+    """
+    cache = component.__seamless_fetch_cache__
+    if cache is not None:
+        cache.invalidate(props or None)
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, overload
+
+from ..element import Element
+from ..rendering.context import track_actions
+from .base import Component
+
+if TYPE_CHECKING:
+    ComponentType = TypeVar("ComponentType", bound=type[Component])
+
+_MISSING = object()
+
+
+class RenderCache:
+    """
+    A least-recently-used cache of rendered component subtrees.
+
+    Args:
+        maxsize: The maximal number of cached subtrees.
+        ttl: The number of seconds a subtree stays cached, or `None` to keep it
+        until it is evicted.
+    """
+
+    def __init__(self, *, maxsize: int = 128, ttl: float | None = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict[Any, tuple[Any, float | None]]()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires_at = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def render(self, component: "Component", kind: str, render: Callable[[], Any]):
+        """
+        Returns the cached `kind` rendering of the component, calling `render`
+        on a miss.
+
+        Components constructed with unhashable arguments, elements or components
+        are not cached, and neither are subtrees that register server-side
+        actions, since those are bound to the request they were rendered in.
+        """
+        key = _memo_key(component)
+        if key is None:
+            return render()
+
+        try:
+            value = self.get((kind, type(component), key), _MISSING)
+        except TypeError:
+            return render()
+
+        if value is not _MISSING:
+            return value
+
+        with track_actions() as tracker:
+            value = render()
+
+        if not tracker.actions:
+            self.set((kind, type(component), key), value)
+
+        return value
+
+
+def _memo_key(component: "Component"):
+    props = getattr(component, "__seamless_memo_key__", None)
+    if props is None:
+        return None
+
+    for value in (*component.children, *(value for _, value in props)):
+        if isinstance(value, (Element, Component)):
+            return None
+
+    return (component.children, props)
+
+
+def memoize_component(cls: "type[Component]", cache: RenderCache):
+    """
+    Makes the rendered subtrees of `cls` instances cached in `cache`, keyed by
+    their children and the keyword arguments they were constructed with.
+    """
+    if cls.__seamless_live__:
+        raise TypeError("Live components cannot be memoized")
+
+    original_init = cls.__init__
+
+    @wraps(original_init)
+    def __init__(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        if type(self) is cls:
+            self.__seamless_memo_key__ = tuple(
+                sorted((key, value) for key, value in kwargs.items() if key != "children")
+            )
+
+    cls.__init__ = __init__
+    cls.__seamless_memo__ = cache
+
+
+@overload
+def memo(cls: "ComponentType", /) -> "ComponentType": ...
+@overload
+def memo(
+    *, maxsize: int = 128, ttl: float | None = None
+) -> "Callable[[ComponentType], ComponentType]": ...
+
+
+def memo(cls=None, /, *, maxsize=128, ttl=None):
+    """
+    A class decorator that caches the rendered HTML and JSON of a component,
+    keyed by its children and constructor arguments.
+
+    Example:
+        >>> @memo(maxsize=16, ttl=60)
+        ... class Footer(Component):
+        ...     def __init__(self, year: int):
+        ...         self.year = year
+        ...
+        ...     def render(self):
+        ...         return Div(f"© {self.year}")
+    """
+
+    def decorator(cls):
+        memoize_component(cls, RenderCache(maxsize=maxsize, ttl=ttl))
+        return cls
+
+    if cls is not None:
+        return decorator(cls)
+
+    return decorator
@@ -12,6 +12,15 @@ from ..html import (
     Meta,
 )
 from ..internal import to_iter
+from ..core.static import static
+
+
+_HEAD_META = static(
+    Fragment(
+        Meta(charset="UTF-8"),
+        Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
+    )
+)
 
 
 class _HtmlProps(TypedDict):
@@ -48,8 +57,7 @@ class Page(Component, name="SeamlessBasePage"):
         The children that will be inside the `head` tag.
         """
         return (
-            Meta(charset="UTF-8"),
-            Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
+            _HEAD_META,
             Title(self.title),
         )
 
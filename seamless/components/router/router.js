@@ -1,45 +1,58 @@
 const loadingComponentName = this.getAttribute("loading");
 const parent = this.parentElement;
 const PageStateChange = new Event("pageLocationChange");
-let loadingComponent = null;
+let loadingNodes = [];
+// Incremented on every navigation, so pages fetched for a previous one are ignored.
+let navigation = 0;
+
+const toNodes = (component) => {
+  const fragment = document.createDocumentFragment();
+  seamless.instance.render(component, fragment);
+  return Array.from(fragment.childNodes);
+}
 
 if (loadingComponentName) {
-  seamless.instance.getComponent(loadingComponentName, {}).then((component) => {
-    loadingComponent = seamless.instance.toDOMElement(component);
+  seamless.instance.fetchComponent(loadingComponentName, {}).then((component) => {
+    loadingNodes = toNodes(component);
   });
 }
 
-const clearParent = () => {
+const show = (nodes) => {
   while (parent.firstChild) {
     parent.removeChild(parent.firstChild);
   }
+  parent.append(...nodes);
 }
 
-const loadComponent = async (name) => {
-  return seamless.instance.toDOMElement(await seamless.instance.getComponent(name, {}));
-}
+const findPage = (path) => routes.find(
+  (page) => page.path.replace(/^\//, "") === path.replace(/^\//, "")
+);
 
 window.addEventListener("pageLocationChange", () => {
-  const path = window.location.pathname;
-  const page = routes.find(
-    (page) => page.path.replace(/^\//, "") === path.replace(/^\//, "")
-  );
-
+  const page = findPage(window.location.pathname);
   if (!page) {
     return;
   }
 
-  clearParent();
-  if (loadingComponent) {
-    parent.appendChild(loadingComponent);
-  }
+  const current = ++navigation;
+  // Show the cached page right away, and replace it if it changed.
+  const cached = seamless.instance.peekComponent(page.name, {});
+  show(cached !== undefined ? toNodes(cached) : loadingNodes);
 
-  loadComponent(page.name).then((component) => {
-    clearParent();
-    parent.appendChild(component);
+  seamless.instance.fetchComponent(page.name, {}).then((component) => {
+    if (current === navigation && component !== cached) {
+      show(toNodes(component));
+    }
   });
 });
 
+seamless.prefetchRoute = function (to) {
+  const page = findPage(to);
+  if (page) {
+    seamless.instance.prefetchComponent(page.name, {});
+  }
+}
+
 seamless.navigateTo = function (to) {
   window.history.pushState({}, "", to);
   window.dispatchEvent(PageStateChange);
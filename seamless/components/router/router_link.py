@@ -1,12 +1,51 @@
+from json import dumps
+from typing import Literal
+
 from seamless import Component, A, JS
 
 
 class RouterLink(Component):
-    def __init__(self, *, to, **kwargs):
+    def __init__(
+        self,
+        *,
+        to,
+        prefetch: Literal["hover", "visible"] | None = None,
+        init: JS | None = None,
+        **kwargs,
+    ):
         self.to = to
+        self.prefetch = prefetch
+        self.init = init
         self.kwargs = kwargs
 
     def render(self):
+        props = dict(self.kwargs)
+        init = self._prefetch_js()
+        if self.init is not None:
+            props["init"] = self.init if init is None else init + self.init
+        elif init is not None:
+            props["init"] = init
+
         return A(
-            href=self.to, on_click=JS(f"event.preventDefault(); return seamless.navigateTo('{self.to}')"), **self.kwargs
+            href=self.to,
+            on_click=JS(f"event.preventDefault(); return seamless.navigateTo('{self.to}')"),
+            **props,
         )(*self.children)
+
+    def _prefetch_js(self):
+        prefetch = f"seamless.prefetchRoute?.({dumps(self.to)})"
+        if self.prefetch == "hover":
+            return JS(
+                f"this.addEventListener('mouseenter', () => {prefetch}, {{ once: true }});"
+                f"this.addEventListener('focus', () => {prefetch}, {{ once: true }});"
+            )
+        if self.prefetch == "visible":
+            return JS(
+                f"""new IntersectionObserver((entries, observer) => {{
+                  if (entries.some((entry) => entry.isIntersecting)) {{
+                    observer.disconnect();
+                    {prefetch};
+                  }}
+                }}).observe(this);"""
+            )
+        return None
@@ -0,0 +1,308 @@
+import os
+import pickle
+import sqlite3
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic, time
+from typing import TYPE_CHECKING, Iterable
+
+from seamless.errors import ActionError
+
+if TYPE_CHECKING:
+    from .database import Action
+
+
+class ActionStore:
+    """
+    The storage of the actions registered by `ElementsDatabase`.
+
+    Actions rendered in an HTTP request are kept unclaimed under the claim ID of
+    the request, until a socket claims them or their claim time passes. Claimed
+    actions are kept either globally or in the scope of the socket that claimed
+    them.
+    """
+
+    def add_unclaimed(self, claim_id: str, action: "Action", claim_time: float) -> bool:
+        """
+        Adds an action to the actions of a claim, starting its claim time if it
+        is a new claim.
+
+        Returns:
+            Whether this is a new claim.
+        """
+        raise NotImplementedError("self.add_unclaimed is not implemented")
+
+    def pop_unclaimed(self, claim_id: str) -> list["Action"] | None:
+        """
+        Removes the actions of a claim.
+
+        Returns:
+            The actions of the claim, or `None` if there is no such claim.
+        """
+        raise NotImplementedError("self.pop_unclaimed is not implemented")
+
+    def sweep(self) -> int:
+        """
+        Removes the claims whose claim time has passed.
+
+        Returns:
+            The number of claims that expired.
+        """
+        raise NotImplementedError("self.sweep is not implemented")
+
+    def add(self, action: "Action", scope: str | None = None):
+        raise NotImplementedError("self.add is not implemented")
+
+    def get(self, action_id: str, scope: str | None = None) -> "Action | None":
+        raise NotImplementedError("self.get is not implemented")
+
+    def release(self, scope: str):
+        """
+        Removes all the actions in the scope.
+        """
+        raise NotImplementedError("self.release is not implemented")
+
+    def discard(self, action_ids: Iterable[str], scope: str):
+        """
+        Removes the actions with the given IDs from the scope.
+        """
+        raise NotImplementedError("self.discard is not implemented")
+
+    def pending_claims(self) -> int:
+        raise NotImplementedError("self.pending_claims is not implemented")
+
+    def unclaimed_actions(self) -> Iterable[str]:
+        """
+        Returns the IDs of all the unclaimed actions.
+        """
+        raise NotImplementedError("self.unclaimed_actions is not implemented")
+
+
+class MemoryActionStore(ActionStore):
+    """
+    Keeps the actions in the memory of the process.
+    """
+
+    def __init__(self):
+        self.events: dict[str, "Action"] = {}
+        self.scopes: dict[str, dict[str, "Action"]] = {}
+        self.unclaimed: dict[str, list["Action"]] = {}
+        # Claim deadlines in the order they were scheduled. The claim time is the
+        # same for all claims, so this is also the order in which they expire.
+        self._claim_deadlines = deque[tuple[float, str]]()
+        self._sweep_lock = Lock()
+
+    def add_unclaimed(self, claim_id, action, claim_time):
+        try:
+            self.unclaimed[claim_id].append(action)
+            return False
+        except KeyError:
+            self.unclaimed[claim_id] = [action]
+            self._claim_deadlines.append((monotonic() + claim_time, claim_id))
+            return True
+
+    def pop_unclaimed(self, claim_id):
+        return self.unclaimed.pop(claim_id, None)
+
+    def sweep(self):
+        now = monotonic()
+        expired = 0
+        with self._sweep_lock:
+            while self._claim_deadlines and self._claim_deadlines[0][0] <= now:
+                _, claim_id = self._claim_deadlines.popleft()
+                if self.unclaimed.pop(claim_id, None) is not None:
+                    expired += 1
+
+        return expired
+
+    def add(self, action, scope=None):
+        if scope:
+            self.scopes.setdefault(scope, {})[action.id] = action
+        else:
+            self.events[action.id] = action
+
+    def get(self, action_id, scope=None):
+        if scope and action_id in self.scopes.get(scope, ()):
+            return self.scopes[scope][action_id]
+        return self.events.get(action_id)
+
+    def release(self, scope):
+        self.scopes.pop(scope, None)
+
+    def discard(self, action_ids, scope):
+        actions = self.scopes.get(scope, {})
+        for action_id in action_ids:
+            actions.pop(action_id, None)
+
+    def pending_claims(self):
+        return len(self.unclaimed)
+
+    def unclaimed_actions(self):
+        return [action.id for actions in self.unclaimed.values() for action in actions]
+
+
+class SQLiteActionStore(ActionStore):
+    """
+    Keeps the actions in an SQLite database, so the worker processes of a server
+    on the same host can share them. A socket can then claim the actions that
+    were rendered by another worker.
+
+    The callbacks of the actions are pickled, so they must be module level
+    functions, or methods of objects that can be pickled.
+
+    Args:
+        path: The path of the database file.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS unclaimed (
+        claim_id TEXT NOT NULL,
+        action_id TEXT NOT NULL,
+        callback BLOB NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS unclaimed_claim_id ON unclaimed (claim_id);
+    CREATE INDEX IF NOT EXISTS unclaimed_expires_at ON unclaimed (expires_at);
+    CREATE TABLE IF NOT EXISTS actions (
+        scope TEXT NOT NULL,
+        action_id TEXT NOT NULL,
+        callback BLOB NOT NULL,
+        PRIMARY KEY (scope, action_id)
+    );
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self._lock = Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        # Unpickled actions, so an action is only loaded once per process.
+        self._loaded: dict[tuple[str, str], "Action"] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Connections must not be shared with forked worker processes.
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None, timeout=30
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(self._SCHEMA)
+            self._pid = os.getpid()
+            self._loaded.clear()
+
+        return self._connection
+
+    def _execute(self, sql: str, parameters=()) -> list[tuple]:
+        with self._lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            connection = self.connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def add_unclaimed(self, claim_id, action, claim_time):
+        callback = _dump(action)
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT expires_at FROM unclaimed WHERE claim_id = ? LIMIT 1",
+                (claim_id,),
+            ).fetchone()
+            expires_at = row[0] if row else time() + claim_time
+            connection.execute(
+                "INSERT INTO unclaimed VALUES (?, ?, ?, ?)",
+                (claim_id, action.id, callback, expires_at),
+            )
+
+        return row is None
+
+    def pop_unclaimed(self, claim_id):
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT callback FROM unclaimed WHERE claim_id = ? ORDER BY rowid",
+                (claim_id,),
+            ).fetchall()
+            connection.execute("DELETE FROM unclaimed WHERE claim_id = ?", (claim_id,))
+
+        if not rows:
+            return None
+
+        return [pickle.loads(callback) for (callback,) in rows]
+
+    def sweep(self):
+        now = time()
+        with self._transaction() as connection:
+            (expired,) = connection.execute(
+                "SELECT COUNT(DISTINCT claim_id) FROM unclaimed WHERE expires_at <= ?",
+                (now,),
+            ).fetchone()
+            if expired:
+                connection.execute("DELETE FROM unclaimed WHERE expires_at <= ?", (now,))
+
+        return expired
+
+    def add(self, action, scope=None):
+        self._execute(
+            "INSERT OR REPLACE INTO actions VALUES (?, ?, ?)",
+            (scope or "", action.id, _dump(action)),
+        )
+        self._loaded[(scope or "", action.id)] = action
+
+    def get(self, action_id, scope=None):
+        for key in ((scope, action_id), ("", action_id)) if scope else (("", action_id),):
+            try:
+                return self._loaded[key]
+            except KeyError:
+                pass
+
+            rows = self._execute(
+                "SELECT callback FROM actions WHERE scope = ? AND action_id = ?", key
+            )
+            if rows:
+                action = self._loaded[key] = pickle.loads(rows[0][0])
+                return action
+
+        return None
+
+    def release(self, scope):
+        self._execute("DELETE FROM actions WHERE scope = ?", (scope,))
+        for key in [key for key in self._loaded if key[0] == scope]:
+            del self._loaded[key]
+
+    def discard(self, action_ids, scope):
+        action_ids = list(action_ids)
+        placeholders = ", ".join("?" * len(action_ids))
+        self._execute(
+            f"DELETE FROM actions WHERE scope = ? AND action_id IN ({placeholders})",
+            (scope, *action_ids),
+        )
+        for action_id in action_ids:
+            self._loaded.pop((scope, action_id), None)
+
+    def pending_claims(self):
+        ((count,),) = self._execute("SELECT COUNT(DISTINCT claim_id) FROM unclaimed")
+        return count
+
+    def unclaimed_actions(self):
+        return [row[0] for row in self._execute("SELECT action_id FROM unclaimed")]
+
+
+def _dump(action: "Action") -> bytes:
+    try:
+        return pickle.dumps(action)
+    except Exception as e:
+        raise ActionError(
+            f"Cannot store the action {action.callback!r}, only module level "
+            "functions and methods of objects that can be pickled can be shared "
+            "between processes."
+        ) from e
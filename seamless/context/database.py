@@ -1,120 +1,373 @@
-from inspect import iscoroutinefunction, ismethod, signature
-from typing import Any, Callable, TypeAlias
-from threading import Timer
+from inspect import iscoroutinefunction, signature
+from typing import Any, Callable, Sequence
+from weakref import WeakKeyDictionary
 
 from seamless.core import SocketID
 from seamless.errors import ActionError
-from seamless.internal import wrap_with_validation
-from .request import request as _request, RequestType
+from seamless.internal import _DataValidationError, _obj, validation_model
+from .action_store import ActionStore, MemoryActionStore
+from .executor import ExecutorPolicy
+from .request import request as _request, Request, RequestType
 
+try:
+    from pydantic import ValidationError
+except ImportError:
+    ValidationError = _DataValidationError
 
-ActionsMap: TypeAlias = dict[str, Callable] | dict[str, dict[str, Callable]]
+
+class _InvocationPlan:
+    """
+    How the callbacks of a function are invoked: where the socket ID is
+    injected, whether the function is a coroutine function, and the model that
+    validates its arguments.
+    """
+
+    __slots__ = (
+        "socket_id_positions",
+        "is_async",
+        "model",
+        "parameters",
+        "executor",
+        "coalesce",
+    )
+
+    def __init__(self, callback: Callable):
+        function = getattr(callback, "__func__", callback)
+        parameters = list(signature(function).parameters.values())
+        if function is not callback:
+            parameters = parameters[1:]
+
+        self.socket_id_positions = tuple(
+            index
+            for index, parameter in enumerate(parameters)
+            if parameter.annotation is SocketID
+        )
+        self.is_async = iscoroutinefunction(callback) or iscoroutinefunction(
+            getattr(callback, "__call__", None)
+        )
+        validation = validation_model(callback)
+        self.model, self.parameters = validation if validation else (None, ())
+        self.executor = getattr(function, "__seamless_executor__", None)
+        self.coalesce = getattr(function, "__seamless_coalesce__", False)
+
+
+_PLANS = WeakKeyDictionary()
+
+
+def invocation_plan(callback: Callable) -> _InvocationPlan:
+    """
+    Returns the invocation plan of a callback. Plans are cached by function,
+    like `validation_model`, so all the bound methods of a function share a
+    plan.
+    """
+    function = getattr(callback, "__func__", callback)
+    bound = function is not callback
+
+    try:
+        plans = _PLANS[function]
+    except KeyError:
+        plans = _PLANS[function] = {}
+    except TypeError:
+        # Callables that can't be weakly referenced are not cached.
+        return _InvocationPlan(callback)
+
+    try:
+        return plans[bound]
+    except KeyError:
+        plan = plans[bound] = _InvocationPlan(callback)
+        return plan
 
 
 class Action:
+    """
+    A callback that can be invoked by the client.
+
+    How the callback is invoked is planned once per function, see
+    `invocation_plan`.
+    """
+
     def __init__(
         self,
-        action: Callable,
+        callback: Callable,
         id: str,
     ):
         self.id = id
-        self.action = action  # TODO: make wrapper for action for data validation
+        self.callback = callback
+        self._plan = invocation_plan(callback)
+
+    @property
+    def coalesce(self) -> bool:
+        return self._plan.coalesce
+
+    def __getstate__(self):
+        # Only the callback is stored, the invocation plan is created again.
+        return {"id": self.id, "callback": self.callback}
+
+    def __setstate__(self, state):
+        self.__init__(state["callback"], state["id"])
+
+    @property
+    def shared(self) -> bool:
+        """
+        Whether the action can be shared by all the clients. Only the actions of
+        module level functions are shared, the rest are bound to the client that
+        rendered them.
+        """
+        return "#" not in self.id
+
+    async def invoke(
+        self,
+        data: Sequence[Any],
+        socket_id: str | None = None,
+        executor: ExecutorPolicy | None = None,
+    ) -> Any:
+        """
+        Invokes the callback with the data sent by the client, injecting the
+        socket ID to the parameters annotated with `SocketID`.
+
+        Synchronous callbacks are run by `executor`, or on the event loop if no
+        executor is given.
+        """
+        plan = self._plan
+        if plan.socket_id_positions:
+            data = list(data)
+            for index in plan.socket_id_positions:
+                data.insert(index, socket_id)
+
+        if plan.model is None:
+            args = [_obj(arg) if isinstance(arg, dict) else arg for arg in data]
+            kwargs = {}
+        else:
+            try:
+                arguments = plan.model(**dict(zip(plan.parameters, data)))
+            except ValidationError as e:
+                raise _DataValidationError(e.json(include_url=False))
+
+            args = ()
+            kwargs = {name: getattr(arguments, name) for name in plan.parameters}
+
+        if plan.is_async:
+            return await self.callback(*args, **kwargs)
+        if executor is None:
+            return self.callback(*args, **kwargs)
+        return await executor.run(
+            executor.kind(plan.executor), self.callback, *args, **kwargs
+        )
+
+    async def __call__(self, *args: Any) -> Any:
+        return await self.invoke(args)
+
+
+class ActionKeys:
+    """
+    Assigns deterministic IDs to the callbacks registered in a single render, or
+    by a single socket.
+
+    The ID of a module level function is its import path. Other callbacks, such
+    as methods and closures, are also keyed by the order in which their instance
+    was rendered, so rendering the same page gives the same IDs in every process.
+    """
+
+    def __init__(self, render_id: str | None = None):
+        self.render_id = render_id
+        self.actions: dict[Callable, Action] = {}
+        # The instance keys by the `id` of the instance, and the instance itself
+        # so the ID is not reused.
+        self._instances: dict[int, tuple[Any, int]] = {}
+        self._counters: dict[str, int] = {}
+
+    def action_id(self, callback: Callable) -> str:
+        owner = getattr(callback, "__self__", None)
+        function = getattr(callback, "__func__", callback)
+        name = _qualified_name(function)
+
+        if owner is not None:
+            return f"{name}#{self._instance_key(owner)}"
+
+        if _is_module_level(function):
+            return name
+
+        return f"{name}#{self._next(name)}"
+
+    def adopt(self, action: Action):
+        """
+        Adds an action that was keyed elsewhere, such as a claimed action that
+        was rendered in an HTTP request, so its ID is kept for its callback and
+        is not given to another one.
+        """
+        self.actions[action.callback] = action
+        name, _, index = action.id.partition("#")
+        if not index:
+            return
+
+        owner = getattr(action.callback, "__self__", None)
+        if owner is not None:
+            self._instances.setdefault(id(owner), (owner, int(index)))
+            name = _qualified_name(type(owner))
+        self._counters[name] = max(self._counters.get(name, 0), int(index) + 1)
+
+    def _instance_key(self, owner) -> int:
+        try:
+            return self._instances[id(owner)][1]
+        except KeyError:
+            key = self._next(_qualified_name(type(owner)))
+            self._instances[id(owner)] = (owner, key)
+            return key
+
+    def _next(self, name: str) -> int:
+        index = self._counters.get(name, 0)
+        self._counters[name] = index + 1
+        return index
+
+
+def _qualified_name(obj) -> str:
+    if not hasattr(obj, "__qualname__"):
+        obj = type(obj)
+    return f"{obj.__module__}:{obj.__qualname__}"
+
 
-    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        if iscoroutinefunction(self.action):
-            return await self.action(*args, **kwargs)
-        return self.action(*args, **kwargs)
+def _is_module_level(function) -> bool:
+    qualname = getattr(function, "__qualname__", None)
+    return (
+        qualname is not None
+        and "." not in qualname
+        and "<" not in qualname
+        and getattr(function, "__module__", None) is not None
+    )
 
 
 class ElementsDatabase:
+    """
+    The actions that were rendered, by their ID.
 
-    def __init__(self, *, claim_time=20.0):
-        self.events: ActionsMap = {}
-        self.actions_ids = dict[str | Callable, Action]()
-        self._unclaimed_elements = dict[str, list[Action]]()
-        self._unclaimed_elements_timeouts = dict[str, Timer]()
+    Args:
+        claim_time: The number of seconds a socket has to claim the actions
+        rendered in an HTTP request.
+        store: Where the actions are stored, in memory by default. Use a
+        `SQLiteActionStore` to share the actions between worker processes.
+        executor: Where synchronous actions run, see `ExecutorPolicy`.
+    """
+
+    def __init__(
+        self,
+        *,
+        claim_time=20.0,
+        store: ActionStore | None = None,
+        executor: ExecutorPolicy | None = None,
+    ):
+        self.store = store or MemoryActionStore()
+        self.executor = executor or ExecutorPolicy()
+        self._render_keys = WeakKeyDictionary[Request, ActionKeys]()
+        self._socket_keys = dict[str, ActionKeys]()
         self.claim_time = claim_time
+        self.expired_claims = 0
+        self.claimed_claims = 0
 
     def add_event(self, callback: Callable, scope=None):
-        action_id = str(hash(callback))
+        request = _request()
+        keys = self._action_keys(request)
         try:
-            return self.actions_ids[action_id]
+            return keys.actions[callback]
         except KeyError:
             pass
 
-        request = _request()
-        action = Action(wrap_with_validation(callback), action_id)
+        action = keys.actions[callback] = Action(callback, keys.action_id(callback))
 
         if request.type == RequestType.HTTP:
-            if request.id not in self._unclaimed_elements:
-                self._unclaimed_elements[request.id] = []
-
-            self._unclaimed_elements[request.id].append(action)
-
-            def delete_unclaimed(claim_id):
-                if claim_id in self._unclaimed_elements:
-                    del self._unclaimed_elements[claim_id]
-
-            timer = Timer(self.claim_time, delete_unclaimed, [request.id])
-            self._unclaimed_elements_timeouts[request.id] = timer
-            timer.start()
+            if self.store.add_unclaimed(request.id, action, self.claim_time):
+                self.sweep()
         else:
-            self.actions_ids[action_id] = action
+            if scope is None and not action.shared:
+                scope = request.socket_id
+            self.store.add(action, scope)
 
-            if scope:
-                if scope not in self.events:
-                    self.events[scope] = {}
+        return action
 
-                self.events[scope][action.id] = action
-            else:
-                self.events[action.id] = action
+    def _action_keys(self, request: Request) -> ActionKeys:
+        if request.type == RequestType.HTTP:
+            keys = self._render_keys.get(request)
+            if keys is None or keys.render_id != request.id:
+                keys = self._render_keys[request] = ActionKeys(request.id)
+            return keys
 
-        return action
+        try:
+            return self._socket_keys[request.socket_id]
+        except KeyError:
+            keys = self._socket_keys[request.socket_id] = ActionKeys()
+            return keys
 
     async def invoke_event(self, event: str, *data, scope=None):
-        if scope and scope in self.events and event in self.events[scope]:
-            func = self.events[scope][event]
-        elif event in self.events:
-            func = self.events[event]
-        else:
+        action = self.store.get(event, scope)
+        if action is None:
             raise ActionError("Event not found")
-        
-        data = list(data)
-        for index, param in enumerate(signature(func.action).parameters.values()):
-            if param.annotation is SocketID:
-                data.insert(index, scope)
-        return await func(*data)
+
+        return await action.invoke(data, scope, self.executor)
 
     def claim(self, claim_id, client_id):
-        if claim_id not in self._unclaimed_elements:
+        self.sweep()
+        actions = self.store.pop_unclaimed(claim_id)
+        if actions is None:
             return
 
-        self._unclaimed_elements_timeouts[claim_id].cancel()
-        del self._unclaimed_elements_timeouts[claim_id]
-
-        for action in self._unclaimed_elements[claim_id]:
-            if ismethod(action.action):
-                if client_id not in self.events:
-                    self.events[client_id] = {}
-                self.events[client_id][action.id] = action
-            else:
-                self.events[action.id] = action
-
-        del self._unclaimed_elements[claim_id]
+        self.claimed_claims += 1
+        # The socket goes on numbering its actions after the claimed ones, so
+        # the actions it renders don't replace them.
+        keys = self._socket_keys.setdefault(client_id, ActionKeys())
+        for action in actions:
+            keys.adopt(action)
+            self.store.add(action, None if action.shared else client_id)
 
     def release_actions(self, socket_id: str):
-        if socket_id not in self.events:
+        self._socket_keys.pop(socket_id, None)
+        self.store.release(socket_id)
+
+    def discard_actions(self, socket_id: str, action_ids: set[str]):
+        """
+        Removes actions the socket no longer renders, such as the closures of a
+        live component that was rendered again.
+        """
+        action_ids = {action_id for action_id in action_ids if "#" in action_id}
+        if not action_ids:
             return
 
-        del self.events[socket_id]
+        keys = self._socket_keys.get(socket_id)
+        if keys is not None:
+            keys.actions = {
+                callback: action
+                for callback, action in keys.actions.items()
+                if action.id not in action_ids
+            }
+        self.store.discard(action_ids, socket_id)
+
+    def sweep(self) -> int:
+        """
+        Removes the unclaimed actions whose claim time has passed.
+
+        This is called when actions are added or claimed, so it doesn't need to
+        be called explicitly.
+
+        Returns:
+            The number of claims that expired.
+        """
+        expired = self.store.sweep()
+        self.expired_claims += expired
+        return expired
 
     @property
-    def _all_unclaimed(self):
-        all_unclaimed = {}
-        for subscriptable_list in self._unclaimed_elements.values():
-            all_unclaimed.update((e.id, e) for e in subscriptable_list)
+    def pending_claims(self) -> int:
+        return self.store.pending_claims()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending_claims": self.pending_claims,
+            "expired_claims": self.expired_claims,
+            "claimed_claims": self.claimed_claims,
+            **self.executor.stats(),
+        }
 
-        return all_unclaimed
+    @property
+    def _all_unclaimed(self):
+        return list(self.store.unclaimed_actions())
 
 
 DB = ElementsDatabase(claim_time=30)
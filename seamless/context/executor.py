@@ -0,0 +1,155 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Literal, TypeVar
+
+from seamless.errors import ActionQueueFullError
+
+ExecutorKind = Literal["inline", "thread", "process"]
+CallableType = TypeVar("CallableType", bound=Callable)
+
+
+def inline(func: CallableType) -> CallableType:
+    """
+    Runs a synchronous action on the event loop instead of in the thread pool.
+
+    Use it for handlers that return quickly, to avoid handing them to a thread.
+    """
+    func.__seamless_executor__ = "inline"
+    return func
+
+
+def in_process(func: CallableType) -> CallableType:
+    """
+    Runs a synchronous action in the process pool of the executor policy, for
+    CPU-bound handlers.
+
+    The callback and its arguments are pickled and sent to another process, so
+    changes the handler makes to its component are not seen by the server.
+    """
+    func.__seamless_executor__ = "process"
+    return func
+
+
+def coalesce(func: CallableType) -> CallableType:
+    """
+    Lets events of the action that are still waiting to be handled be replaced
+    by newer ones, so only the latest of a burst of high-frequency events, like
+    `input` or `mousemove`, is handled.
+    """
+    func.__seamless_coalesce__ = True
+    return func
+
+
+class ExecutorPolicy:
+    """
+    Decides where the synchronous actions run.
+
+    By default, synchronous actions run in a bounded thread pool so a slow
+    handler doesn't block the event loop. Handlers decorated with `inline` run
+    on the event loop, and handlers decorated with `in_process` run in a process
+    pool.
+
+    Args:
+        max_workers: The number of threads of the thread pool. Defaults to the
+        default of `ThreadPoolExecutor`.
+        max_processes: The number of processes of the process pool, or `None` to
+        run `in_process` handlers in the thread pool.
+        max_pending: The number of actions that may be waiting or running in the
+        pools. Actions are rejected with `ActionQueueFullError` beyond it.
+        threads: Whether to run synchronous actions in the thread pool. When
+        `False`, they run on the event loop, as if they were `inline`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        max_processes: int | None = None,
+        max_pending: int | None = 1024,
+        threads: bool = True,
+    ):
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self.max_pending = max_pending
+        self.threads = threads
+
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self._lock = Lock()
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def kind(self, requested: ExecutorKind | None = None) -> ExecutorKind:
+        """
+        Returns where to run an action that requested to run in `requested`.
+        """
+        if requested == "inline" or not self.threads:
+            return "inline"
+        if requested == "process" and self.max_processes:
+            return "process"
+        return "thread"
+
+    async def run(self, kind: ExecutorKind, func: Callable, *args, **kwargs) -> Any:
+        if kind == "inline":
+            return func(*args, **kwargs)
+
+        with self._lock:
+            if self.max_pending is not None and self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ActionQueueFullError(
+                    "The server is busy, too many actions are pending"
+                )
+            self.pending += 1
+            self.submitted += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            if kind == "process":
+                return await loop.run_in_executor(
+                    self._pool(kind), partial(func, *args, **kwargs)
+                )
+
+            # Handlers run with the request of the event, like inline handlers.
+            context = copy_context()
+            return await loop.run_in_executor(
+                self._pool(kind), partial(context.run, func, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    def _pool(self, kind: ExecutorKind) -> Executor:
+        with self._lock:
+            if kind == "process":
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(self.max_processes)
+                return self._process_pool
+
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="seamless-action"
+                )
+            return self._thread_pool
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            pools = (self._thread_pool, self._process_pool)
+            self._thread_pool = self._process_pool = None
+
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending_actions": self.pending,
+            "submitted_actions": self.submitted,
+            "completed_actions": self.completed,
+            "rejected_actions": self.rejected,
+        }
@@ -0,0 +1,128 @@
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from seamless.errors import RenderError
+from seamless.internal import SEAMLESS_EVENTS_ATTRIBUTE
+from seamless.rendering.diff import diff
+from seamless.rendering.json import to_dict
+from .request import RequestType, request as _request
+
+if TYPE_CHECKING:
+    from seamless.components import Component
+
+
+def live_id(component: "Component") -> str:
+    """
+    Returns the ID the root element of a live component is rendered with.
+    """
+    try:
+        return component.__seamless_live_id__
+    except AttributeError:
+        component.__seamless_live_id__ = uuid4().hex[:12]
+        return component.__seamless_live_id__
+
+
+class LiveComponents:
+    """
+    The live components that were marked dirty by each socket, and the trees
+    last sent to it, which their new trees are diffed against.
+    """
+
+    def __init__(self):
+        self._dirty: dict[str, dict[str, "Component"]] = {}
+        self._trees: dict[str, dict[str, Any]] = {}
+
+    def mark_dirty(self, component: "Component"):
+        if not type(component).__seamless_live__:
+            raise TypeError(f"{type(component).__name__} is not a live component")
+
+        request = _request()
+        if request is None or request.type != RequestType.WS:
+            raise RenderError("Components can only be marked dirty while handling a socket event")
+
+        self._dirty.setdefault(request.socket_id, {})[live_id(component)] = component
+
+    def render_patches(self, socket_id: str) -> list[list]:
+        """
+        Renders the components the socket marked dirty.
+
+        Returns:
+            A list of `[live_id, patches]` of the components that changed, see
+            `diff`. A component that was not sent to the socket before is
+            replaced as a whole.
+
+        The actions of the previous tree that the new one no longer uses, such
+        as the closures it was rendered with, are discarded.
+        """
+        from .database import DB
+
+        dirty = self._dirty.pop(socket_id, None)
+        if not dirty:
+            return []
+
+        trees = self._trees.setdefault(socket_id, {})
+        updates = []
+        for component_id, component in dirty.items():
+            tree = to_dict(component)
+            old_tree = trees.get(component_id)
+            trees[component_id] = tree
+
+            if old_tree is None:
+                patches = [["replace", [], tree]]
+            else:
+                patches = diff(old_tree, tree)
+                DB.discard_actions(socket_id, action_ids(old_tree) - action_ids(tree))
+
+            if patches:
+                updates.append([component_id, patches])
+
+        return updates
+
+    def release(self, socket_id: str):
+        self._dirty.pop(socket_id, None)
+        self._trees.pop(socket_id, None)
+
+
+def action_ids(tree: Any) -> set[str]:
+    """
+    Returns the IDs of the actions bound to the events of a `to_dict` tree.
+    """
+    ids = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        bindings = node["props"].get(SEAMLESS_EVENTS_ATTRIBUTE)
+        if bindings:
+            for binding in bindings.split(","):
+                # `event:action_id`, optionally followed by `|policy:wait`.
+                ids.add(binding.partition(":")[2].partition("|")[0])
+        stack.extend(node["children"])
+
+    return ids
+
+
+LIVE = LiveComponents()
+
+
+def mark_dirty(component: "Component"):
+    """
+    Marks a live component to be rendered again once the current socket event
+    is handled. The socket is sent the changes to its tree, which the client
+    applies to the DOM.
+
+    Example:
+        >>> class Counter(Component, live=True):
+        ...     def __init__(self):
+        ...         self.count = 0
+        ...
+        ...     def render(self):
+        ...         return Button(self.count, on_click=self.increment)
+        ...
+        ...     def increment(self, event: MouseEvent):
+        ...         self.count += 1
+        ...         mark_dirty(self)
+    """
+    LIVE.mark_dirty(component)
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from enum import Enum
 from dataclasses import dataclass
 from urllib.parse import parse_qs
@@ -62,13 +64,33 @@ class HTTPRequest(Request):
         return f"{self.path}?{self._raw_query}"
 
 
-_request: WSRequest | HTTPRequest = None
+_request = ContextVar[WSRequest | HTTPRequest | None]("seamless_request", default=None)
 
 
 def request():
-    return _request
+    return _request.get()
 
 
-def set_request(request: Request):
-    global _request
-    _request = request
+def set_request(request: Request | None) -> Token:
+    """
+    Sets the request of the current context.
+
+    Prefer `request_context`, which restores the previous request when the
+    request is handled.
+    """
+    return _request.set(request)
+
+
+@contextmanager
+def request_context(request: Request):
+    """
+    Sets the request of the current context inside the `with` block.
+
+    The request is stored in a context variable, so concurrent requests that
+    are handled in different tasks or threads don't see each other's requests.
+    """
+    token = _request.set(request)
+    try:
+        yield request
+    finally:
+        _request.reset(token)
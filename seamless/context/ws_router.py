@@ -1,24 +1,174 @@
 from enum import Enum
-from seamless.rendering.json import to_dict
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from seamless.errors import ActionError, RenderError
+from seamless.rendering.context import ActionsTracker, track_actions
+from seamless.rendering.json import dict_to_compact, to_compact, to_dict
 from .database import DB
 from .components import COMPONENTS_REPOSITORY
 
+if TYPE_CHECKING:
+    from seamless.types import Renderable
+
 
 class WSRouterCommands(str, Enum):
     GET_COMPONENT = "component"
+    GET_CACHED_COMPONENT = "cached_component"
     EVENT = "event"
+    EVENTS = "events"
 
 
-def get_component(sid: str, name: str, props={}):
+class WireFormat(str, Enum):
+    JSON = "json"
+    COMPACT = "compact"
+
+
+_ENCODERS = {
+    WireFormat.JSON: to_dict,
+    WireFormat.COMPACT: to_compact,
+}
+
+# The wire format of each socket that did not use the default one.
+_socket_formats: dict[str, WireFormat] = {}
+
+
+def negotiate_format(sid: str, auth) -> WireFormat:
+    """
+    Chooses the format the components are sent to the socket in, from the
+    `format` the client requested in its connection auth data. Clients that
+    did not request a known format get the JSON format.
+    """
+    try:
+        wire_format = WireFormat(auth.get("format", WireFormat.JSON))
+    except (AttributeError, ValueError):
+        wire_format = WireFormat.JSON
+
+    if wire_format is WireFormat.JSON:
+        _socket_formats.pop(sid, None)
+    else:
+        _socket_formats[sid] = wire_format
+
+    return wire_format
+
+
+def release_format(sid: str):
+    _socket_formats.pop(sid, None)
+
+
+def room_name(room: str, sid: str) -> str:
+    """
+    Returns the socket.io room a socket joins for `room`. Sockets are grouped by
+    their wire format, so each group is sent a payload that is encoded once.
+    """
+    return _format_room(room, _socket_formats.get(sid, WireFormat.JSON))
+
+
+def _format_room(room: str, wire_format: WireFormat) -> str:
+    return f"seamless:{room}:{wire_format.value}"
+
+
+class _BroadcastActionsTracker(ActionsTracker):
+    def on_action(self):
+        raise RenderError("Broadcast components cannot have server-side event handlers")
+
+
+def broadcast_payloads(
+    room: str, component: "Renderable", has_members: Callable[[str], bool]
+) -> list[tuple[str, Any]]:
+    """
+    Renders a component broadcast to `room` once.
+
+    Returns:
+        The socket.io rooms that have members, with the payload to send them.
+    """
+    with track_actions(_BroadcastActionsTracker()):
+        tree = to_dict(component)
+
+    payloads = []
+    for wire_format in WireFormat:
+        name = _format_room(room, wire_format)
+        if has_members(name):
+            payload = tree if wire_format is WireFormat.JSON else dict_to_compact(tree)
+            payloads.append((name, payload))
+
+    return payloads
+
+
+def _fetch_component(sid: str, name: str, props: dict):
     cls = COMPONENTS_REPOSITORY.get_component(name)
-    return to_dict(cls(**props))
+    wire_format = _socket_formats.get(sid, WireFormat.JSON)
+
+    def render():
+        return _ENCODERS[wire_format](cls(**props))
+
+    cache = cls.__seamless_fetch_cache__
+    if cache is None:
+        return None, None, render()
+
+    etag, payload = cache.fetch(props, wire_format, render)
+    return etag, cache.ttl if etag is not None else None, payload
+
+
+def get_component(sid: str, name: str, props={}):
+    _, _, payload = _fetch_component(sid, name, props)
+    return payload
+
+
+def get_cached_component(sid: str, name: str, props={}, etag: str | None = None):
+    """
+    Like `get_component`, with the ETag of the payload and the number of seconds
+    the client may keep it for, `max_age`. The payload is left out when it is
+    the one the client already has, identified by `etag`.
+
+    Components that are not cached have no ETag and are always sent.
+    """
+    current_etag, max_age, payload = _fetch_component(sid, name, props)
+    if etag is not None and etag == current_etag:
+        return {"etag": current_etag, "max_age": max_age}
+
+    return {"etag": current_etag, "max_age": max_age, "component": payload}
 
 
 async def event(sid: str, data: str, event_data: dict):
     await DB.invoke_event(data, event_data, scope=sid)
 
 
+async def events(sid: str, batch: list):
+    """
+    Invokes a batch of events, sent by the client as a list of
+    `[action_id, event_data]` pairs, in order.
+
+    For actions that coalesce their events only the last event of the batch is
+    invoked. All the events are invoked even if some fail, and the first error
+    is raised after them.
+    """
+    if not isinstance(batch, list) or not all(
+        isinstance(item, list) and len(item) == 2 and isinstance(item[0], str)
+        for item in batch
+    ):
+        raise ActionError("Invalid events batch")
+
+    last_index = {action_id: index for index, (action_id, _) in enumerate(batch)}
+    error = None
+    for index, (action_id, event_data) in enumerate(batch):
+        if last_index[action_id] != index:
+            action = DB.store.get(action_id, sid)
+            if action is not None and action.coalesce:
+                continue
+
+        try:
+            await DB.invoke_event(action_id, event_data, scope=sid)
+        except Exception as e:
+            error = error or e
+
+    if error is not None:
+        raise error
+
+
 ws_router = {
     WSRouterCommands.GET_COMPONENT: get_component,
+    WSRouterCommands.GET_CACHED_COMPONENT: get_cached_component,
     WSRouterCommands.EVENT: event,
+    WSRouterCommands.EVENTS: events,
 }
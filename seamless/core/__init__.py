@@ -1,10 +1,20 @@
 from .javascript import JavaScript, JS
 from .empty import Empty
 from .sid import SocketID
+from .static import Static, static
+from .event_policy import EventPolicy, debounce, throttle, latest
+from ..context.live import mark_dirty
 
 __all__ = [
     "JavaScript",
     "JS",
     "Empty",
     "SocketID",
+    "Static",
+    "static",
+    "EventPolicy",
+    "debounce",
+    "throttle",
+    "latest",
+    "mark_dirty",
 ]
@@ -6,6 +6,8 @@ if TYPE_CHECKING:
     from seamless.types import ChildType
 
 class Empty(Element):
+    __slots__ = ()
+
     tag_name = "seamless:empty"
 
     def __init__(self, *args: "ChildType", **props: Any):
@@ -0,0 +1,59 @@
+from typing import Any, Callable, Literal
+
+EventPolicyKind = Literal["debounce", "throttle", "latest"]
+
+
+class EventPolicy:
+    """
+    An event handler whose events are rate limited in the browser, before they
+    are sent to the server. See `debounce`, `throttle` and `latest`.
+    """
+
+    def __init__(self, handler: Callable, kind: EventPolicyKind, wait: int = 0):
+        if isinstance(handler, EventPolicy):
+            raise TypeError("Event policies cannot be nested")
+        if wait < 0:
+            raise ValueError("wait must not be negative")
+
+        self.handler = handler
+        self.kind = kind
+        self.wait = int(wait)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.handler(*args, **kwargs)
+
+    def __repr__(self):
+        return f"{self.kind}({self.handler!r}, {self.wait})"
+
+
+def debounce(handler: Callable, wait: int) -> EventPolicy:
+    """
+    Sends the event to the server only after no events were triggered for `wait`
+    milliseconds, for example to handle `on_input` once the user stops typing.
+
+    Example:
+        >>> Input(on_input=debounce(self.search, 300))
+    """
+    return EventPolicy(handler, "debounce", wait)
+
+
+def throttle(handler: Callable, wait: int) -> EventPolicy:
+    """
+    Sends at most one event to the server every `wait` milliseconds, the latest
+    event that was triggered in that time.
+
+    Example:
+        >>> Div(on_mousemove=throttle(self.track, 100))
+    """
+    return EventPolicy(handler, "throttle", wait)
+
+
+def latest(handler: Callable) -> EventPolicy:
+    """
+    Sends an event to the server only after the previous one was handled, and
+    drops all but the latest event that was triggered in the meanwhile.
+
+    Example:
+        >>> Input(type="range", on_input=latest(self.set_volume))
+    """
+    return EventPolicy(handler, "latest")
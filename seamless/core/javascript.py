@@ -31,16 +31,14 @@ class JavaScript:
             )
 
 
-@transformer_for(lambda key, value: key == "init" and isinstance(value, JavaScript))
+@transformer_for("init", value_type=JavaScript)
 def transform_init_source(key: str, source: JavaScript, props):
     props[SEAMLESS_ELEMENT_ATTRIBUTE] = True
     props[SEAMLESS_INIT_ATTRIBUTE] = props.get(SEAMLESS_INIT_ATTRIBUTE, "") + source.code
     del props[key]
 
 
-@transformer_for(
-    lambda key, value: key.startswith("on_") and isinstance(value, JavaScript)
-)
+@transformer_for(prefix="on_", value_type=JavaScript)
 def transform_event_source(key: str, source: JavaScript, props):
     event_name = key.removeprefix("on_")
 
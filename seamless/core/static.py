@@ -0,0 +1,58 @@
+from typing import TYPE_CHECKING, Any
+
+from seamless.errors import RenderError
+from seamless.rendering.context import ActionsTracker, track_actions
+
+if TYPE_CHECKING:
+    from seamless.types import Renderable
+
+
+class _StaticActionsTracker(ActionsTracker):
+    def on_action(self):
+        raise RenderError("Static subtrees cannot have server-side event handlers")
+
+
+class Static:
+    """
+    A subtree that was rendered once, see `static`.
+    """
+
+    def __init__(self, element: "Renderable"):
+        from seamless.rendering.html import _render
+
+        self.element = element
+        with track_actions(_StaticActionsTracker()):
+            self.html = _render(element)
+        self._data = None
+
+    @property
+    def data(self) -> Any:
+        """
+        The JSON representation of the subtree, rendered on first use.
+        """
+        if self._data is None:
+            from seamless.rendering.json import to_dict
+
+            self._data = to_dict(self.element)
+        return self._data
+
+    def __str__(self):
+        return self.html
+
+
+def static(element: "Renderable") -> Static:
+    """
+    Renders a subtree that never changes once, so that rendering the trees it is
+    used in splices the pre-rendered HTML instead of rendering it again.
+
+    The subtree must not have server-side event handlers, since those are bound
+    to the request they were rendered in.
+
+    Example:
+        >>> NAV = static(Nav(A("Home", href="/"), A("About", href="/about")))
+        ...
+        >>> class Layout(Component):
+        ...     def render(self):
+        ...         return Div(NAV, *self.children)
+    """
+    return Static(element)
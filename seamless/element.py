@@ -1,18 +1,20 @@
 from typing import TYPE_CHECKING, TypeVar, Generic, Unpack
 
 from .internal import to_iter
-from .types.html import HTMLElement
 from .rendering.props import transform_props
 
 
 if TYPE_CHECKING:
     from seamless.types import ChildrenType, ChildType
+    from .types.html import HTMLElement
 
 
-PropsType = TypeVar("PropsType", bound=HTMLElement)
+PropsType = TypeVar("PropsType", bound="HTMLElement")
 
 
 class Element(Generic[PropsType]):
+    __slots__ = ("children", "props")
+
     def __init__(
         self,
         *args: "ChildType",
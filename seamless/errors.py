@@ -15,4 +15,10 @@ class ActionError(Error):
     """
     Raised when an error occurs while invoking an action.
     """
-    ...
\ No newline at end of file
+    ...
+
+class ActionQueueFullError(ActionError):
+    """
+    Raised when an action is rejected because too many actions are pending.
+    """
+    ...
@@ -68,7 +68,7 @@ class State(metaclass=_StateMeta):
 
 
 @transformer_for(
-    lambda _, value: isinstance(value, Empty) and value.props.get("state-name", False)
+    lambda _, value: value.props.get("state-name", False), value_type=Empty
 )
 def transform_state(key, value, props):
     empty_props = value.props
@@ -1,233 +1,264 @@
-from .a import A
-from .abbr import Abbr
-from .address import Address
-from .area import Area
-from .article import Article
-from .aside import Aside
-from .audio import Audio
-from .b import B
-from .base import Base
-from .bdi import Bdi
-from .bdo import Bdo
-from .blockquote import BlockQuote
-from .body import Body
-from .br import Br
-from .button import Button
-from .canvas import Canvas
-from .caption import Caption
-from .cite import Cite
-from .code import Code
-from .col import Col
-from .colgroup import ColGroup
-from .data import Data
-from .datalist import DataList
-from .dd import Dd
-from .del_ import Del
-from .details import Details
-from .dfn import Dfn
-from .dialog import Dialog
-from .div import Div
-from .dl import Dl
-from .dt import Dt
-from .em import Em
-from .embed import Embed
-from .fieldset import FieldSet
-from .figcaption import FigCaption
-from .figure import Figure
-from .footer import Footer
-from .form import Form
-from .fragment import Fragment
-from .h1 import H1
-from .h2 import H2
-from .h3 import H3
-from .h4 import H4
-from .h5 import H5
-from .h6 import H6
-from .head import Head
-from .header import Header
-from .hgroup import HGroup
-from .hr import Hr
-from .html import Html
-from .i import I
-from .iframe import IFrame
-from .img import Img
-from .input import Input
-from .ins import Ins
-from .kbd import Kbd
-from .label import Label
-from .legend import Legend
-from .li import Li
-from .link import Link
-from .main import Main
-from .map import Map
-from .mark import Mark
-from .menu import Menu
-from .meta import Meta
-from .meter import Meter
-from .nav import Nav
-from .noscript import NoScript
-from .object import Object
-from .ol import Ol
-from .optgroup import OptGroup
-from .option import Option
-from .output import Output
-from .p import P
-from .param import Param
-from .picture import Picture
-from .pre import Pre
-from .progress import Progress
-from .q import Q
-from .rp import Rp
-from .rt import Rt
-from .ruby import Ruby
-from .s import S
-from .samp import Samp
-from .script import Script
-from .search import Search
-from .section import Section
-from .select import Select
-from .slot import Slot
-from .small import Small
-from .source import Source
-from .span import Span
-from .strong import Strong
-from .style import Style
-from .sub import Sub
-from .summary import Summary
-from .sup import Sup
-from .svg import Svg
-from .table import Table
-from .tbody import TBody
-from .td import Td
-from .template import Template
-from .textarea import TextArea
-from .tfoot import TFoot
-from .th import Th
-from .thead import THead
-from .time import Time
-from .title import Title
-from .tr import Tr
-from .track import Track
-from .u import U
-from .ul import Ul
-from .var import Var
-from .video import Video
-from .wbr import Wbr
-
-__all__ = [
-	"A",
-	"Abbr",
-	"Address",
-	"Area",
-	"Article",
-	"Aside",
-	"Audio",
-	"B",
-	"Base",
-	"Bdi",
-	"Bdo",
-	"BlockQuote",
-	"Body",
-	"Br",
-	"Button",
-	"Canvas",
-	"Caption",
-	"Cite",
-	"Code",
-	"Col",
-	"ColGroup",
-	"Data",
-	"DataList",
-	"Dd",
-	"Del",
-	"Details",
-	"Dfn",
-	"Dialog",
-	"Div",
-	"Dl",
-	"Dt",
-	"Em",
-	"Embed",
-	"FieldSet",
-	"FigCaption",
-	"Figure",
-	"Footer",
-	"Form",
-	"Fragment",
-	"H1",
-	"H2",
-	"H3",
-	"H4",
-	"H5",
-	"H6",
-	"Head",
-	"Header",
-	"HGroup",
-	"Hr",
-	"Html",
-	"I",
-	"IFrame",
-	"Img",
-	"Input",
-	"Ins",
-	"Kbd",
-	"Label",
-	"Legend",
-	"Li",
-	"Link",
-	"Main",
-	"Map",
-	"Mark",
-	"Menu",
-	"Meta",
-	"Meter",
-	"Nav",
-	"NoScript",
-	"Object",
-	"Ol",
-	"OptGroup",
-	"Option",
-	"Output",
-	"P",
-	"Param",
-	"Picture",
-	"Pre",
-	"Progress",
-	"Q",
-	"Rp",
-	"Rt",
-	"Ruby",
-	"S",
-	"Samp",
-	"Script",
-	"Search",
-	"Section",
-	"Select",
-	"Slot",
-	"Small",
-	"Source",
-	"Span",
-	"Strong",
-	"Style",
-	"Sub",
-	"Summary",
-	"Sup",
-	"Svg",
-	"Table",
-	"TBody",
-	"Td",
-	"Template",
-	"TextArea",
-	"TFoot",
-	"Th",
-	"THead",
-	"Time",
-	"Title",
-	"Tr",
-	"Track",
-	"U",
-	"Ul",
-	"Var",
-	"Video",
-	"Wbr",
-]
+"""
+The HTML elements, generated into the `_elements` module by `_auto_html.py`.
+The module is imported the first time an element is used, so importing
+`seamless` stays fast.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._elements import (
+        A,
+        Abbr,
+        Address,
+        Area,
+        Article,
+        Aside,
+        Audio,
+        B,
+        Base,
+        Bdi,
+        Bdo,
+        BlockQuote,
+        Body,
+        Br,
+        Button,
+        Canvas,
+        Caption,
+        Cite,
+        Code,
+        Col,
+        ColGroup,
+        Data,
+        DataList,
+        Dd,
+        Del,
+        Details,
+        Dfn,
+        Dialog,
+        Div,
+        Dl,
+        Dt,
+        Em,
+        Embed,
+        FieldSet,
+        FigCaption,
+        Figure,
+        Footer,
+        Form,
+        H1,
+        H2,
+        H3,
+        H4,
+        H5,
+        H6,
+        Head,
+        Header,
+        HGroup,
+        Hr,
+        Html,
+        I,
+        IFrame,
+        Img,
+        Input,
+        Ins,
+        Kbd,
+        Label,
+        Legend,
+        Li,
+        Link,
+        Main,
+        Map,
+        Mark,
+        Menu,
+        Meter,
+        Nav,
+        NoScript,
+        Object,
+        Ol,
+        OptGroup,
+        Option,
+        Output,
+        P,
+        Param,
+        Picture,
+        Pre,
+        Progress,
+        Q,
+        Rp,
+        Rt,
+        Ruby,
+        S,
+        Samp,
+        Script,
+        Search,
+        Section,
+        Select,
+        Slot,
+        Small,
+        Source,
+        Span,
+        Strong,
+        Style,
+        Sub,
+        Summary,
+        Sup,
+        Svg,
+        Table,
+        TBody,
+        Td,
+        Template,
+        TextArea,
+        TFoot,
+        Th,
+        THead,
+        Time,
+        Title,
+        Tr,
+        Track,
+        U,
+        Ul,
+        Var,
+        Video,
+        Wbr,
+    )
+    from .fragment import Fragment
+    from .meta import Meta
+
+# The modules of the elements that are not generated into `_elements`.
+_MODULES = {
+    "Fragment": "fragment",
+    "Meta": "meta",
+}
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(f".{_MODULES.get(name, '_elements')}", __name__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
+
+
+__all__ = [
+	"A",
+	"Abbr",
+	"Address",
+	"Area",
+	"Article",
+	"Aside",
+	"Audio",
+	"B",
+	"Base",
+	"Bdi",
+	"Bdo",
+	"BlockQuote",
+	"Body",
+	"Br",
+	"Button",
+	"Canvas",
+	"Caption",
+	"Cite",
+	"Code",
+	"Col",
+	"ColGroup",
+	"Data",
+	"DataList",
+	"Dd",
+	"Del",
+	"Details",
+	"Dfn",
+	"Dialog",
+	"Div",
+	"Dl",
+	"Dt",
+	"Em",
+	"Embed",
+	"FieldSet",
+	"FigCaption",
+	"Figure",
+	"Footer",
+	"Form",
+	"Fragment",
+	"H1",
+	"H2",
+	"H3",
+	"H4",
+	"H5",
+	"H6",
+	"Head",
+	"Header",
+	"HGroup",
+	"Hr",
+	"Html",
+	"I",
+	"IFrame",
+	"Img",
+	"Input",
+	"Ins",
+	"Kbd",
+	"Label",
+	"Legend",
+	"Li",
+	"Link",
+	"Main",
+	"Map",
+	"Mark",
+	"Menu",
+	"Meta",
+	"Meter",
+	"Nav",
+	"NoScript",
+	"Object",
+	"Ol",
+	"OptGroup",
+	"Option",
+	"Output",
+	"P",
+	"Param",
+	"Picture",
+	"Pre",
+	"Progress",
+	"Q",
+	"Rp",
+	"Rt",
+	"Ruby",
+	"S",
+	"Samp",
+	"Script",
+	"Search",
+	"Section",
+	"Select",
+	"Slot",
+	"Small",
+	"Source",
+	"Span",
+	"Strong",
+	"Style",
+	"Sub",
+	"Summary",
+	"Sup",
+	"Svg",
+	"Table",
+	"TBody",
+	"Td",
+	"Template",
+	"TextArea",
+	"TFoot",
+	"Th",
+	"THead",
+	"Time",
+	"Title",
+	"Tr",
+	"Track",
+	"U",
+	"Ul",
+	"Var",
+	"Video",
+	"Wbr",
+]
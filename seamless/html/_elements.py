@@ -0,0 +1,1221 @@
+"""
+The HTML elements, generated by `_auto_html.py` - do not edit by hand.
+
+The elements have no `__init__` of their own, so constructing one calls
+`Element.__init__` directly. The typed signatures are for type checkers only.
+"""
+from typing import TYPE_CHECKING, Unpack
+
+from ..element import Element
+
+if TYPE_CHECKING:
+    from ..types import ChildType
+    from ..types.html import (
+        HTMLAnchorElement,
+        HTMLAreaElement,
+        HTMLAudioElement,
+        HTMLBRElement,
+        HTMLBaseElement,
+        HTMLBodyElement,
+        HTMLButtonElement,
+        HTMLCanvasElement,
+        HTMLDataElement,
+        HTMLDataListElement,
+        HTMLDetailsElement,
+        HTMLDialogElement,
+        HTMLDivElement,
+        HTMLElementProps,
+        HTMLEmbedElement,
+        HTMLFieldSetElement,
+        HTMLFormElement,
+        HTMLHRElement,
+        HTMLHeadElement,
+        HTMLHeadingElement,
+        HTMLHtmlElement,
+        HTMLIFrameElement,
+        HTMLInputElement,
+        HTMLLabelElement,
+        HTMLLegendElement,
+        HTMLLinkElement,
+        HTMLListItemElement,
+        HTMLMapElement,
+        HTMLMeterElement,
+        HTMLModElement,
+        HTMLObjectElement,
+        HTMLOptGroupElement,
+        HTMLOptionElement,
+        HTMLOrderedListElement,
+        HTMLOutputElement,
+        HTMLParagraphElement,
+        HTMLParamElement,
+        HTMLPictureElement,
+        HTMLPreElement,
+        HTMLProgressElement,
+        HTMLQuoteElement,
+        HTMLScriptElement,
+        HTMLSelectElement,
+        HTMLSlotElement,
+        HTMLSourceElement,
+        HTMLSpanElement,
+        HTMLStyleElement,
+        HTMLTableCaptionElement,
+        HTMLTableColElement,
+        HTMLTableDataCellElement,
+        HTMLTableElement,
+        HTMLTableHeaderCellElement,
+        HTMLTableRowElement,
+        HTMLTableSectionElement,
+        HTMLTemplateElement,
+        HTMLTextAreaElement,
+        HTMLTimeElement,
+        HTMLTitleElement,
+        HTMLTrackElement,
+        HTMLUnorderedListElement,
+        HTMLVideoElement,
+    )
+
+__all__ = [
+    "A",
+    "Abbr",
+    "Address",
+    "Area",
+    "Article",
+    "Aside",
+    "Audio",
+    "B",
+    "Base",
+    "Bdi",
+    "Bdo",
+    "BlockQuote",
+    "Body",
+    "Br",
+    "Button",
+    "Canvas",
+    "Caption",
+    "Cite",
+    "Code",
+    "Col",
+    "ColGroup",
+    "Data",
+    "DataList",
+    "Dd",
+    "Del",
+    "Details",
+    "Dfn",
+    "Dialog",
+    "Div",
+    "Dl",
+    "Dt",
+    "Em",
+    "Embed",
+    "FieldSet",
+    "FigCaption",
+    "Figure",
+    "Footer",
+    "Form",
+    "H1",
+    "H2",
+    "H3",
+    "H4",
+    "H5",
+    "H6",
+    "Head",
+    "Header",
+    "HGroup",
+    "Hr",
+    "Html",
+    "I",
+    "IFrame",
+    "Img",
+    "Input",
+    "Ins",
+    "Kbd",
+    "Label",
+    "Legend",
+    "Li",
+    "Link",
+    "Main",
+    "Map",
+    "Mark",
+    "Menu",
+    "Meter",
+    "Nav",
+    "NoScript",
+    "Object",
+    "Ol",
+    "OptGroup",
+    "Option",
+    "Output",
+    "P",
+    "Param",
+    "Picture",
+    "Pre",
+    "Progress",
+    "Q",
+    "Rp",
+    "Rt",
+    "Ruby",
+    "S",
+    "Samp",
+    "Script",
+    "Search",
+    "Section",
+    "Select",
+    "Slot",
+    "Small",
+    "Source",
+    "Span",
+    "Strong",
+    "Style",
+    "Sub",
+    "Summary",
+    "Sup",
+    "Svg",
+    "Table",
+    "TBody",
+    "Td",
+    "Template",
+    "TextArea",
+    "TFoot",
+    "Th",
+    "THead",
+    "Time",
+    "Title",
+    "Tr",
+    "Track",
+    "U",
+    "Ul",
+    "Var",
+    "Video",
+    "Wbr",
+]
+
+
+class A(Element):
+    __slots__ = ()
+
+    tag_name = "a"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLAnchorElement"]): ...
+
+
+class Abbr(Element):
+    __slots__ = ()
+
+    tag_name = "abbr"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Address(Element):
+    __slots__ = ()
+
+    tag_name = "address"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Area(Element):
+    __slots__ = ()
+
+    tag_name = "area"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLAreaElement"]): ...
+
+
+class Article(Element):
+    __slots__ = ()
+
+    tag_name = "article"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Aside(Element):
+    __slots__ = ()
+
+    tag_name = "aside"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Audio(Element):
+    __slots__ = ()
+
+    tag_name = "audio"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLAudioElement"]): ...
+
+
+class B(Element):
+    __slots__ = ()
+
+    tag_name = "b"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Base(Element):
+    __slots__ = ()
+
+    tag_name = "base"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLBaseElement"]): ...
+
+
+class Bdi(Element):
+    __slots__ = ()
+
+    tag_name = "bdi"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Bdo(Element):
+    __slots__ = ()
+
+    tag_name = "bdo"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class BlockQuote(Element):
+    __slots__ = ()
+
+    tag_name = "blockquote"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Body(Element):
+    __slots__ = ()
+
+    tag_name = "body"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLBodyElement"]): ...
+
+
+class Br(Element):
+    __slots__ = ()
+
+    tag_name = "br"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLBRElement"]): ...
+
+
+class Button(Element):
+    __slots__ = ()
+
+    tag_name = "button"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLButtonElement"]): ...
+
+
+class Canvas(Element):
+    __slots__ = ()
+
+    tag_name = "canvas"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLCanvasElement"]): ...
+
+
+class Caption(Element):
+    __slots__ = ()
+
+    tag_name = "caption"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableCaptionElement"]): ...
+
+
+class Cite(Element):
+    __slots__ = ()
+
+    tag_name = "cite"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Code(Element):
+    __slots__ = ()
+
+    tag_name = "code"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Col(Element):
+    __slots__ = ()
+
+    tag_name = "col"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableColElement"]): ...
+
+
+class ColGroup(Element):
+    __slots__ = ()
+
+    tag_name = "colgroup"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableColElement"]): ...
+
+
+class Data(Element):
+    __slots__ = ()
+
+    tag_name = "data"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLDataElement"]): ...
+
+
+class DataList(Element):
+    __slots__ = ()
+
+    tag_name = "datalist"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLDataListElement"]): ...
+
+
+class Dd(Element):
+    __slots__ = ()
+
+    tag_name = "dd"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Del(Element):
+    __slots__ = ()
+
+    tag_name = "del"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLModElement"]): ...
+
+
+class Details(Element):
+    __slots__ = ()
+
+    tag_name = "details"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLDetailsElement"]): ...
+
+
+class Dfn(Element):
+    __slots__ = ()
+
+    tag_name = "dfn"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Dialog(Element):
+    __slots__ = ()
+
+    tag_name = "dialog"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLDialogElement"]): ...
+
+
+class Div(Element):
+    __slots__ = ()
+
+    tag_name = "div"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLDivElement"]): ...
+
+
+class Dl(Element):
+    __slots__ = ()
+
+    tag_name = "dl"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Dt(Element):
+    __slots__ = ()
+
+    tag_name = "dt"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Em(Element):
+    __slots__ = ()
+
+    tag_name = "em"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Embed(Element):
+    __slots__ = ()
+
+    tag_name = "embed"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLEmbedElement"]): ...
+
+
+class FieldSet(Element):
+    __slots__ = ()
+
+    tag_name = "fieldset"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLFieldSetElement"]): ...
+
+
+class FigCaption(Element):
+    __slots__ = ()
+
+    tag_name = "figcaption"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Figure(Element):
+    __slots__ = ()
+
+    tag_name = "figure"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Footer(Element):
+    __slots__ = ()
+
+    tag_name = "footer"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Form(Element):
+    __slots__ = ()
+
+    tag_name = "form"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLFormElement"]): ...
+
+
+class H1(Element):
+    __slots__ = ()
+
+    tag_name = "h1"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadingElement"]): ...
+
+
+class H2(Element):
+    __slots__ = ()
+
+    tag_name = "h2"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadingElement"]): ...
+
+
+class H3(Element):
+    __slots__ = ()
+
+    tag_name = "h3"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadingElement"]): ...
+
+
+class H4(Element):
+    __slots__ = ()
+
+    tag_name = "h4"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadingElement"]): ...
+
+
+class H5(Element):
+    __slots__ = ()
+
+    tag_name = "h5"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadingElement"]): ...
+
+
+class H6(Element):
+    __slots__ = ()
+
+    tag_name = "h6"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadingElement"]): ...
+
+
+class Head(Element):
+    __slots__ = ()
+
+    tag_name = "head"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHeadElement"]): ...
+
+
+class Header(Element):
+    __slots__ = ()
+
+    tag_name = "header"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class HGroup(Element):
+    __slots__ = ()
+
+    tag_name = "hgroup"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Hr(Element):
+    __slots__ = ()
+
+    tag_name = "hr"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHRElement"]): ...
+
+
+class Html(Element):
+    __slots__ = ()
+
+    tag_name = "html"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLHtmlElement"]): ...
+
+
+class I(Element):
+    __slots__ = ()
+
+    tag_name = "i"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class IFrame(Element):
+    __slots__ = ()
+
+    tag_name = "iframe"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLIFrameElement"]): ...
+
+
+class Img(Element):
+    __slots__ = ()
+
+    tag_name = "img"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Input(Element):
+    __slots__ = ()
+
+    tag_name = "input"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLInputElement"]): ...
+
+
+class Ins(Element):
+    __slots__ = ()
+
+    tag_name = "ins"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLModElement"]): ...
+
+
+class Kbd(Element):
+    __slots__ = ()
+
+    tag_name = "kbd"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Label(Element):
+    __slots__ = ()
+
+    tag_name = "label"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLLabelElement"]): ...
+
+
+class Legend(Element):
+    __slots__ = ()
+
+    tag_name = "legend"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLLegendElement"]): ...
+
+
+class Li(Element):
+    __slots__ = ()
+
+    tag_name = "li"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLListItemElement"]): ...
+
+
+class Link(Element):
+    __slots__ = ()
+
+    tag_name = "link"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLLinkElement"]): ...
+
+
+class Main(Element):
+    __slots__ = ()
+
+    tag_name = "main"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Map(Element):
+    __slots__ = ()
+
+    tag_name = "map"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLMapElement"]): ...
+
+
+class Mark(Element):
+    __slots__ = ()
+
+    tag_name = "mark"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Menu(Element):
+    __slots__ = ()
+
+    tag_name = "menu"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Meter(Element):
+    __slots__ = ()
+
+    tag_name = "meter"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLMeterElement"]): ...
+
+
+class Nav(Element):
+    __slots__ = ()
+
+    tag_name = "nav"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class NoScript(Element):
+    __slots__ = ()
+
+    tag_name = "noscript"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Object(Element):
+    __slots__ = ()
+
+    tag_name = "object"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLObjectElement"]): ...
+
+
+class Ol(Element):
+    __slots__ = ()
+
+    tag_name = "ol"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLOrderedListElement"]): ...
+
+
+class OptGroup(Element):
+    __slots__ = ()
+
+    tag_name = "optgroup"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLOptGroupElement"]): ...
+
+
+class Option(Element):
+    __slots__ = ()
+
+    tag_name = "option"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLOptionElement"]): ...
+
+
+class Output(Element):
+    __slots__ = ()
+
+    tag_name = "output"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLOutputElement"]): ...
+
+
+class P(Element):
+    __slots__ = ()
+
+    tag_name = "p"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLParagraphElement"]): ...
+
+
+class Param(Element):
+    __slots__ = ()
+
+    tag_name = "param"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLParamElement"]): ...
+
+
+class Picture(Element):
+    __slots__ = ()
+
+    tag_name = "picture"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLPictureElement"]): ...
+
+
+class Pre(Element):
+    __slots__ = ()
+
+    tag_name = "pre"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLPreElement"]): ...
+
+
+class Progress(Element):
+    __slots__ = ()
+
+    tag_name = "progress"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLProgressElement"]): ...
+
+
+class Q(Element):
+    __slots__ = ()
+
+    tag_name = "q"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLQuoteElement"]): ...
+
+
+class Rp(Element):
+    __slots__ = ()
+
+    tag_name = "rp"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Rt(Element):
+    __slots__ = ()
+
+    tag_name = "rt"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Ruby(Element):
+    __slots__ = ()
+
+    tag_name = "ruby"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class S(Element):
+    __slots__ = ()
+
+    tag_name = "s"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Samp(Element):
+    __slots__ = ()
+
+    tag_name = "samp"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Script(Element):
+    __slots__ = ()
+
+    tag_name = "script"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLScriptElement"]): ...
+
+
+class Search(Element):
+    __slots__ = ()
+
+    tag_name = "search"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Section(Element):
+    __slots__ = ()
+
+    tag_name = "section"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Select(Element):
+    __slots__ = ()
+
+    tag_name = "select"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLSelectElement"]): ...
+
+
+class Slot(Element):
+    __slots__ = ()
+
+    tag_name = "slot"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLSlotElement"]): ...
+
+
+class Small(Element):
+    __slots__ = ()
+
+    tag_name = "small"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Source(Element):
+    __slots__ = ()
+
+    tag_name = "source"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLSourceElement"]): ...
+
+
+class Span(Element):
+    __slots__ = ()
+
+    tag_name = "span"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLSpanElement"]): ...
+
+
+class Strong(Element):
+    __slots__ = ()
+
+    tag_name = "strong"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Style(Element):
+    __slots__ = ()
+
+    tag_name = "style"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLStyleElement"]): ...
+
+
+class Sub(Element):
+    __slots__ = ()
+
+    tag_name = "sub"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Summary(Element):
+    __slots__ = ()
+
+    tag_name = "summary"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Sup(Element):
+    __slots__ = ()
+
+    tag_name = "sup"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Svg(Element):
+    __slots__ = ()
+
+    tag_name = "svg"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Table(Element):
+    __slots__ = ()
+
+    tag_name = "table"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableElement"]): ...
+
+
+class TBody(Element):
+    __slots__ = ()
+
+    tag_name = "tbody"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableSectionElement"]): ...
+
+
+class Td(Element):
+    __slots__ = ()
+
+    tag_name = "td"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableDataCellElement"]): ...
+
+
+class Template(Element):
+    __slots__ = ()
+
+    tag_name = "template"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTemplateElement"]): ...
+
+
+class TextArea(Element):
+    __slots__ = ()
+
+    tag_name = "textarea"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTextAreaElement"]): ...
+
+
+class TFoot(Element):
+    __slots__ = ()
+
+    tag_name = "tfoot"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableSectionElement"]): ...
+
+
+class Th(Element):
+    __slots__ = ()
+
+    tag_name = "th"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableHeaderCellElement"]): ...
+
+
+class THead(Element):
+    __slots__ = ()
+
+    tag_name = "thead"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableSectionElement"]): ...
+
+
+class Time(Element):
+    __slots__ = ()
+
+    tag_name = "time"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTimeElement"]): ...
+
+
+class Title(Element):
+    __slots__ = ()
+
+    tag_name = "title"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTitleElement"]): ...
+
+
+class Tr(Element):
+    __slots__ = ()
+
+    tag_name = "tr"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTableRowElement"]): ...
+
+
+class Track(Element):
+    __slots__ = ()
+
+    tag_name = "track"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLTrackElement"]): ...
+
+
+class U(Element):
+    __slots__ = ()
+
+    tag_name = "u"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Ul(Element):
+    __slots__ = ()
+
+    tag_name = "ul"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLUnorderedListElement"]): ...
+
+
+class Var(Element):
+    __slots__ = ()
+
+    tag_name = "var"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
+
+
+class Video(Element):
+    __slots__ = ()
+
+    tag_name = "video"
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLVideoElement"]): ...
+
+
+class Wbr(Element):
+    __slots__ = ()
+
+    tag_name = "wbr"
+    inline = True
+
+    if TYPE_CHECKING:
+        def __init__(self, *children: "ChildType", **kwargs: Unpack["HTMLElementProps"]): ...
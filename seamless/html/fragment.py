@@ -1,5 +1,5 @@
-from ..element import Element
-
-
-class Fragment(Element):
-    ...
+from ..element import Element
+
+
+class Fragment(Element):
+    __slots__ = ()
@@ -1,24 +1,26 @@
-from typing import Literal, overload
-from ..types import ChildType
+from typing import TYPE_CHECKING, Literal, overload
 from ..element import Element
 
+if TYPE_CHECKING:
+    from ..types import ChildType
+
 
 HttpEquivOptions = Literal["content-security-policy", "content-type", "default-style", "x-ua-compatible", "refresh"]
 
 
 class Meta(Element):
+    __slots__ = ()
 
-    @overload
-    def __init__(self, *children: ChildType, http_equiv: HttpEquivOptions, content: str): ...
-    @overload
-    def __init__(self, *children: ChildType, name: str, content: str): ...
-    @overload
-    def __init__(self, *children: ChildType, charset: str): ...
-    @overload
-    def __init__(self, *children: ChildType, itemprop: str): ...
-
-    def __init__(self, *children: ChildType, **kwargs):
-        super().__init__(*children, **kwargs)
+    if TYPE_CHECKING:
+        @overload
+        def __init__(self, *children: "ChildType", http_equiv: HttpEquivOptions, content: str): ...
+        @overload
+        def __init__(self, *children: "ChildType", name: str, content: str): ...
+        @overload
+        def __init__(self, *children: "ChildType", charset: str): ...
+        @overload
+        def __init__(self, *children: "ChildType", itemprop: str): ...
+        def __init__(self, *children: "ChildType", **kwargs): ...
 
     tag_name = "meta"
     inline = True
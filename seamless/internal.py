@@ -1,15 +1,18 @@
 # type: ignore
 
-from functools import wraps
 from typing import Any, Iterable
 from uuid import uuid4
 from string import ascii_letters
+from weakref import WeakKeyDictionary
 
 ascii_length = len(ascii_letters)
 
 
 SEAMLESS_ELEMENT_ATTRIBUTE = "seamless:element"
 SEAMLESS_INIT_ATTRIBUTE = "seamless:init"
+SEAMLESS_EVENTS_ATTRIBUTE = "seamless:events"
+SEAMLESS_LIVE_ATTRIBUTE = "seamless:live"
+SEAMLESS_KEY_ATTRIBUTE = "seamless:key"
 
 
 class _DataValidationError(Exception): ...
@@ -65,14 +68,6 @@ class TwoWayDict(dict):
         return dict.__len__(self) // 2
 
 
-class Promise:
-    def __init__(self, value):
-        self.value = value
-
-    def __await__(self):
-        return getattr(self.value, "__await__", lambda: self.value or iter(()))()
-
-
 def short_uuid(length=12):
     original_uuid = uuid4()
     hex_string = original_uuid.hex
@@ -86,28 +81,58 @@ def short_uuid(length=12):
     return short_uuid
 
 
-def wrap_with_validation(func):
-    def no_validation(*args):
-        return func(*[_obj(arg) if isinstance(arg, dict) else arg for arg in args])
+_VALIDATION_MODELS = WeakKeyDictionary()
+
+
+def validation_model(func, *, bound: bool | None = None):
+    """
+    Returns the pydantic model that validates the arguments of `func` and the
+    names of its parameters, or `None` if it takes no arguments or pydantic is
+    not installed.
+
+    Models are cached by function, so all the bound methods of a function share
+    a model. `bound` tells whether `func` is called as a method, which is
+    detected for bound methods.
+    """
+    function = getattr(func, "__func__", func)
+    if bound is None:
+        bound = function is not func
+
+    try:
+        models = _VALIDATION_MODELS[function]
+    except KeyError:
+        models = _VALIDATION_MODELS[function] = {}
+    except TypeError:
+        # Callables that can't be weakly referenced are not cached.
+        return _create_validation_model(function, bound)
+
+    try:
+        return models[bound]
+    except KeyError:
+        model = models[bound] = _create_validation_model(function, bound)
+        return model
+
 
+def _create_validation_model(func, bound: bool):
     try:
-        from pydantic import create_model, ValidationError
+        from pydantic import create_model
     except ImportError:
-        return no_validation
+        return None
 
     import inspect
 
-    signature = inspect.signature(func)
-    parameters = signature.parameters
+    parameters = list(inspect.signature(func).parameters.items())
+    if bound:
+        parameters = parameters[1:]
     if not parameters:
-        return no_validation
+        return None
 
     func_parameters = {
         name: (
             parameter.annotation if parameter.annotation is not inspect._empty else Any,
             parameter.default if parameter.default is not inspect._empty else None,
         )
-        for name, parameter in parameters.items()
+        for name, parameter in parameters
     }
 
     model = create_model(
@@ -115,20 +140,7 @@ def wrap_with_validation(func):
         **func_parameters,
     )
 
-    @wraps(func)
-    async def wrapper(*args):
-        kwargs = {parameter: args[i] for i, parameter in enumerate(func_parameters)}
-
-        try:
-            data = model(**kwargs)
-        except ValidationError as e:
-            raise _DataValidationError(e.json(include_url=False))
-
-        return await Promise(
-            func(**{name: getattr(data, name) for name in func_parameters})
-        )
-
-    return wrapper
+    return model, tuple(func_parameters)
 
 
 def to_iter(value):
@@ -2,41 +2,43 @@ from functools import partial
 from socketio import AsyncServer, ASGIApp
 
 from .base import BaseAsyncMiddleware, CLAIM_COOKIE_NAME
-from ..context.request import HTTPRequest
+from ..context.request import HTTPRequest, request_context
 
 
 class ASGIMiddleware(BaseAsyncMiddleware):
     async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = HTTPRequest(scope, type="asgi")
+
         async def _send(message):
-            await send(message)
+            if message["type"] != "http.response.start":
+                return await send(message)
 
-        if scope["type"] == "http":
-            request = HTTPRequest.make(scope, type="asgi")
+            # The response may be sent from another task than the one that
+            # rendered it, so the request is checked directly.
+            if self._is_render_request(request):
+                if "headers" not in message:
+                    message["headers"] = []
 
-            async def _send(message):
-                if message["type"] != "http.response.start":
-                    return await send(message)
+                message["headers"].append(
+                    self._make_cookie_header(CLAIM_COOKIE_NAME, request.id)
+                )
 
-                if self._is_render_request():
+            elif request.path.startswith(self.socket_path):
+                if CLAIM_COOKIE_NAME in request.cookies:
                     if "headers" not in message:
                         message["headers"] = []
 
                     message["headers"].append(
-                        self._make_cookie_header(CLAIM_COOKIE_NAME, request.id)
+                        self._remove_cookie(CLAIM_COOKIE_NAME)
                     )
 
-                elif request.path.startswith(self.socket_path):
-                    if CLAIM_COOKIE_NAME in request.cookies:
-                        if "headers" not in message:
-                            message["headers"] = []
-
-                        message["headers"].append(
-                            self._remove_cookie(CLAIM_COOKIE_NAME)
-                        )
-
-                await send(message)
+            await send(message)
 
-        await self.app(scope, receive, _send)
+        with request_context(request):
+            await self.app(scope, receive, _send)
 
     def _app_class(self):
         return ASGIApp
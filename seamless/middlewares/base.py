@@ -1,6 +1,7 @@
 from functools import wraps
 from pathlib import Path
 from inspect import iscoroutinefunction
+from typing import TYPE_CHECKING
 
 import asyncio
 
@@ -8,17 +9,36 @@ from socketio.base_server import BaseServer
 from socketio import AsyncServer
 
 from ..context.database import DB
-from ..context.ws_router import ws_router
-from ..context.request import WSRequest, request as _request, set_request
-
+from ..context.executor import ExecutorPolicy
+from ..context.live import LIVE
+from ..context.ws_router import (
+    ws_router,
+    WSRouterCommands,
+    broadcast_payloads,
+    negotiate_format,
+    release_format,
+    room_name,
+)
+from ..context.request import WSRequest, request as _request, request_context
+
+from ..errors import ActionQueueFullError
 from ..internal import Cookies, _DataValidationError
+from .queues import SocketQueues
+
+if TYPE_CHECKING:
+    from ..types import Renderable
 
 
 CLAIM_COOKIE_NAME = "_seamless_claim_id"
 
 
 class BaseMiddleware:
-    def __init__(self, app, socket_path="/socket.io"):
+    def __init__(
+        self, app, socket_path="/socket.io", executor: ExecutorPolicy | None = None
+    ):
+        if executor is not None:
+            DB.executor = executor
+
         self.socket_path = f"/{socket_path.strip('/')}"
         self.server = self._server_class()(cors_allowed_origins=[])
         self.app = self._app_class()(self.server, app, socketio_path=socket_path)
@@ -46,9 +66,14 @@ class BaseMiddleware:
         return _handler
 
     def _handle_disconnect(self, sid: str):
+        self._release(sid)
+
+    def _release(self, sid: str):
         DB.release_actions(sid)
+        LIVE.release(sid)
+        release_format(sid)
 
-    def _handle_connect(self, sid: str, env):
+    def _handle_connect(self, sid: str, env, auth=None):
         cookie_string = env.get("HTTP_COOKIE", "")
         if not cookie_string:
             self._disconnect(sid)
@@ -59,16 +84,17 @@ class BaseMiddleware:
             self._disconnect(sid)
 
         DB.claim(claim_id, sid)
+        negotiate_format(sid, auth)
 
     def on(self, event, handler):
         @wraps(handler)
         def wrapper(sid, *args, **kwargs):
             try:
-                WSRequest.make(sid)
-                result = handler(sid, *args, **kwargs)
-                set_request(None)
-                return result
-            except _DataValidationError as e:
+                with request_context(WSRequest(sid)):
+                    result = handler(sid, *args, **kwargs)
+                    self._push_patches(sid, LIVE.render_patches(sid))
+                    return result
+            except (_DataValidationError, ActionQueueFullError) as e:
                 self._emit("error", str(e), to=sid)
             except Exception as e:
                 self._emit("error", str(e), to=sid)
@@ -76,6 +102,32 @@ class BaseMiddleware:
 
         self.server.on(event, wrapper)
 
+    def _push_patches(self, sid: str, updates: list):
+        if updates:
+            self._emit("patch", updates, to=sid)
+
+    def join(self, sid: str, room: str):
+        """
+        Adds the socket to a room, to receive the components broadcast to it.
+        Sockets leave their rooms when they disconnect.
+        """
+        self.server.enter_room(sid, room_name(room, sid))
+
+    def leave(self, sid: str, room: str):
+        self.server.leave_room(sid, room_name(room, sid))
+
+    def broadcast(self, room: str, component: "Renderable"):
+        """
+        Sends a component to all the sockets in a room, as a `broadcast` event.
+        The component is rendered and encoded once for all of them, so it must
+        not have server-side event handlers.
+        """
+        for name, payload in broadcast_payloads(room, component, self._has_members):
+            self._emit("broadcast", (room, payload), to=name)
+
+    def _has_members(self, name: str) -> bool:
+        return bool(self.server.manager.rooms.get("/", {}).get(name))
+
     def _app_class(self):
         raise NotImplementedError("self._app_class is not implemented")
 
@@ -148,16 +200,39 @@ class BaseMiddleware:
 
         return _method
 
-    def _is_render_request(self):
-        request = _request()
+    def _is_render_request(self, request=None):
+        if request is None:
+            request = _request()
         if not request:
             return False
         return request.id is not None
 
 
 class BaseAsyncMiddleware(BaseMiddleware):
+    """
+    Args:
+        max_concurrency: The number of socket events that may be handled at once.
+        The events of each socket are handled one at a time, in order.
+        max_queued_events: The number of events a socket may have waiting to be
+        handled.
+    """
+
     server: AsyncServer
 
+    def __init__(
+        self,
+        app,
+        socket_path="/socket.io",
+        executor: ExecutorPolicy | None = None,
+        *,
+        max_concurrency: int = 100,
+        max_queued_events: int | None = 1000,
+    ):
+        self.queues = SocketQueues(
+            max_concurrency=max_concurrency, max_queued_events=max_queued_events
+        )
+        super().__init__(app, socket_path, executor)
+
     def _is_async_server(self) -> bool:
         return True
 
@@ -175,18 +250,56 @@ class BaseAsyncMiddleware(BaseMiddleware):
 
         return _handler
 
+    async def _handle_disconnect(self, sid: str):
+        # The event being handled may still register actions and render live
+        # components for the socket, so it is released after that event.
+        self.queues.discard(sid)
+
+        async def release():
+            self._release(sid)
+
+        await self.queues.submit(sid, release)
+
     def on(self, event, handler):
         @wraps(handler)
         async def wrapper(sid, *args, **kwargs):
+            async def job():
+                with request_context(WSRequest(sid)):
+                    result = await handler(sid, *args, **kwargs)
+                    await self._push_patches(sid, LIVE.render_patches(sid))
+                    return result
+
             try:
-                WSRequest.make(sid)
-                result = await handler(sid, *args, **kwargs)
-                set_request(None)
-                return result
-            except _DataValidationError as e:
+                coalesce_key = self._coalesce_key(event, sid, args)
+                return await self.queues.submit(sid, job, coalesce_key)
+            except (_DataValidationError, ActionQueueFullError) as e:
                 await self.server.emit("error", str(e), to=sid)
             except Exception as e:
                 await self.server.emit("error", str(e), to=sid)
                 raise e
 
         self.server.on(event, wrapper)
+
+    async def _push_patches(self, sid: str, updates: list):
+        if updates:
+            await self.server.emit("patch", updates, to=sid)
+
+    async def join(self, sid: str, room: str):
+        await self.server.enter_room(sid, room_name(room, sid))
+
+    async def leave(self, sid: str, room: str):
+        await self.server.leave_room(sid, room_name(room, sid))
+
+    async def broadcast(self, room: str, component: "Renderable"):
+        for name, payload in broadcast_payloads(room, component, self._has_members):
+            await self.server.emit("broadcast", (room, payload), to=name)
+
+    def _coalesce_key(self, event, sid: str, args):
+        if event != WSRouterCommands.EVENT or not args:
+            return None
+
+        action = DB.store.get(args[0], sid)
+        if action is None or not action.coalesce:
+            return None
+
+        return (event, args[0])
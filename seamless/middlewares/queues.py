@@ -0,0 +1,110 @@
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Hashable
+
+from ..errors import ActionQueueFullError
+
+
+class _QueuedEvent:
+    __slots__ = ("job", "future", "coalesce_key")
+
+    def __init__(
+        self, job: Callable[[], Awaitable[Any]], future: asyncio.Future, coalesce_key
+    ):
+        self.job = job
+        self.future = future
+        self.coalesce_key = coalesce_key
+
+
+class SocketQueues:
+    """
+    Handles the events of each socket in the order they were received, while
+    the events of different sockets are handled concurrently.
+
+    Args:
+        max_concurrency: The number of events that may be handled at once,
+        across all the sockets.
+        max_queued_events: The number of events a socket may have waiting.
+        Events beyond it are rejected with `ActionQueueFullError`.
+    """
+
+    def __init__(
+        self, *, max_concurrency: int = 100, max_queued_events: int | None = 1000
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queued_events = max_queued_events
+        self.coalesced = 0
+        self._queues: dict[str, deque[_QueuedEvent]] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def submit(
+        self,
+        sid: str,
+        job: Callable[[], Awaitable[Any]],
+        coalesce_key: Hashable | None = None,
+    ) -> "asyncio.Future[Any]":
+        """
+        Queues `job` to run after the events the socket already sent.
+
+        If `coalesce_key` is given and an event with the same key is still
+        waiting, that event is dropped, its future resolving to `None`, and
+        this one takes its place in the queue, before the events that were
+        sent after the dropped one.
+
+        Returns:
+            A future of the result of `job`.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        event = _QueuedEvent(job, future, coalesce_key)
+
+        queue = self._queues.get(sid)
+        if queue is None:
+            queue = self._queues[sid] = deque()
+            queue.append(event)
+            loop.create_task(self._run(sid, queue))
+            return future
+
+        if coalesce_key is not None:
+            for index, waiting in enumerate(queue):
+                if waiting.coalesce_key == coalesce_key:
+                    queue[index] = event
+                    waiting.future.set_result(None)
+                    self.coalesced += 1
+                    return future
+
+        if self.max_queued_events is not None and len(queue) >= self.max_queued_events:
+            raise ActionQueueFullError("Too many events are waiting to be handled")
+
+        queue.append(event)
+        return future
+
+    def discard(self, sid: str):
+        """
+        Drops the events of the socket that are still waiting.
+        """
+        queue = self._queues.get(sid)
+        while queue:
+            queue.pop().future.cancel()
+
+    def pending(self, sid: str) -> int:
+        return len(self._queues.get(sid, ()))
+
+    async def _run(self, sid: str, queue: deque[_QueuedEvent]):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            while queue:
+                event = queue.popleft()
+                async with self._semaphore:
+                    try:
+                        result = await event.job()
+                    except Exception as e:
+                        if not event.future.done():
+                            event.future.set_exception(e)
+                    else:
+                        if not event.future.done():
+                            event.future.set_result(result)
+        finally:
+            del self._queues[sid]
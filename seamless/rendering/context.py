@@ -0,0 +1,37 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class ActionsTracker:
+    """
+    Counts the server-side actions registered while rendering a subtree.
+    """
+
+    def __init__(self):
+        self.actions = 0
+
+    def on_action(self):
+        self.actions += 1
+
+
+_trackers = ContextVar[tuple[ActionsTracker, ...]]("seamless_actions_trackers", default=())
+
+
+@contextmanager
+def track_actions(tracker: ActionsTracker | None = None):
+    """
+    Tracks the server-side actions registered inside the `with` block.
+
+    Trackers can be nested, an action is reported to all of the active trackers.
+    """
+    tracker = tracker or ActionsTracker()
+    token = _trackers.set((*_trackers.get(), tracker))
+    try:
+        yield tracker
+    finally:
+        _trackers.reset(token)
+
+
+def action_registered():
+    for tracker in _trackers.get():
+        tracker.on_action()
@@ -0,0 +1,140 @@
+from typing import Any
+
+from seamless.internal import (
+    SEAMLESS_ELEMENT_ATTRIBUTE,
+    SEAMLESS_INIT_ATTRIBUTE,
+    SEAMLESS_KEY_ATTRIBUTE,
+)
+
+EMPTY_TAG = "seamless:empty"
+
+_MISSING = object()
+
+# Props the client consumes when it creates an element, so changing them
+# requires creating the element again.
+_CREATION_PROPS = (SEAMLESS_ELEMENT_ATTRIBUTE, SEAMLESS_INIT_ATTRIBUTE)
+
+
+def diff(old: Any, new: Any) -> list[list]:
+    """
+    Returns the patches that turn the `to_dict` tree `old` into `new`.
+
+    Nodes are addressed by their path, the indices of the children leading to
+    them from the root. The patches are:
+
+    - `["replace", path, node]` replaces the node with a new one.
+    - `["props", path, changed, removed]` sets the `changed` props of an
+      element and removes the `removed` ones.
+    - `["append", path, nodes]` appends children to an element.
+    - `["truncate", path, length]` removes the children of an element after
+      the first `length`.
+    - `["reorder", path, children]` rearranges the children of an element.
+      Every item of `children` is either the index of an existing child to
+      move to that position, or a new node. Existing children that are not
+      listed are removed.
+
+    Children are compared by their position, unless all of them have a `key`,
+    in which case children with the same key are compared, and moved if their
+    position changed. Children of elements that have an `Empty` child are
+    replaced together, since the client unwraps `Empty` elements and their
+    positions don't match the DOM.
+    """
+    patches = []
+    # The nodes to compare, with their path.
+    stack = [(old, new, [])]
+
+    while stack:
+        old, new, path = stack.pop()
+        if not _same_element(old, new):
+            if old != new:
+                patches.append(["replace", path, new])
+            continue
+
+        old_props, new_props = old["props"], new["props"]
+        if old_props != new_props:
+            changed = {
+                key: value
+                for key, value in new_props.items()
+                if old_props.get(key, _MISSING) != value
+            }
+            removed = [key for key in old_props if key not in new_props]
+            patches.append(["props", path, changed, removed])
+
+        old_children, new_children = old["children"], new["children"]
+        if old_children == new_children:
+            continue
+
+        if _has_empty(old_children) or _has_empty(new_children):
+            patches.append(["replace", path, new])
+            continue
+
+        old_keys, new_keys = _keys(old_children), _keys(new_children)
+        if old_keys is not None and new_keys is not None:
+            _reconcile(old_children, new_children, old_keys, new_keys, path, patches, stack)
+            continue
+
+        for index, (old_child, new_child) in enumerate(zip(old_children, new_children)):
+            stack.append((old_child, new_child, [*path, index]))
+
+        if len(new_children) > len(old_children):
+            patches.append(["append", path, new_children[len(old_children) :]])
+        elif len(new_children) < len(old_children):
+            patches.append(["truncate", path, len(new_children)])
+
+    return patches
+
+
+def _same_element(old: Any, new: Any) -> bool:
+    return (
+        isinstance(old, dict)
+        and isinstance(new, dict)
+        and old["type"] == new["type"]
+        and all(old["props"].get(key) == new["props"].get(key) for key in _CREATION_PROPS)
+    )
+
+
+def _has_empty(children: list) -> bool:
+    return any(isinstance(child, dict) and child["type"] == EMPTY_TAG for child in children)
+
+
+def _keys(children: list) -> dict[Any, int] | None:
+    """
+    Returns the indices of the children by their keys, or `None` if some of
+    them have no key or share a key.
+    """
+    if not children:
+        return None
+
+    keys = {}
+    for index, child in enumerate(children):
+        if not isinstance(child, dict):
+            return None
+        key = child["props"].get(SEAMLESS_KEY_ATTRIBUTE)
+        if key is None or key in keys:
+            return None
+        keys[key] = index
+
+    return keys
+
+
+def _reconcile(
+    old_children: list,
+    new_children: list,
+    old_keys: dict[Any, int],
+    new_keys: dict[Any, int],
+    path: list[int],
+    patches: list[list],
+    stack: list,
+):
+    order = []
+    for index, key in enumerate(new_keys):
+        old_index = old_keys.get(key)
+        if old_index is None:
+            order.append(new_children[index])
+        else:
+            order.append(old_index)
+            stack.append((old_children[old_index], new_children[index], [*path, index]))
+
+    # Moved, inserted or removed children.
+    if order != list(range(len(old_children))):
+        patches.append(["reorder", path, order])
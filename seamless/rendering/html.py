@@ -1,13 +1,14 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterator, Iterator
 from uuid import uuid4 as uuid
 
 from ..context.request import request as _request
 from ..errors import RenderError
-from ..components.base import Component
-from ..element import Element
 from .props import render_props
+from ..element import Element
+from .tree import walk, render_component, CLOSE
 
 if TYPE_CHECKING:
+    from seamless.components import Component
     from seamless.types import Renderable, Primitive
 
 
@@ -23,47 +24,153 @@ def render(element: "Renderable | Primitive", *, pretty=False, tab_indent=1) ->
     Returns:
         str: The rendered HTML string.
     """
-    request = _request()
-    if request is not None:
-        request.id = str(uuid())
+    _new_render_id()
     return _render(element, pretty=pretty, tab_indent=tab_indent)
 
 
-def _render(element: "Renderable | Primitive", *, pretty=False, tab_indent=1) -> str:
-    if isinstance(element, Component):
-        element = _render(element.render(), pretty=pretty, tab_indent=tab_indent)
+def render_iter(
+    element: "Renderable | Primitive", *, pretty=False, tab_indent=1
+) -> Iterator[str]:
+    """
+    Renders the given element into HTML fragments, yielding them as the tree is walked.
+
+    Joining the fragments gives the same string as ``render``.
+
+    Args:
+        element (Renderable | Primitive): The element to be rendered.
+        pretty (bool, optional): Whether to format the HTML string with indentation and line breaks. Defaults to False.
+        tab_indent (int, optional): The number of spaces to use for indentation when pretty is True. Defaults to 1.
+
+    Returns:
+        Iterator[str]: The rendered HTML fragments.
+    """
+    # The claim ID is assigned eagerly so the response headers can carry it
+    # before the first fragment is consumed.
+    _new_render_id()
+    return _render_iter(element, pretty=pretty, tab_indent=tab_indent)
 
-    if not isinstance(element, Element):
-        return str(element) if element is not None else ""
 
-    tag_name = getattr(element, "tag_name", None)
+def render_stream(
+    element: "Renderable | Primitive", *, pretty=False, tab_indent=1, chunk_size=4096
+) -> AsyncIterator[str]:
+    """
+    Renders the given element into HTML chunks, for use as a streaming response body.
+
+    Fragments are buffered until they reach ``chunk_size`` characters, and control
+    is returned to the event loop between chunks.
+
+    Args:
+        element (Renderable | Primitive): The element to be rendered.
+        pretty (bool, optional): Whether to format the HTML string with indentation and line breaks. Defaults to False.
+        tab_indent (int, optional): The number of spaces to use for indentation when pretty is True. Defaults to 1.
+        chunk_size (int, optional): The minimal size of a chunk, in characters. Defaults to 4096.
+
+    Returns:
+        AsyncIterator[str]: The rendered HTML chunks.
+    """
+    # Imported here since asyncio is slow to import and only needed for streaming.
+    from asyncio import sleep
+
+    fragments = render_iter(element, pretty=pretty, tab_indent=tab_indent)
+
+    async def stream():
+        buffer = []
+        size = 0
+        for fragment in fragments:
+            buffer.append(fragment)
+            size += len(fragment)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                await sleep(0)
 
-    props = {k: v for k, v in element.props_dict().items() if v not in [None, False]}
+        if buffer:
+            yield "".join(buffer)
 
-    props_string = render_props(props)
-    open_tag = f"{tag_name} {props_string}".strip()
+    return stream()
 
-    if element.inline:
-        if len(element.children) > 0:
-            # Maybe this should be a warning instead of an error?
-            raise RenderError("Inline components cannot have children")
-        return f"<{open_tag}>"
 
-    tab = "  " * tab_indent if pretty else ""
-    children_join_string = f"\n{tab}" if pretty else ""
-    children = [
-        _render(child, pretty=pretty, tab_indent=tab_indent + 1)
-        for child in element.children
-    ]
-    if pretty:
-        children.insert(0, "")
+_FRAGMENTS_PER_YIELD = 64
 
-    children = children_join_string.join(children)
 
-    if pretty:
-        children += f"\n{tab[:-2]}"
+def _new_render_id():
+    request = _request()
+    if request is not None:
+        request.id = str(uuid())
 
-    if not tag_name:
-        return children
 
-    return f"<{open_tag}>{children}</{tag_name}>"
+def _render(element: "Renderable | Primitive", *, pretty=False, tab_indent=1) -> str:
+    return "".join(_render_iter(element, pretty=pretty, tab_indent=tab_indent))
+
+
+def _resolve_cached(component: "Component"):
+    cache = component.__seamless_memo__
+    if cache is None:
+        return render_component(component)
+
+    return cache.render(component, "html", lambda: _render(render_component(component)))
+
+
+def _render_iter(
+    element: "Renderable | Primitive", *, pretty=False, tab_indent=1
+) -> Iterator[str]:
+    # The closing tags of the elements that are currently open.
+    closing_tags: list[str | None] = []
+    # Fragments are yielded in small batches, a yield per tag is slower than
+    # joining them.
+    parts: list[str] = []
+    write = parts.append
+
+    for node in walk(element, render_component if pretty else _resolve_cached):
+        if node is CLOSE:
+            closing_tag = closing_tags.pop()
+            if closing_tag is None:
+                continue
+
+            if pretty:
+                write(f"\n{'  ' * (tab_indent + len(closing_tags) - 1)}")
+
+            write(closing_tag)
+
+            if len(parts) >= _FRAGMENTS_PER_YIELD:
+                yield "".join(parts)
+                parts.clear()
+            continue
+
+        if pretty and closing_tags:
+            write(f"\n{'  ' * (tab_indent + len(closing_tags) - 1)}")
+
+        if type(node) is str:
+            write(node)
+            continue
+
+        if not isinstance(node, Element):
+            # Static subtrees are written as their pre-rendered HTML.
+            write(str(node) if node is not None else "")
+            continue
+
+        tag_name = getattr(node, "tag_name", None)
+
+        props = {k: v for k, v in node.props_dict().items() if v not in [None, False]}
+
+        if props:
+            props_string = render_props(props)
+            open_tag = f"{tag_name} {props_string}".strip()
+        else:
+            open_tag = tag_name
+
+        if node.inline:
+            if len(node.children) > 0:
+                # Maybe this should be a warning instead of an error?
+                raise RenderError("Inline components cannot have children")
+            closing_tags.append(None)
+            write(f"<{open_tag}>")
+        elif tag_name:
+            closing_tags.append(f"</{tag_name}>")
+            write(f"<{open_tag}>")
+        else:
+            closing_tags.append("")
+
+    if parts:
+        yield "".join(parts)
@@ -1,26 +1,129 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
-from ..components import Component
+from ..core.static import Static
 from ..element import Element
+from .tree import walk, render_component, CLOSE
 
 if TYPE_CHECKING:
+    from seamless.components import Component
     from seamless.types import Renderable, Primitive
 
+
+def _resolve_cached(component: "Component"):
+    cache = component.__seamless_memo__
+    if cache is None:
+        return render_component(component)
+
+    return cache.render(component, "json", lambda: to_dict(render_component(component)))
+
+
 def to_dict(element: "Renderable | Primitive"):
-    if isinstance(element, Component):
-        element = to_dict(element.render())
-
-    if not isinstance(element, Element):
-        return element
-
-    return {
-        "type": element.tag_name,
-        "children": list(
-            map(
-                to_dict,
-                element.children,
+    root = []
+    # The children list being filled, and those of its open ancestors.
+    current = root
+    stack = []
+
+    for node in walk(element, _resolve_cached):
+        if node is CLOSE:
+            current = stack.pop()
+        elif type(node) is str or not isinstance(node, Element):
+            current.append(node.data if isinstance(node, Static) else node)
+        else:
+            children = []
+            current.append(
+                {
+                    "type": node.tag_name,
+                    "children": children,
+                    "props": node.props_dict(),
+                }
             )
-        ),
-        "props": element.props_dict(),
-    }
+            stack.append(current)
+            current = children
+
+    return root[0]
+
+
+def to_compact(element: "Renderable | Primitive"):
+    """
+    Like `to_dict`, in a compact format for sending over the socket.
+
+    Elements are lists, `[tag, props, *children]`, where `tag` is the index of
+    the tag name in a string table and `props` is a flat list of the indices of
+    the prop names, each followed by the value of the prop. Other values are
+    kept as is.
+
+    Returns:
+        `[strings, root]`, the string table and the root node.
+    """
+    strings, intern = _string_table()
+
+    root = []
+    current = root
+    stack = []
+
+    for node in walk(element, _resolve_cached):
+        if node is CLOSE:
+            current = stack.pop()
+        elif type(node) is str:
+            current.append(node)
+        elif isinstance(node, Element):
+            compact = [intern(node.tag_name), _compact_props(node.props_dict(), intern)]
+            current.append(compact)
+            stack.append(current)
+            current = compact
+        else:
+            # Cached components and static subtrees are already in the `to_dict` format.
+            data = node.data if isinstance(node, Static) else node
+            current.append(_compact_dict(data, intern))
+
+    return [strings, root[0]]
+
+
+def dict_to_compact(data):
+    """
+    Converts a tree in the `to_dict` format to the format of `to_compact`.
+    """
+    strings, intern = _string_table()
+    return [strings, _compact_dict(data, intern)]
+
+
+def _string_table() -> tuple[list[str], Callable[[str], int]]:
+    strings: list[str] = []
+    indices: dict[str, int] = {}
+
+    def intern(string: str) -> int:
+        try:
+            return indices[string]
+        except KeyError:
+            index = indices[string] = len(strings)
+            strings.append(string)
+            return index
+
+    return strings, intern
+
+
+def _compact_props(props: dict, intern: Callable[[str], int]) -> list:
+    compact = []
+    for key, value in props.items():
+        compact.append(intern(key))
+        compact.append(value)
+    return compact
+
+
+def _compact_dict(data, intern: Callable[[str], int]):
+    root = []
+    # The nodes to convert, with the list their compact form is appended to.
+    stack = [(data, root)]
+
+    while stack:
+        node, parent = stack.pop()
+        if not isinstance(node, dict):
+            parent.append(node)
+            continue
+
+        compact = [intern(node["type"]), _compact_props(node["props"], intern)]
+        parent.append(compact)
+        # Reversed, so the children are popped in order.
+        stack.extend((child, compact) for child in reversed(node["children"]))
 
+    return root[0]
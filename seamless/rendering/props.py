@@ -1,29 +1,13 @@
 from html import escape
 from typing import Any
-from ..errors import RenderError
-from .transformers import TRANSFORMERS
+from .transformers import compiled_transformers
 
 
 def transform_props(props: dict[str, Any]):
-    props_copy = props.copy()
+    if not props:
+        return {}
 
-    for matcher, transformer in TRANSFORMERS:
-        if isinstance(matcher, str):
-            key = matcher
-            if key in props_copy:
-                value = props_copy[key]
-                if callable(transformer):
-                    transformer(key, value, props_copy)
-                else:
-                    props_copy[transformer] = value
-        elif callable(matcher):
-            for key, value in list(props_copy.items()):
-                if matcher(key, value):
-                    transformer(key, value, props_copy)
-        else:
-            raise RenderError(
-                f"Invalid matcher: {matcher} must be a callable or a string."
-            )
+    props_copy = compiled_transformers().apply(props.copy())
 
     return {
         key: value
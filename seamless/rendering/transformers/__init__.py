@@ -1,11 +1,14 @@
+from heapq import heappop, heappush
 from typing import Any, Callable
 
+from ...errors import RenderError
 from .simple_transformer import simple_transformer as _simple_transformer
 from .events_transformer import (
     events_transformer as _events_transformer,
     js_events_transformer as _js_events_transformer,
 )
 from .class_transformer import class_transformer as _class_transformer
+from .matcher import PropMatcher
 
 
 TRANSFORMERS = [
@@ -15,7 +18,12 @@ TRANSFORMERS = [
 ]
 
 
-def transformer_for(matcher: Callable[[str, Any], bool] | str):
+def transformer_for(
+    matcher: Callable[[str, Any], bool] | str | None = None,
+    *,
+    prefix: str | None = None,
+    value_type: type | tuple[type, ...] | None = None,
+):
     """
     A decorator to register a prop transformer.
 
@@ -30,6 +38,11 @@ def transformer_for(matcher: Callable[[str, Any], bool] | str):
         matcher: A callable that takes a key and a value and returns a boolean
         indicating whether the transformer should be applied. If a string is
         provided, it is assumed to be a key that should be matched exactly.
+        prefix: Only apply the transformer to keys that start with this prefix.
+        value_type: Only apply the transformer to values of this type.
+
+    Matching by key, `prefix` or `value_type` lets the transformer be looked up
+    directly instead of calling the matcher for every prop of every element.
 
     Returns:
         A decorator that takes a transformer function and registers it.
@@ -42,13 +55,203 @@ def transformer_for(matcher: Callable[[str, Any], bool] | str):
         ...
         ...     element_props["class"] = " ".join(str(class_name).split())
 
+        >>> @transformer_for(prefix="aria_")
+        ... def aria_mapper(key, value, element_props):
+        ...     element_props[key.replace("_", "-")] = value
+        ...     del element_props[key]
+
     """
+    if prefix is not None or value_type is not None:
+        if isinstance(matcher, str):
+            matcher = PropMatcher(matcher, prefix=prefix, value_type=value_type)
+        else:
+            matcher = PropMatcher(prefix=prefix, value_type=value_type, where=matcher)
+    elif matcher is None:
+        raise TypeError("transformer_for() requires a matcher, a prefix or a value_type")
 
     def decorator(func: Callable[[str, Any, dict[str, Any]], None]):
+        global _compiled
+
         TRANSFORMERS.append((matcher, func))
+        _compiled = None
         return func
 
     return decorator
 
 
+class CompiledTransformers:
+    """
+    A dispatch structure over `TRANSFORMERS`.
+
+    Transformers are looked up by exact key, by key prefix and by value type,
+    so only the transformers that may apply to a prop are checked. Transformers
+    registered with an opaque callable matcher are checked for every prop.
+
+    The transformers are still applied in registration order, and props added
+    or replaced by a transformer are dispatched to the transformers registered
+    after it.
+    """
+
+    _MAX_CACHED_CANDIDATES = 4096
+
+    def __init__(self, transformers: list[tuple[Any, Any]]):
+        # A snapshot of the transformers, to tell when the list was changed.
+        self.transformers = list(transformers)
+        # (matcher, transformer, whether the matcher must be called for each prop)
+        self.entries: list[tuple[Callable[[str, Any], bool], Any, bool]] = []
+        self.exact: dict[str, list[int]] = {}
+        self.prefixes: dict[int, dict[str, list[int]]] = {}
+        self.types: dict[type, list[int]] = {}
+        self.generic: list[int] = []
+        self._candidates: dict[tuple[str, type], tuple[int, ...]] = {}
+
+        for index, (matcher, transformer) in enumerate(transformers):
+            self._add(index, matcher, transformer)
+
+    def _add(self, index: int, matcher, transformer):
+        if isinstance(matcher, str):
+            self.exact.setdefault(matcher, []).append(index)
+            self.entries.append((_key_equals(matcher), transformer, False))
+            return
+
+        if isinstance(matcher, PropMatcher):
+            if matcher.keys:
+                for key in matcher.keys:
+                    self.exact.setdefault(key, []).append(index)
+            elif matcher.prefix is not None:
+                table = self.prefixes.setdefault(len(matcher.prefix), {})
+                table.setdefault(matcher.prefix, []).append(index)
+            elif matcher.value_type is not None:
+                value_types = matcher.value_type
+                if not isinstance(value_types, tuple):
+                    value_types = (value_types,)
+                for value_type in value_types:
+                    self.types.setdefault(value_type, []).append(index)
+            else:
+                self.generic.append(index)
+            dynamic = matcher.where is not None
+        elif callable(matcher):
+            self.generic.append(index)
+            dynamic = True
+        else:
+            raise RenderError(
+                f"Invalid matcher: {matcher} must be a callable or a string."
+            )
+
+        self.entries.append((matcher, transformer, dynamic))
+
+    def candidates(self, key: str, value: Any) -> tuple[int, ...]:
+        """
+        Returns the indices of the transformers that may apply to the prop, in
+        registration order. Only the matchers of dynamic entries still need to
+        be called.
+        """
+        cache_key = (key, type(value))
+        try:
+            return self._candidates[cache_key]
+        except KeyError:
+            pass
+
+        found = set(self.generic)
+        found.update(self.exact.get(key, ()))
+        for length, table in self.prefixes.items():
+            found.update(table.get(key[:length], ()))
+        for cls in type(value).__mro__:
+            found.update(self.types.get(cls, ()))
+
+        result = tuple(
+            index for index in sorted(found) if self._matches_statically(index, key, value)
+        )
+        if len(self._candidates) >= self._MAX_CACHED_CANDIDATES:
+            self._candidates.clear()
+        self._candidates[cache_key] = result
+        return result
+
+    def _matches_statically(self, index: int, key: str, value: Any) -> bool:
+        matcher, _, dynamic = self.entries[index]
+        if not isinstance(matcher, PropMatcher):
+            return True
+        if not dynamic:
+            return matcher(key, value)
+        # Everything but `where` only depends on the key and the value type.
+        return PropMatcher(
+            *matcher.keys, prefix=matcher.prefix, value_type=matcher.value_type
+        )(key, value)
+
+    def apply(self, props: dict[str, Any]) -> dict[str, Any]:
+        cached = self._candidates
+        # (transformer index, order, key, type of the value it was matched by)
+        pending = []
+        for key, value in props.items():
+            indices = cached.get((key, type(value)))
+            if indices is None:
+                indices = self.candidates(key, value)
+            for index in indices:
+                pending.append((index, len(pending), key, type(value)))
+
+        if not pending:
+            return props
+
+        pending.sort()
+        queued = {(index, key) for index, _, key, _ in pending}
+        order = len(pending)
+        entries = self.entries
+
+        while pending:
+            index, _, key, value_type = heappop(pending)
+            if key not in props:
+                continue
+
+            value = props[key]
+            matcher, transformer, dynamic = entries[index]
+            # The value may have been replaced by an earlier transformer.
+            if (dynamic or type(value) is not value_type) and not matcher(key, value):
+                continue
+
+            before = props.copy()
+            if callable(transformer):
+                transformer(key, value, props)
+            else:
+                props[transformer] = value
+
+            # Added props and props whose value was replaced are dispatched to
+            # the transformers registered after this one.
+            for changed_key, new_value in props.items():
+                if changed_key in before and before[changed_key] is new_value:
+                    continue
+
+                indices = cached.get((changed_key, type(new_value)))
+                if indices is None:
+                    indices = self.candidates(changed_key, new_value)
+                for later in indices:
+                    if later > index and (later, changed_key) not in queued:
+                        queued.add((later, changed_key))
+                        heappush(pending, (later, order, changed_key, type(new_value)))
+                        order += 1
+
+        return props
+
+
+def _key_equals(expected: str):
+    def matcher(key: str, _):
+        return key == expected
+
+    return matcher
+
+
+_compiled: CompiledTransformers | None = None
+
+
+def compiled_transformers() -> CompiledTransformers:
+    """
+    Returns the compiled form of `TRANSFORMERS`, rebuilding it if the list was
+    changed since it was last compiled.
+    """
+    global _compiled
+
+    if _compiled is None or _compiled.transformers != TRANSFORMERS:
+        _compiled = CompiledTransformers(TRANSFORMERS)
+    return _compiled
+
+
 transformer_for("class_name")(_class_transformer)
@@ -1,6 +1,6 @@
 from . import transformer_for
 
-@transformer_for(lambda key, _: key.startswith("aria_"))
+@transformer_for(prefix="aria_")
 def aria_transformer(key, value, props):
     aria_key = key.replace("_", "-")
     props[aria_key] = value
@@ -1,27 +1,44 @@
-from seamless.internal import SEAMLESS_ELEMENT_ATTRIBUTE, SEAMLESS_INIT_ATTRIBUTE
+from typing import TYPE_CHECKING
+
+from seamless.internal import SEAMLESS_ELEMENT_ATTRIBUTE, SEAMLESS_EVENTS_ATTRIBUTE
+from seamless.rendering.context import action_registered
+
+from .matcher import PropMatcher
+
+if TYPE_CHECKING:
+    from seamless.core.event_policy import EventPolicy
 
-def events_transformer():
 
-    def matcher(key: str, value):
-        return key.startswith("on_") and callable(value)
+def _binding(event_name: str, action_id: str, policy: "EventPolicy | None" = None) -> str:
+    """
+    Returns the `seamless:events` entry of an event handler, `event:action_id`,
+    followed by `|policy:wait` if the events are rate limited by `policy`.
+    """
+    if policy is None:
+        return f"{event_name}:{action_id}"
+    return f"{event_name}:{action_id}|{policy.kind}:{policy.wait}"
+
+
+def events_transformer():
+    matcher = PropMatcher(prefix="on_", where=lambda _, value: callable(value))
 
     def event_transformer(key: str, value, props):
         from seamless.context.database import DB
+        from seamless.core.event_policy import EventPolicy
 
         if not callable(value):
             props[key] = value
             return
         
         event_name = key.removeprefix("on_")
-        action = DB.add_event(value)
-        props[SEAMLESS_INIT_ATTRIBUTE] = props.get(SEAMLESS_INIT_ATTRIBUTE, "") + \
-        f"""this.addEventListener('{event_name}', (event) => {{
-            const outEvent = seamless.instance.eventObjectTransformer(
-              event, 
-              seamless.instance.serializeEventObject(event)
-            );
-          seamless.instance.socket.emit("event", "{action.id}", outEvent);
-        }});"""
+        action_registered()
+        policy = value if isinstance(value, EventPolicy) else None
+        action = DB.add_event(policy.handler if policy else value)
+        binding = _binding(event_name, action.id, policy)
+
+        # The client attaches a single shared listener for all the bindings.
+        bindings = props.get(SEAMLESS_EVENTS_ATTRIBUTE)
+        props[SEAMLESS_EVENTS_ATTRIBUTE] = f"{bindings},{binding}" if bindings else binding
 
         props[SEAMLESS_ELEMENT_ATTRIBUTE] = True
         del props[key]
@@ -29,8 +46,7 @@ def events_transformer():
     return matcher, event_transformer
 
 def js_events_transformer():
-    def matcher(key: str, value):
-        return key.startswith("on_") and isinstance(value, str)
+    matcher = PropMatcher(prefix="on_", value_type=str)
 
     def event_transformer(key: str, value, element_props):       
         event_name = key.removeprefix("on_")
@@ -0,0 +1,34 @@
+from typing import Any, Callable
+
+
+class PropMatcher:
+    """
+    Describes the props a transformer applies to.
+
+    A prop matches if its key is one of `keys` (when given), starts with `prefix`
+    (when given), its value is an instance of `value_type` (when given) and
+    `where(key, value)` returns a truthy value (when given).
+    """
+
+    def __init__(
+        self,
+        *keys: str,
+        prefix: str | None = None,
+        value_type: type | tuple[type, ...] | None = None,
+        where: Callable[[str, Any], Any] | None = None,
+    ):
+        self.keys = keys
+        self.prefix = prefix
+        self.value_type = value_type
+        self.where = where
+
+    def __call__(self, key: str, value: Any) -> bool:
+        if self.keys and key not in self.keys:
+            return False
+        if self.prefix is not None and not key.startswith(self.prefix):
+            return False
+        if self.value_type is not None and not isinstance(value, self.value_type):
+            return False
+        if self.where is not None and not self.where(key, value):
+            return False
+        return True
@@ -1,5 +1,9 @@
 from typing import Any
 
+from seamless.internal import SEAMLESS_KEY_ATTRIBUTE
+
+from .matcher import PropMatcher
+
 _SIMPLE_TRANSFORMERS = {
     "html_for": "for",
     "accept_charset": "accept-charset",
@@ -12,15 +16,13 @@ _SIMPLE_TRANSFORMERS = {
     "col_span": "colspan",
     "row_span": "rowspan",
     "char_set": "charset",
+    "key": SEAMLESS_KEY_ATTRIBUTE,
 }
 
 
 def simple_transformer():
-    def matcher(key: str, value):
-        return key in _SIMPLE_TRANSFORMERS
-
     def transformer(key: str, value, element_props: dict[str, Any]):
         element_props[_SIMPLE_TRANSFORMERS[key]] = value
         del element_props[key]
 
-    return matcher, transformer
+    return PropMatcher(*_SIMPLE_TRANSFORMERS), transformer
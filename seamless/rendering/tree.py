@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from ..components.base import Component
+from ..element import Element
+
+if TYPE_CHECKING:
+    from seamless.types import Renderable, Primitive
+
+
+class _Close:
+    def __repr__(self):
+        return "CLOSE"
+
+
+CLOSE: Any = _Close()
+"""Yielded by `walk` after the children of an element."""
+
+
+def render_component(component: Component) -> Any:
+    """
+    Renders the component, passing its `key` to the element it renders.
+    """
+    element = component.render()
+    key = component.__seamless_key__
+    if key is not None and isinstance(element, Element):
+        element.props["key"] = key
+    return element
+
+
+def walk(
+    element: "Renderable | Primitive",
+    resolve: Callable[[Component], Any] = render_component,
+) -> Iterator[Any]:
+    """
+    Walks the element tree depth first, without recursion.
+
+    Components are replaced by the result of `resolve`, which renders them by default.
+
+    Yields:
+        Every element before its children and `CLOSE` after them, and every
+        value that is not an element (text, numbers, `None`) as is.
+    """
+    # The children iterators of the ancestors of the current element.
+    stack: list[Iterator] = []
+    children = iter((element,))
+
+    while True:
+        for child in children:
+            if type(child) is str:
+                yield child
+                continue
+
+            while isinstance(child, Component):
+                child = resolve(child)
+
+            yield child
+
+            if isinstance(child, Element):
+                if child.children:
+                    stack.append(children)
+                    children = iter(child.children)
+                    break
+                yield CLOSE
+        else:
+            if not stack:
+                return
+            children = stack.pop()
+            yield CLOSE
@@ -43,6 +43,6 @@ class StyleObject:
         return StyleObject._StyleProperty(self, name)
 
 
-@transformer_for(lambda _, value: isinstance(value, StyleObject))
+@transformer_for(value_type=StyleObject)
 def style_transformer(key, value: StyleObject, props):
     props[key] = value.to_css()
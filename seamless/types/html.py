@@ -146,6 +146,7 @@ class HTMLElement(TypedDict, total=False):
     translate: str
 
     init: "JS"
+    key: str | int
 
 
 class HTMLElementProps(HTMLElement, AriaProps, HTMLEventProps):
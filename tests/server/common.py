@@ -16,9 +16,8 @@ def css_file(minified=False):
 
 def db_memory():
     return {
-        "elements": len(DB.elements),
-        "ids": len(DB.element_ids),
-        "unclaimed": list(DB._all_unclaimed.keys()),
+        **DB.stats(),
+        "unclaimed": DB._all_unclaimed,
     }
 
 
@@ -0,0 +1,206 @@
+from seamless.context.action_store import SQLiteActionStore
+from seamless.context.database import ElementsDatabase
+from seamless.context.request import HTTPRequest, WSRequest, request_context, set_request
+from seamless.core import SocketID
+from seamless.errors import ActionError
+from seamless.internal import _DataValidationError
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+
+def make_http_request():
+    return HTTPRequest.make({"method": "GET", "path": "/", "query_string": "", "headers": []})
+
+
+class TestElementsDatabase(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def tearDown(self):
+        set_request(None)
+
+    def test_claim(self):
+        db = ElementsDatabase(claim_time=30)
+        request = make_http_request()
+        request.id = "claim"
+
+        def handler(): ...
+
+        action = db.add_event(handler)
+        db.add_event(lambda: None)
+        self.assertEqual(db.pending_claims, 1)
+
+        db.claim("claim", "socket")
+        self.assertEqual(db.pending_claims, 0)
+        self.assertIs(db.store.get(action.id, "socket"), action)
+        self.assertEqual(db.stats()["claimed_claims"], 1)
+
+    def test_claim_expiry(self):
+        db = ElementsDatabase(claim_time=0)
+        threads = threading.active_count()
+        request = make_http_request()
+        for claim_id in ("a", "b", "c"):
+            request.id = claim_id
+            db.add_event(lambda: None)
+
+        self.assertEqual(threading.active_count(), threads)
+        db.claim("a", "socket")
+        self.assertEqual(db.store.events, {})
+        stats = db.stats()
+        self.assertEqual(stats["pending_claims"], 0)
+        self.assertEqual(stats["expired_claims"], 3)
+        self.assertEqual(stats["claimed_claims"], 0)
+
+    def test_action_ids(self):
+        db = ElementsDatabase()
+        first, second = Recorder("first"), Recorder("second")
+
+        def render(claim_id):
+            make_http_request().id = claim_id
+            return [
+                db.add_event(record).id,
+                db.add_event(first.record).id,
+                db.add_event(second.record).id,
+                db.add_event(first.record).id,
+            ]
+
+        self.assertEqual(
+            render("first"),
+            [
+                "tests.test_database:record",
+                "tests.test_database:Recorder.record#0",
+                "tests.test_database:Recorder.record#1",
+                "tests.test_database:Recorder.record#0",
+            ],
+        )
+        self.assertEqual(render("second"), render("third"))
+        self.assertEqual(len(db.store.pop_unclaimed("first")), 3)
+
+    def test_socket_actions(self):
+        db = ElementsDatabase()
+        for socket_id in ("first", "second"):
+            with request_context(WSRequest(socket_id)):
+                action = db.add_event(Recorder(socket_id).record)
+                self.assertIs(db.add_event(record), db.add_event(record))
+
+        asyncio.run(db.invoke_event(action.id, 1, scope="first"))
+        asyncio.run(db.invoke_event(action.id, 2, scope="second"))
+        asyncio.run(db.invoke_event("tests.test_database:record", 3))
+        self.assertEqual(CALLS, [("first", 1), ("second", 2), 3])
+
+        db.release_actions("first")
+        with self.assertRaises(ActionError):
+            asyncio.run(db.invoke_event(action.id, 1, scope="first"))
+
+    def test_claim_then_socket_actions(self):
+        db = ElementsDatabase()
+        page, fetched = Recorder("page"), Recorder("fetched")
+        make_http_request().id = "claim"
+        page_action = db.add_event(page.record)
+        set_request(None)
+
+        db.claim("claim", "socket")
+        with request_context(WSRequest("socket")):
+            self.assertIs(db.add_event(page.record), page_action)
+            fetched_action = db.add_event(fetched.record)
+
+        self.assertNotEqual(fetched_action.id, page_action.id)
+        asyncio.run(db.invoke_event(page_action.id, 1, scope="socket"))
+        asyncio.run(db.invoke_event(fetched_action.id, 2, scope="socket"))
+        self.assertEqual(CALLS, [("page", 1), ("fetched", 2)])
+
+    def test_invoke_event(self):
+        db = ElementsDatabase()
+
+        async def handler(value: int, socket_id: SocketID, name: str = "default"):
+            CALLS.append((value, socket_id, name))
+            return value
+
+        with request_context(WSRequest("socket")):
+            action = db.add_event(handler)
+
+        self.assertEqual(asyncio.run(db.invoke_event(action.id, "1", scope="socket")), 1)
+        asyncio.run(db.invoke_event(action.id, 2, "name", scope="socket"))
+        self.assertEqual(CALLS, [(1, "socket", "default"), (2, "socket", "name")])
+
+        with self.assertRaises(_DataValidationError):
+            asyncio.run(db.invoke_event(action.id, "one", scope="socket"))
+
+
+CALLS = []
+
+
+def record(value: int):
+    CALLS.append(value)
+
+
+class Recorder:
+    def __init__(self, name: str):
+        self.name = name
+
+    def record(self, value: int):
+        CALLS.append((self.name, value))
+
+
+class TestSQLiteActionStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "actions.db")
+        CALLS.clear()
+
+    def tearDown(self):
+        set_request(None)
+
+    def test_claim_from_another_database(self):
+        rendering = ElementsDatabase(store=SQLiteActionStore(self.path))
+        claiming = ElementsDatabase(store=SQLiteActionStore(self.path))
+        request = make_http_request()
+        request.id = "claim"
+
+        function_action = rendering.add_event(record)
+        method_action = rendering.add_event(Recorder("recorder").record)
+        self.assertEqual(claiming.pending_claims, 1)
+
+        claiming.claim("claim", "socket")
+        self.assertEqual(rendering.pending_claims, 0)
+
+        asyncio.run(claiming.invoke_event(function_action.id, 1, scope="socket"))
+        asyncio.run(claiming.invoke_event(method_action.id, 2, scope="socket"))
+        self.assertEqual(CALLS, [1, ("recorder", 2)])
+
+        claiming.release_actions("socket")
+        with self.assertRaises(ActionError):
+            asyncio.run(rendering.invoke_event(method_action.id, 3, scope="socket"))
+
+    def test_claim_expiry(self):
+        db = ElementsDatabase(claim_time=0, store=SQLiteActionStore(self.path))
+        request = make_http_request()
+        for claim_id in ("a", "b"):
+            request.id = claim_id
+            db.add_event(record)
+
+        db.claim("a", "socket")
+        self.assertEqual(db.pending_claims, 0)
+        self.assertEqual(db.stats()["expired_claims"], 2)
+
+    def test_discard_actions(self):
+        db = ElementsDatabase(store=SQLiteActionStore(self.path))
+        with request_context(WSRequest("socket")):
+            kept = db.add_event(Recorder("kept").record)
+            discarded = db.add_event(Recorder("discarded").record)
+
+        db.discard_actions("socket", {discarded.id})
+        self.assertIsNone(db.store.get(discarded.id, "socket"))
+        self.assertIs(db.store.get(kept.id, "socket"), kept)
+
+    def test_unpicklable_action(self):
+        db = ElementsDatabase(store=SQLiteActionStore(self.path))
+        make_http_request().id = "claim"
+
+        with self.assertRaises(ActionError):
+            db.add_event(lambda: None)
@@ -0,0 +1,83 @@
+from seamless.context.database import ElementsDatabase
+from seamless.context.executor import ExecutorPolicy, inline
+from seamless.context.request import WSRequest, request, request_context
+from seamless.errors import ActionQueueFullError
+
+import asyncio
+import threading
+import unittest
+
+
+def current_thread(value: int):
+    return threading.current_thread(), request(), value
+
+
+@inline
+def inline_thread(value: int):
+    return threading.current_thread(), request(), value
+
+
+class TestExecutorPolicy(unittest.TestCase):
+    def setUp(self):
+        self.executor = ExecutorPolicy(max_workers=2, max_pending=1)
+        self.addCleanup(self.executor.shutdown)
+        self.db = ElementsDatabase(executor=self.executor)
+
+    def invoke(self, callback, *data):
+        async def invoke():
+            with request_context(WSRequest("socket")) as ws_request:
+                action = self.db.add_event(callback)
+                return ws_request, await self.db.invoke_event(action.id, *data)
+
+        return asyncio.run(invoke())
+
+    def test_thread_pool(self):
+        ws_request, (thread, action_request, value) = self.invoke(current_thread, "1")
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertIs(action_request, ws_request)
+        self.assertEqual(value, 1)
+        self.assertEqual(self.executor.stats()["completed_actions"], 1)
+
+    def test_inline(self):
+        ws_request, (thread, action_request, _) = self.invoke(inline_thread, 1)
+        self.assertIs(thread, threading.current_thread())
+        self.assertIs(action_request, ws_request)
+        self.assertEqual(self.executor.stats()["submitted_actions"], 0)
+
+    def test_queue_limit(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+
+        def fast():
+            ...
+
+        async def invoke():
+            slow_action = self.db.add_event(slow)
+            fast_action = self.db.add_event(fast)
+            running = asyncio.ensure_future(self.db.invoke_event(slow_action.id, scope="socket"))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            try:
+                with self.assertRaises(ActionQueueFullError):
+                    await self.db.invoke_event(fast_action.id, scope="socket")
+            finally:
+                release.set()
+                await running
+
+            await self.db.invoke_event(fast_action.id, scope="socket")
+
+        with request_context(WSRequest("socket")):
+            asyncio.run(invoke())
+
+        self.assertEqual(
+            self.executor.stats(),
+            {
+                "pending_actions": 0,
+                "submitted_actions": 2,
+                "completed_actions": 2,
+                "rejected_actions": 1,
+            },
+        )
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import unittest
+
+import seamless
+from seamless import html
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_elements(self):
+        from seamless.html._elements import Div
+
+        self.assertIs(seamless.Div, Div)
+        self.assertIs(html.Div, Div)
+        self.assertIn("Div", dir(seamless))
+        self.assertIn("Video", dir(html))
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError):
+            seamless.NotAnElement
+
+        with self.assertRaises(ImportError):
+            from seamless import NotAnElement  # noqa: F401
+
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, seamless\n"
+            "assert 'seamless.types.html' not in sys.modules\n"
+            "seamless.Video\n"
+            "assert 'seamless.types.html' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from seamless import *", namespace)
+        self.assertIn("Div", namespace)
+        self.assertIn("render", namespace)
+
+
+class TestGeneratedElements(unittest.TestCase):
+    def test_elements(self):
+        div = html.Div("Hello", class_name="greeting")
+        self.assertEqual(div.tag_name, "div")
+        self.assertEqual(div.children, ("Hello",))
+        self.assertEqual(div.props, {"class_name": "greeting"})
+        self.assertFalse(div.inline)
+        self.assertTrue(html.Br().inline)
+        self.assertEqual(html.Del.tag_name, "del")
+
+    def test_slots(self):
+        for element in (html.Div(), html.Meta(charset="utf-8"), html.Fragment()):
+            with self.subTest(element=type(element).__name__):
+                self.assertFalse(hasattr(element, "__dict__"))
+
+    def test_no_init(self):
+        self.assertNotIn("__init__", vars(html.Div))
+        self.assertNotIn("__init__", vars(html.Meta))
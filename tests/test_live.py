@@ -0,0 +1,223 @@
+from seamless import Button, Component, Div, Li, Ul, render
+from seamless.context.database import DB
+from seamless.context.live import LIVE, action_ids
+from seamless.context.request import HTTPRequest, WSRequest, request_context, set_request
+from seamless.core import JS, Empty, mark_dirty
+from seamless.errors import RenderError
+from seamless.rendering.diff import diff
+from seamless.rendering.json import to_dict
+
+import asyncio
+import unittest
+
+
+class Items(Component, live=True):
+    def __init__(self, items: list[str]):
+        self.items = items
+
+    def render(self):
+        return Ul(*[Li(item) for item in self.items], class_name="items")
+
+    def add(self, event: dict):
+        self.items.append(event["item"])
+        mark_dirty(self)
+
+
+class Counter(Component, live=True):
+    def __init__(self):
+        self.count = 0
+
+    def render(self):
+        return Button(self.count, on_click=self.increment)
+
+    def increment(self, event: dict):
+        self.count += 1
+        mark_dirty(self)
+
+
+class Toggle(Component, live=True):
+    def __init__(self):
+        self.on = False
+
+    def render(self):
+        return Button("on" if self.on else "off", on_click=lambda event: self.toggle())
+
+    def toggle(self):
+        self.on = not self.on
+        mark_dirty(self)
+
+
+class TestDiff(unittest.TestCase):
+    def test_equal(self):
+        self.assertEqual(diff(to_dict(Div("a")), to_dict(Div("a"))), [])
+
+    def test_text(self):
+        self.assertEqual(
+            diff(to_dict(Div(Div("a"), "b")), to_dict(Div(Div("c"), "b"))),
+            [["replace", [0, 0], "c"]],
+        )
+
+    def test_props(self):
+        self.assertEqual(
+            diff(to_dict(Div(id="a", title="b")), to_dict(Div(id="c", class_name="d"))),
+            [["props", [], {"id": "c", "class": "d"}, ["title"]]],
+        )
+
+    def test_children(self):
+        self.assertEqual(
+            diff(to_dict(Ul(Li("a"))), to_dict(Ul(Li("b"), Li("c")))),
+            [["append", [], [{"type": "li", "children": ["c"], "props": {}}]], ["replace", [0, 0], "b"]],
+        )
+        self.assertEqual(
+            diff(to_dict(Ul(Li("a"), Li("b"))), to_dict(Ul(Li("a")))),
+            [["truncate", [], 1]],
+        )
+
+    def test_type(self):
+        new = to_dict(Div(Ul()))
+        self.assertEqual(diff(to_dict(Div(Div())), new), [["replace", [0], new["children"][0]]])
+
+    def test_empty(self):
+        new = to_dict(Div(Empty("b"), "c"))
+        self.assertEqual(diff(to_dict(Div(Empty("a"), "c")), new), [["replace", [], new]])
+
+    def test_init(self):
+        new = to_dict(Div(Button(init=JS("b"))))
+        self.assertEqual(
+            diff(to_dict(Div(Button(init=JS("a")))), new),
+            [["replace", [0], new["children"][0]]],
+        )
+
+
+class TestLive(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(DB.release_actions, "test-socket")
+        self.addCleanup(LIVE.release, "test-socket")
+
+    def test_live_id(self):
+        items = Items(items=["a"])
+        html = render(items)
+        self.assertIn(f'seamless:live="{items.__seamless_live_id__}"', html)
+        self.assertEqual(render(items), html)
+
+    def test_render_patches(self):
+        items = Items(items=["a"])
+        render(items)
+        live_id = items.__seamless_live_id__
+
+        with request_context(WSRequest("test-socket")):
+            items.add({"item": "b"})
+            ((updated_id, patches),) = LIVE.render_patches("test-socket")
+            self.assertEqual(updated_id, live_id)
+            self.assertEqual(patches, [["replace", [], to_dict(items)]])
+
+            items.add({"item": "c"})
+            self.assertEqual(
+                LIVE.render_patches("test-socket"),
+                [[live_id, [["append", [], [{"type": "li", "children": ["c"], "props": {}}]]]]],
+            )
+
+            mark_dirty(items)
+            self.assertEqual(LIVE.render_patches("test-socket"), [])
+
+    def test_instances_keep_their_actions(self):
+        first, second = Counter(), Counter()
+        request = HTTPRequest.make({"method": "GET", "path": "/", "query_string": "", "headers": []})
+        request.id = "live-page"
+        first_id, second_id = action_ids(to_dict(Div(first, second)))
+        set_request(None)
+        DB.claim("live-page", "test-socket")
+
+        with request_context(WSRequest("test-socket")):
+            asyncio.run(DB.invoke_event(second_id, {}, scope="test-socket"))
+            ((_, patches),) = LIVE.render_patches("test-socket")
+            self.assertEqual(action_ids(patches[0][2]), {second_id})
+
+            asyncio.run(DB.invoke_event(first_id, {}, scope="test-socket"))
+            LIVE.render_patches("test-socket")
+
+        self.assertEqual((first.count, second.count), (1, 1))
+
+    def test_discard_replaced_actions(self):
+        toggle = Toggle()
+        with request_context(WSRequest("test-socket")):
+            for _ in range(3):
+                toggle.toggle()
+                LIVE.render_patches("test-socket")
+
+            (action_id,) = DB.store.scopes["test-socket"]
+            asyncio.run(DB.invoke_event(action_id, {}, scope="test-socket"))
+
+        self.assertFalse(toggle.on)
+
+    def test_not_live(self):
+        class Static(Component):
+            def render(self):
+                return Div()
+
+        with request_context(WSRequest("test-socket")):
+            with self.assertRaises(TypeError):
+                mark_dirty(Static())
+
+        with self.assertRaises(RenderError):
+            mark_dirty(Items(items=[]))
+
+    def test_single_element(self):
+        class Fragment(Component, live=True):
+            def render(self):
+                return Empty(Div(), Div())
+
+        with self.assertRaises(RenderError):
+            render(Fragment())
+
+    def test_memo(self):
+        with self.assertRaises(TypeError):
+
+            class Memoized(Component, live=True, memo=True):
+                def render(self):
+                    return Div()
+
+
+class TestKeyedDiff(unittest.TestCase):
+    def items(self, *keys):
+        return to_dict(Ul(*[Li(str(key), key=key) for key in keys]))
+
+    def test_insert(self):
+        new = self.items("d", "a", "b", "c")
+        self.assertEqual(
+            diff(self.items("a", "b", "c"), new),
+            [["reorder", [], [new["children"][0], 0, 1, 2]]],
+        )
+
+    def test_move_and_remove(self):
+        self.assertEqual(
+            diff(self.items("a", "b", "c"), self.items("c", "a")),
+            [["reorder", [], [2, 0]]],
+        )
+
+    def test_change(self):
+        old = self.items("a", "b")
+        new = self.items("b", "a")
+        new["children"][0]["children"] = ["changed"]
+        self.assertEqual(
+            diff(old, new),
+            [["reorder", [], [1, 0]], ["replace", [0, 0], "changed"]],
+        )
+
+    def test_unkeyed(self):
+        old = to_dict(Ul(Li("a", key="a"), Li("b")))
+        new = to_dict(Ul(Li("b"), Li("a", key="a")))
+        self.assertEqual(
+            diff(old, new),
+            [
+                ["props", [1], {"seamless:key": "a"}, []],
+                ["replace", [1, 0], "a"],
+                ["props", [0], {}, ["seamless:key"]],
+                ["replace", [0, 0], "b"],
+            ],
+        )
+
+    def test_component_key(self):
+        items = Items(items=["a"], key="items")
+        self.assertEqual(to_dict(items)["props"]["seamless:key"], "items")
+        self.assertIn('seamless:key="items"', render(Div(items)))
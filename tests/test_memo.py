@@ -0,0 +1,74 @@
+from seamless import Component, Div, Button, render
+from seamless.components import RenderCache, memo
+from seamless.context.database import DB
+from seamless.context.request import HTTPRequest, set_request
+from seamless.rendering.json import to_dict
+
+import unittest
+
+
+class TestMemo(unittest.TestCase):
+    def test_memo_class_keyword(self):
+        renders = []
+
+        class Header(Component, memo=True):
+            def __init__(self, title):
+                self.title = title
+
+            def render(self):
+                renders.append(self.title)
+                return Div(self.title, class_name="header")
+
+        self.assertEqual(render(Header(title="a")), '<div class="header">a</div>')
+        self.assertEqual(render(Header(title="a")), '<div class="header">a</div>')
+        self.assertEqual(render(Header(title="b")), '<div class="header">b</div>')
+        self.assertEqual(
+            to_dict(Header(title="a")),
+            {"type": "div", "children": ["a"], "props": {"class": "header"}},
+        )
+        self.assertEqual(renders, ["a", "b", "a"])
+
+    def test_memo_decorator_eviction(self):
+        renders = []
+
+        @memo(maxsize=1)
+        class Title(Component):
+            def render(self):
+                renders.append(self.children)
+                return Div(*self.children)
+
+        render(Div(Title("a"), Title("a"), Title("b"), Title("a")))
+        self.assertEqual(renders, [("a",), ("b",), ("a",)])
+        self.assertEqual(len(Title.__seamless_memo__), 1)
+
+    def test_memo_ttl(self):
+        cache = RenderCache(ttl=0)
+
+        class Footer(Component, memo=cache):
+            def render(self):
+                return Div("footer")
+
+        render(Footer())
+        render(Footer())
+        self.assertEqual(cache.hits, 0)
+
+    def test_memo_bypassed_with_actions(self):
+        class Clickable(Component, memo=True):
+            def render(self):
+                return Button("Click me", on_click=self.click)
+
+            def click(self):
+                ...
+
+        request = HTTPRequest.make(
+            {"method": "GET", "path": "/", "query_string": "", "headers": []}
+        )
+        try:
+            for _ in range(2):
+                render(Clickable())
+                DB.claim(request.id, "test-socket")
+        finally:
+            set_request(None)
+            DB.release_actions("test-socket")
+
+        self.assertEqual(len(Clickable.__seamless_memo__), 0)
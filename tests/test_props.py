@@ -0,0 +1,109 @@
+from seamless import Div, render
+from seamless.context.database import DB
+from seamless.context.request import WSRequest, request_context
+from seamless.core import debounce, latest, throttle
+from seamless.rendering.props import transform_props
+from seamless.rendering.transformers import TRANSFORMERS, transformer_for
+from seamless.styling import StyleObject
+
+import unittest
+
+
+class TestProps(unittest.TestCase):
+    def setUp(self):
+        transformers = TRANSFORMERS.copy()
+
+        def restore():
+            TRANSFORMERS[:] = transformers
+
+        self.addCleanup(restore)
+
+    def test_transform_props(self):
+        self.assertEqual(
+            transform_props(
+                {"class_name": ["a", "b"], "html_for": "x", "style": StyleObject(color="red")}
+            ),
+            {"style": "color:red;", "class": "a b", "for": "x"},
+        )
+
+    def test_transformer_for_prefix(self):
+        @transformer_for(prefix="test_prefix_")
+        def _(key, value, props):
+            props[key.removeprefix("test_prefix_")] = value
+            del props[key]
+
+        self.assertEqual(render(Div(test_prefix_data="1")), '<div data="1"></div>')
+
+    def test_transformer_for_value_type(self):
+        class Marker: ...
+
+        @transformer_for(value_type=Marker)
+        def _(key, value, props):
+            props[key] = "marker"
+
+        self.assertEqual(render(Div(title=Marker())), '<div title="marker"></div>')
+
+    def test_transformer_for_added_props(self):
+        @transformer_for("test_source")
+        def _(key, value, props):
+            props["test_target"] = value
+            del props[key]
+
+        @transformer_for("test_target")
+        def _(key, value, props):
+            props[key] = value.upper()
+
+        self.assertEqual(transform_props({"test_source": "a"}), {"test_target": "A"})
+
+    def test_transformer_for_replaced_value(self):
+        class Marker: ...
+
+        @transformer_for(value_type=Marker)
+        def _(key, value, props):
+            props[key] = "marker"
+
+        @transformer_for(prefix="test_chain_", value_type=str)
+        def _(key, value, props):
+            props[key] = value.upper()
+
+        self.assertEqual(
+            transform_props({"test_chain_title": Marker()}), {"test_chain_title": "MARKER"}
+        )
+        self.assertEqual(transform_props({"test_chain_title": "a"}), {"test_chain_title": "A"})
+
+    def test_transformers_replaced(self):
+        def second(key, value, props):
+            props[key] = "second"
+
+        @transformer_for("test_replaced")
+        def first(key, value, props):
+            props[key] = "first"
+
+        self.assertEqual(transform_props({"test_replaced": 1}), {"test_replaced": "first"})
+
+        TRANSFORMERS[-1] = ("test_replaced", second)
+        self.assertEqual(transform_props({"test_replaced": 1}), {"test_replaced": "second"})
+
+    def test_event_policies(self):
+        def search(query: str): ...
+
+        with request_context(WSRequest("test-socket")):
+            try:
+                plain = transform_props({"on_input": search, "on_change": search})
+                debounced = transform_props({"on_input": debounce(search, 150)})
+                throttled = transform_props({"on_input": throttle(search, 100)})
+                latest_only = transform_props({"on_input": latest(search)})
+                action_id = DB.add_event(search).id
+            finally:
+                DB.release_actions("test-socket")
+
+        self.assertEqual(
+            plain,
+            {
+                "seamless:events": f"input:{action_id},change:{action_id}",
+                "seamless:element": True,
+            },
+        )
+        self.assertEqual(debounced["seamless:events"], f"input:{action_id}|debounce:150")
+        self.assertEqual(throttled["seamless:events"], f"input:{action_id}|throttle:100")
+        self.assertEqual(latest_only["seamless:events"], f"input:{action_id}|latest:0")
@@ -0,0 +1,146 @@
+from seamless.context.database import DB
+from seamless.context.executor import coalesce
+from seamless.context.request import WSRequest, request_context
+from seamless.errors import ActionQueueFullError
+from seamless.middlewares import ASGIMiddleware
+from seamless.middlewares.queues import SocketQueues
+
+import asyncio
+import unittest
+
+
+class TestSocketQueues(unittest.TestCase):
+    def test_order_per_socket(self):
+        log = []
+        running = 0
+        max_running = 0
+
+        async def handle(sid, index):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001 * (5 - index))
+            log.append((sid, index))
+            running -= 1
+            return index
+
+        async def main():
+            queues = SocketQueues(max_concurrency=2)
+            futures = [
+                queues.submit(sid, lambda sid=sid, index=index: handle(sid, index))
+                for index in range(5)
+                for sid in ("a", "b", "c")
+            ]
+            return await asyncio.gather(*futures)
+
+        results = asyncio.run(main())
+        self.assertEqual(results, [index for index in range(5) for _ in range(3)])
+        for sid in ("a", "b", "c"):
+            self.assertEqual([index for s, index in log if s == sid], list(range(5)))
+        self.assertEqual(max_running, 2)
+
+    def test_coalesce(self):
+        handled = []
+
+        async def handle(value):
+            handled.append(value)
+            return value
+
+        async def main():
+            queues = SocketQueues()
+            futures = [
+                queues.submit("a", lambda value=value: handle(value), coalesce_key="input")
+                for value in range(5)
+            ]
+            futures.append(queues.submit("a", lambda: handle("click")))
+            return await asyncio.gather(*futures), queues
+
+        results, queues = asyncio.run(main())
+        self.assertEqual(handled, [4, "click"])
+        self.assertEqual(results, [None, None, None, None, 4, "click"])
+        self.assertEqual(queues.coalesced, 4)
+
+    def test_coalesce_keeps_position(self):
+        handled = []
+
+        async def handle(value):
+            handled.append(value)
+
+        async def main():
+            queues = SocketQueues()
+            await asyncio.gather(
+                queues.submit("a", lambda: handle(0), coalesce_key="input"),
+                queues.submit("a", lambda: handle("click")),
+                queues.submit("a", lambda: handle(1), coalesce_key="input"),
+            )
+
+        asyncio.run(main())
+        self.assertEqual(handled, [1, "click"])
+
+    def test_max_queued_events(self):
+        async def handle():
+            await asyncio.sleep(0)
+
+        async def main():
+            queues = SocketQueues(max_queued_events=2)
+            futures = [queues.submit("a", handle) for _ in range(2)]
+            with self.assertRaises(ActionQueueFullError):
+                queues.submit("a", handle)
+            futures.append(queues.submit("b", handle))
+            await asyncio.gather(*futures)
+            return queues
+
+        queues = asyncio.run(main())
+        self.assertEqual(queues.pending("a"), 0)
+
+    def test_middleware_disconnect(self):
+        middleware = ASGIMiddleware(None)
+        handlers = middleware.server.handlers["/"]
+
+        started = []
+
+        async def on_click(event: dict):
+            started.append(True)
+            await asyncio.sleep(0.01)
+            DB.add_event(lambda: None)
+
+        with request_context(WSRequest("socket")):
+            action = DB.add_event(on_click)
+
+        async def main():
+            handled = asyncio.ensure_future(handlers["event"]("socket", action.id, {}))
+            while not started:
+                await asyncio.sleep(0)
+            await middleware.server._trigger_event("disconnect", "/", "socket")
+            await handled
+
+        try:
+            asyncio.run(main())
+            self.assertNotIn("socket", DB._socket_keys)
+            self.assertNotIn("socket", DB.store.scopes)
+        finally:
+            DB.release_actions("socket")
+
+    def test_middleware_coalesce(self):
+        middleware = ASGIMiddleware(None)
+        handle_event = middleware.server.handlers["/"]["event"]
+        values = []
+
+        @coalesce
+        async def on_input(value: str):
+            values.append(value)
+
+        with request_context(WSRequest("socket")):
+            action = DB.add_event(on_input)
+
+        async def main():
+            await asyncio.gather(
+                *[handle_event("socket", action.id, value) for value in "abc"]
+            )
+
+        try:
+            asyncio.run(main())
+        finally:
+            DB.release_actions("socket")
+
+        self.assertEqual(values, ["c"])
@@ -1,7 +1,13 @@
-from seamless import Component, Div, render
+from seamless import Component, Div, Button, render
+from seamless.components.router import RouterLink
+from seamless.core import JS, static
 from seamless.element import Element
-from seamless.rendering.json import to_dict
+from seamless.errors import RenderError
+from seamless.rendering.html import render_iter, render_stream
+from seamless.rendering.json import dict_to_compact, to_compact, to_dict
 
+import asyncio
+import sys
 import unittest
 
 
@@ -71,6 +77,77 @@ class TestRender(unittest.TestCase):
             '<div><div id="my-div">Hello</div><div></div>World</div>',
         )
 
+    def test_render_iter(self):
+        element = Div(Div("Hello", id="my-div"), Div(), "World")
+        self.assertEqual("".join(render_iter(element)), render(element))
+        self.assertEqual(
+            "".join(render_iter(element, pretty=True)), render(element, pretty=True)
+        )
+
+    def test_render_stream(self):
+        element = Div(*[Div(str(i)) for i in range(100)])
+
+        async def collect():
+            return [chunk async for chunk in render_stream(element, chunk_size=64)]
+
+        chunks = asyncio.run(collect())
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), render(element))
+
+    def test_render_deep(self):
+        depth = sys.getrecursionlimit() * 2
+        element = "Hello"
+        for _ in range(depth):
+            element = Div(element)
+
+        self.assertEqual(render(element), "<div>" * depth + "Hello" + "</div>" * depth)
+
+        tree = to_dict(element)
+        for _ in range(depth):
+            self.assertEqual(tree["type"], "div")
+            (tree,) = tree["children"]
+        self.assertEqual(tree, "Hello")
+
+    def test_compact_deep(self):
+        depth = sys.getrecursionlimit() * 2
+        element = "Hello"
+        for _ in range(depth):
+            element = Div(element)
+
+        strings, root = dict_to_compact(to_dict(element))
+        self.assertEqual(strings, ["div"])
+        self.assertCompactDepth(root, depth)
+
+        # Static subtrees are converted from the `to_dict` format.
+        strings, root = to_compact(Div(static(element)))
+        self.assertEqual(strings, ["div"])
+        self.assertCompactDepth(root, depth + 1)
+
+    def assertCompactDepth(self, node, depth):
+        for _ in range(depth):
+            self.assertEqual(node[:2], [0, []])
+            (node,) = node[2:]
+        self.assertEqual(node, "Hello")
+
+    def test_render_static(self):
+        header = static(Div(Div("Hello", id="my-div"), class_name="header"))
+        self.assertEqual(
+            render(Div(header, "World")),
+            '<div><div class="header"><div id="my-div">Hello</div></div>World</div>',
+        )
+        self.assertEqual(
+            to_dict(Div(header)),
+            {
+                "type": "div",
+                "children": [to_dict(Div(Div("Hello", id="my-div"), class_name="header"))],
+                "props": {},
+            },
+        )
+
+    def test_render_static_with_actions(self):
+        with self.assertRaises(RenderError):
+            static(Button(on_click=lambda: None))
+
     def test_render_json(self):
         self.assertEqual(
             to_dict(Div()), {"type": "div", "children": [], "props": {}}
@@ -147,3 +224,39 @@ class TestRender(unittest.TestCase):
                 "props": {"class": "my-class"},
             }
         )
+
+    def test_render_compact(self):
+        header = static(Div("Hello", class_name="header"))
+        self.assertEqual(
+            to_compact(Div(header, Div("World", 1, class_name="body"), id="my-id")),
+            [
+                ["div", "id", "class"],
+                [0, [1, "my-id"], [0, [2, "header"], "Hello"], [0, [2, "body"], "World", 1]],
+            ],
+        )
+
+    def test_render_compact_text(self):
+        self.assertEqual(to_compact("Hello"), [[], "Hello"])
+
+
+class TestRouterLink(unittest.TestCase):
+    def test_no_prefetch(self):
+        html = render(RouterLink(to="/about")("About"))
+        self.assertNotIn("prefetchRoute", html)
+        self.assertEqual(html, render(RouterLink(to="/about", prefetch=None)("About")))
+
+    def test_prefetch(self):
+        hover = render(RouterLink(to="/about", prefetch="hover")("About"))
+        self.assertIn("mouseenter", hover)
+        self.assertIn("seamless.prefetchRoute?.(&quot;/about&quot;)", hover)
+
+        visible = render(RouterLink(to="/about", prefetch="visible")("About"))
+        self.assertIn("IntersectionObserver", visible)
+
+    def test_init(self):
+        html = render(RouterLink(to="/about", init=JS("setup(this);"))("About"))
+        self.assertIn("setup(this);", html)
+
+        html = render(RouterLink(to="/about", prefetch="hover", init=JS("setup(this);"))("About"))
+        self.assertIn("mouseenter", html)
+        self.assertIn("setup(this);", html)
@@ -0,0 +1,66 @@
+from seamless import Component, Button, Div
+from seamless.context.database import DB
+from seamless.context.request import HTTPRequest, WSRequest, request, request_context
+from seamless.rendering.html import render_stream
+
+from html import unescape
+
+import asyncio
+import re
+import unittest
+
+ACTION_ID_PATTERN = re.compile(r'seamless:events="click:([^"]+)"')
+
+
+def make_http_request():
+    return HTTPRequest({"method": "GET", "path": "/", "query_string": "", "headers": []})
+
+
+class Counter(Component):
+    def __init__(self, index: int):
+        self.index = index
+
+    def render(self):
+        return Div(
+            *[
+                Button(f"{self.index}-{i}", on_click=lambda i=i: i)
+                for i in range(50)
+            ]
+        )
+
+
+class TestRequestContext(unittest.TestCase):
+    def test_request_context(self):
+        http_request = make_http_request()
+        with request_context(http_request):
+            self.assertIs(request(), http_request)
+            with request_context(WSRequest("socket")) as ws_request:
+                self.assertIs(request(), ws_request)
+            self.assertIs(request(), http_request)
+
+        self.assertIsNone(request())
+
+    def test_concurrent_renders(self):
+        async def render_page(index: int):
+            with request_context(make_http_request()) as http_request:
+                chunks = [
+                    chunk
+                    async for chunk in render_stream(Counter(index=index), chunk_size=64)
+                ]
+                return http_request.id, "".join(chunks)
+
+        async def render_pages():
+            return await asyncio.gather(*[render_page(i) for i in range(200)])
+
+        pages = []
+        try:
+            pages = asyncio.run(render_pages())
+            self.assertEqual(len({claim_id for claim_id, _ in pages}), len(pages))
+            for claim_id, html in pages:
+                self.assertEqual(
+                    [action.id for action in DB.store.pop_unclaimed(claim_id)],
+                    ACTION_ID_PATTERN.findall(unescape(html)),
+                )
+        finally:
+            for claim_id, _ in pages:
+                DB.store.pop_unclaimed(claim_id)
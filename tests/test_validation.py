@@ -0,0 +1,50 @@
+from seamless import Component, Div
+from seamless.context.database import Action
+from seamless.internal import _DataValidationError, _VALIDATION_MODELS, validation_model
+
+import asyncio
+import unittest
+
+
+class Counter(Component, prewarm=True):
+    def __init__(self, count: int = 0):
+        self.count = count
+
+    def render(self):
+        return Div(self.count)
+
+    def increment(self, amount: int):
+        self.count += amount
+
+    @staticmethod
+    def reset(count: int):
+        return count
+
+
+class TestValidation(unittest.TestCase):
+    def test_model_per_function(self):
+        first, second = Counter(), Counter()
+        self.assertIs(validation_model(first.increment), validation_model(second.increment))
+
+        model, parameters = validation_model(first.increment)
+        self.assertEqual(parameters, ("amount",))
+
+    def test_plan_per_function(self):
+        first, second = Counter(), Counter()
+        self.assertIs(
+            Action(first.increment, "first")._plan, Action(second.increment, "second")._plan
+        )
+
+    def test_prewarm(self):
+        self.assertIn(True, _VALIDATION_MODELS[Counter.increment])
+        self.assertIn(False, _VALIDATION_MODELS[Counter.reset])
+        self.assertNotIn(Counter.render, _VALIDATION_MODELS)
+
+    def test_validation(self):
+        counter = Counter(count=1)
+        increment = Action(counter.increment, "increment")
+
+        asyncio.run(increment("2"))
+        self.assertEqual(counter.count, 3)
+        with self.assertRaises(_DataValidationError):
+            asyncio.run(increment("two"))
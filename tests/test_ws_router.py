@@ -0,0 +1,195 @@
+from seamless import Button, Component, Div
+from seamless.components import fetch_cache, invalidate_fetch_cache
+from seamless.context.database import DB
+from seamless.context.executor import coalesce, inline
+from seamless.context.request import WSRequest, request_context
+from seamless.context.ws_router import (
+    WireFormat,
+    broadcast_payloads,
+    events,
+    get_cached_component,
+    get_component,
+    negotiate_format,
+    release_format,
+    room_name,
+)
+from seamless.errors import ActionError, RenderError
+
+import asyncio
+import unittest
+
+
+class TestEventsRoute(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.addCleanup(DB.release_actions, "test-socket")
+
+    def add_event(self, callback):
+        with request_context(WSRequest("test-socket")):
+            return DB.add_event(callback).id
+
+    def test_events_in_order(self):
+        @inline
+        def click(event: dict):
+            self.log.append(("click", event["n"]))
+
+        @coalesce
+        async def move(event: dict):
+            self.log.append(("move", event["n"]))
+
+        click_id, move_id = self.add_event(click), self.add_event(move)
+        batch = [
+            [click_id, {"n": 1}],
+            [move_id, {"n": 2}],
+            [move_id, {"n": 3}],
+            [click_id, {"n": 4}],
+            [move_id, {"n": 5}],
+        ]
+        asyncio.run(events("test-socket", batch))
+        self.assertEqual(self.log, [("click", 1), ("click", 4), ("move", 5)])
+
+    def test_events_errors(self):
+        @inline
+        def fail(event: dict):
+            raise ValueError(event["n"])
+
+        @inline
+        def click(event: dict):
+            self.log.append(event["n"])
+
+        fail_id, click_id = self.add_event(fail), self.add_event(click)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(events("test-socket", [[fail_id, {"n": 1}], [click_id, {"n": 2}]]))
+        self.assertEqual(self.log, [2])
+
+        with self.assertRaises(ActionError):
+            asyncio.run(events("test-socket", [[click_id]]))
+
+
+class Greeting(Component):
+    def render(self):
+        return Div("Hello", class_name="greeting")
+
+
+class TestWireFormat(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(release_format, "test-socket")
+
+    def test_default_format(self):
+        self.assertEqual(negotiate_format("test-socket", None), WireFormat.JSON)
+        self.assertEqual(negotiate_format("test-socket", {"format": "xml"}), WireFormat.JSON)
+        self.assertEqual(
+            get_component("test-socket", "Greeting"),
+            {"type": "div", "children": ["Hello"], "props": {"class": "greeting"}},
+        )
+
+    def test_compact_format(self):
+        negotiate_format("test-socket", {"format": "compact"})
+        self.assertEqual(
+            get_component("test-socket", "Greeting"),
+            [["div", "class"], [0, [1, "greeting"], "Hello"]],
+        )
+
+        release_format("test-socket")
+        self.assertEqual(get_component("test-socket", "Greeting")["type"], "div")
+
+
+@fetch_cache(ttl=60)
+class Profile(Component):
+    renders = 0
+
+    def __init__(self, name: str, editable: bool = False):
+        self.name = name
+        self.editable = editable
+
+    def render(self):
+        Profile.renders += 1
+        if self.editable:
+            return Div(self.name, Button("Edit", on_click=self.edit))
+        return Div(self.name)
+
+    def edit(self, event: dict): ...
+
+
+class TestFetchCache(unittest.TestCase):
+    def setUp(self):
+        Profile.renders = 0
+        invalidate_fetch_cache(Profile)
+        self.addCleanup(DB.release_actions, "test-socket")
+
+    def fetch(self, props, etag=None):
+        with request_context(WSRequest("test-socket")):
+            return get_cached_component("test-socket", "Profile", props, etag)
+
+    def test_cached_component(self):
+        first = self.fetch({"name": "a", "editable": False})
+        self.assertEqual(first["component"], {"type": "div", "children": ["a"], "props": {}})
+        self.assertEqual(first["max_age"], 60)
+
+        # Props are cached regardless of their order.
+        self.assertEqual(self.fetch({"editable": False, "name": "a"}), first)
+        self.assertEqual(Profile.renders, 1)
+
+        self.assertEqual(
+            self.fetch({"name": "a", "editable": False}, first["etag"]),
+            {"etag": first["etag"], "max_age": 60},
+        )
+        self.assertNotEqual(self.fetch({"name": "b"})["etag"], first["etag"])
+        self.assertEqual(Profile.renders, 2)
+
+    def test_invalidate(self):
+        etag = self.fetch({"name": "a"})["etag"]
+        self.fetch({"name": "b"})
+
+        invalidate_fetch_cache(Profile, name="a")
+        # Rendered again, to the same payload the client already has.
+        self.assertNotIn("component", self.fetch({"name": "a"}, etag))
+        self.fetch({"name": "b"})
+        self.assertEqual(Profile.renders, 3)
+
+        invalidate_fetch_cache(Profile)
+        self.fetch({"name": "b"})
+        self.assertEqual(Profile.renders, 4)
+
+    def test_component_with_actions(self):
+        first = self.fetch({"name": "a", "editable": True})
+        second = self.fetch({"name": "a", "editable": True})
+        self.assertIsNone(second["etag"])
+        self.assertIn("component", second)
+        self.assertEqual(Profile.renders, 2)
+        self.assertIsNone(first["max_age"])
+
+
+class TestBroadcast(unittest.TestCase):
+    def setUp(self):
+        negotiate_format("compact-socket", {"format": "compact"})
+        self.addCleanup(release_format, "compact-socket")
+
+    def test_room_name(self):
+        self.assertEqual(room_name("status", "json-socket"), "seamless:status:json")
+        self.assertEqual(room_name("status", "compact-socket"), "seamless:status:compact")
+
+    def test_payloads(self):
+        rendered = []
+
+        class Status(Component):
+            def render(self):
+                rendered.append(self)
+                return Div("OK", class_name="status")
+
+        members = {room_name("status", "json-socket"), room_name("status", "compact-socket")}
+        self.assertEqual(
+            broadcast_payloads("status", Status(), members.__contains__),
+            [
+                ("seamless:status:json", {"type": "div", "children": ["OK"], "props": {"class": "status"}}),
+                ("seamless:status:compact", [["div", "class"], [0, [1, "status"], "OK"]]),
+            ],
+        )
+        self.assertEqual(len(rendered), 1)
+
+        self.assertEqual(broadcast_payloads("status", Status(), lambda name: False), [])
+
+    def test_actions(self):
+        with self.assertRaises(RenderError):
+            broadcast_payloads("status", Button(on_click=lambda: None), lambda name: True)